@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Sport X Auction Analytics
+Loads NDJSON auction exports (GET /api/rooms/export.ndjson, or
+`npm run simulate -- --export sim.ndjson`) into columnar numpy arrays and
+reports price inflation over base price, per-role spend, team value and
+bidding-war length across every room in the export
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import orjson  # optional, roughly halves load time on large exports
+    loads = orjson.loads
+except ImportError:
+    orjson = None
+    loads = json.loads
+
+READ_CHUNK = 8 * 1024 * 1024
+
+
+class Codes:
+    """Assigns dense integer codes to keys in order of first appearance"""
+
+    def __init__(self):
+        self.index = {}
+
+    def encode(self, values):
+        index = self.index
+        # Only distinct values go through Python; the per-row lookup is a C-level map
+        for value in dict.fromkeys(values):
+            if value not in index:
+                index[value] = len(index)
+        return list(map(index.__getitem__, values))
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    @property
+    def values(self):
+        """Keys indexed by code"""
+        return list(self.index)
+
+
+class AuctionColumns:
+    """Lots and bids of an export as parallel numpy arrays"""
+
+    def __init__(self):
+        # Rooms, players and teams share codes between lots and bids so the two can be joined
+        self.rooms = Codes()
+        self.players = Codes()
+        self.teams = Codes()  # team ids are only unique within a room; pair them with room codes
+        self.roles = Codes()
+        self.budgets = {}  # roomId -> budget
+        self._lots = {key: [] for key in ('room', 'player', 'role', 'base', 'rating', 'team', 'price', 'sold', 'bids')}
+        self._bids = {key: [] for key in ('room', 'player', 'team', 'amount')}
+        self.lines = 0
+
+    def add_records(self, records, include_bids=True):
+        """Append decoded records column by column, coding ids as they arrive"""
+        lots = [r for r in records if r['type'] == 'lot']
+        if lots:
+            columns = self._lots
+            sold = [r['status'] == 'sold' for r in lots]
+            columns['room'] += self.rooms.encode([r['roomId'] for r in lots])
+            columns['player'] += self.players.encode([r['playerId'] for r in lots])
+            columns['role'] += self.roles.encode([r.get('role') or 'Unknown' for r in lots])
+            columns['base'] += [r.get('basePrice') or 0 for r in lots]
+            columns['rating'] += [r.get('rating') or 0 for r in lots]
+            # Unsold lots share a placeholder team code; they are masked out wherever teams matter
+            columns['team'] += self.teams.encode([r['teamId'] if ok else None for r, ok in zip(lots, sold)])
+            columns['price'] += [r['price'] if ok else 0 for r, ok in zip(lots, sold)]
+            columns['sold'] += sold
+            columns['bids'] += [r.get('bids') or 0 for r in lots]
+
+        if include_bids:
+            bids = [r for r in records if r['type'] == 'bid']
+            if bids:
+                columns = self._bids
+                columns['room'] += self.rooms.encode([r['roomId'] for r in bids])
+                columns['player'] += self.players.encode([r['playerId'] for r in bids])
+                columns['team'] += self.teams.encode([r['teamId'] for r in bids])
+                columns['amount'] += [r['amount'] for r in bids]
+
+        for record in records:
+            if record.get('type') == 'room':
+                self.budgets[record['roomId']] = record.get('budget') or 0
+
+    def load(self, chunks, include_bids=True):
+        """Decode NDJSON chunks a batch of lines at a time (one json.loads per batch)"""
+        pending = ""
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode("utf-8")
+            pending += chunk
+            cut = pending.rfind("\n")
+            if cut < 0:
+                continue
+            self._decode(pending[:cut], include_bids)
+            pending = pending[cut + 1:]
+        if pending.strip():
+            self._decode(pending, include_bids)
+
+    def _decode(self, text, include_bids):
+        lines = [line for line in text.split("\n") if line.strip()]
+        if not include_bids:
+            # Bid lines dominate exports; drop them before decoding when they are not needed
+            lines = [line for line in lines if '"type":"bid"' not in line[:24]]
+        self.lines += len(lines)
+        self.add_records(loads("[" + ",".join(lines) + "]"), include_bids)
+
+    def finish(self):
+        """Freeze the collected lists into arrays"""
+        lots, bids = self._lots, self._bids
+        self.lots = {
+            'room': np.asarray(lots['room'], dtype=np.int64),
+            'player': np.asarray(lots['player'], dtype=np.int64),
+            'team': np.asarray(lots['team'], dtype=np.int64),
+            'role': np.asarray(lots['role'], dtype=np.int64),
+            'base': np.asarray(lots['base'], dtype=np.float64),
+            'rating': np.asarray(lots['rating'], dtype=np.float64),
+            'price': np.asarray(lots['price'], dtype=np.float64),
+            'sold': np.asarray(lots['sold'], dtype=bool),
+            'bids': np.asarray(lots['bids'], dtype=np.int32)
+        }
+        self.bids = {key: np.asarray(bids[key], dtype=np.int64) for key in ('room', 'player', 'team')}
+        self.bids['amount'] = np.asarray(bids['amount'], dtype=np.float64)
+        self.budget = np.array([self.budgets.get(room, 0) for room in self.rooms], dtype=np.float64)
+        self._lots = self._bids = None
+        return self
+
+
+def quantiles(values, qs=(0.1, 0.5, 0.9)):
+    if values.size == 0:
+        return {f"p{int(q * 100)}": None for q in qs}
+    return {f"p{int(q * 100)}": round(float(v), 3) for q, v in zip(qs, np.quantile(values, qs))}
+
+
+def group_keys(major, minor):
+    """Dense group index for rows sharing (major, minor) codes, and the (major, minor) of each group"""
+    width = int(minor.max()) + 1 if minor.size else 1
+    unique, inverse = np.unique(major * width + minor, return_inverse=True)
+    return np.stack([unique // width, unique % width], axis=1), inverse.reshape(-1)
+
+
+class AuctionAnalytics:
+    def __init__(self, columns):
+        self.c = columns
+        self.lots = columns.lots
+        self.sold = self.lots['sold'] & (self.lots['base'] > 0)
+
+    def price_inflation(self):
+        price, base = self.lots['price'][self.sold], self.lots['base'][self.sold]
+        ratio = price / base
+        roles = self.lots['role'][self.sold]
+        n_roles = len(self.c.roles)
+        role_price = np.bincount(roles, weights=price, minlength=n_roles)
+        role_base = np.bincount(roles, weights=base, minlength=n_roles)
+        by_role = {}
+        for code, role in enumerate(self.c.roles):
+            mask = roles == code
+            if mask.any():
+                by_role[role] = {"weighted": round(float(role_price[code] / role_base[code]), 3), **quantiles(ratio[mask])}
+        return {
+            "lots": int(self.lots['sold'].size),
+            "sold": int(self.lots['sold'].sum()),
+            "mean": round(float(ratio.mean()), 3) if ratio.size else None,
+            "weighted": round(float(price.sum() / base.sum()), 3) if base.size else None,
+            **quantiles(ratio),
+            "byRole": by_role
+        }
+
+    def role_spend(self):
+        sold = self.lots['sold']
+        roles, price = self.lots['role'][sold], self.lots['price'][sold]
+        n_roles = len(self.c.roles)
+        spend = np.bincount(roles, weights=price, minlength=n_roles)
+        count = np.bincount(roles, minlength=n_roles)
+        total = spend.sum() or 1
+        return {
+            role: {
+                "spend": float(spend[code]),
+                "share": round(float(spend[code] / total), 3),
+                "players": int(count[code]),
+                "averagePrice": round(float(spend[code] / count[code])) if count[code] else None
+            }
+            for code, role in enumerate(self.c.roles) if count[code]
+        }
+
+    def team_value(self):
+        sold = self.lots['sold']
+        if not sold.any():
+            return {"teams": 0}
+        room, team = self.lots['room'][sold], self.lots['team'][sold]
+        unique, group = group_keys(room, team)
+        spend = np.bincount(group, weights=self.lots['price'][sold])
+        base = np.bincount(group, weights=self.lots['base'][sold])
+        rating = np.bincount(group, weights=self.lots['rating'][sold])
+        squad = np.bincount(group)
+        budget = self.c.budget[unique[:, 0]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value_for_money = np.where(spend > 0, base / spend, np.nan)
+            utilisation = np.where(budget > 0, spend / budget, np.nan)
+
+        best = np.argsort(-np.nan_to_num(value_for_money), kind='stable')[:5]
+        room_ids, team_ids = self.c.rooms.values, self.c.teams.values
+        return {
+            "teams": int(unique.shape[0]),
+            "squadSize": quantiles(squad.astype(np.float64)),
+            "spend": quantiles(spend),
+            "ratingPerSquad": quantiles(rating),
+            "baseValuePerSpend": quantiles(value_for_money[~np.isnan(value_for_money)]),
+            "budgetUsed": quantiles(utilisation[~np.isnan(utilisation)]),
+            "bestValue": [
+                {
+                    "roomId": room_ids[unique[i, 0]],
+                    "teamId": team_ids[unique[i, 1]],
+                    "players": int(squad[i]),
+                    "spend": float(spend[i]),
+                    "baseValuePerSpend": round(float(value_for_money[i]), 3)
+                }
+                for i in best
+            ]
+        }
+
+    def bidding_wars(self):
+        sold = self.lots['sold']
+        bids = self.lots['bids'][sold].astype(np.float64)
+        result = {
+            "bidsPerSoldLot": {"mean": round(float(bids.mean()), 2) if bids.size else None, **quantiles(bids),
+                               "max": int(bids.max()) if bids.size else None},
+            "unsoldLots": int((~sold).sum())
+        }
+        if bids.size > 1 and self.sold.any():
+            ratio = self.lots['price'][self.sold] / self.lots['base'][self.sold]
+            result["inflationCorrelation"] = round(float(np.corrcoef(self.lots['bids'][self.sold], ratio)[0, 1]), 3)
+
+        n_roles = len(self.c.roles)
+        roles = self.lots['role'][sold]
+        war_bids = np.bincount(roles, weights=bids, minlength=n_roles)
+        war_lots = np.bincount(roles, minlength=n_roles)
+        result["meanBidsByRole"] = {
+            role: round(float(war_bids[code] / war_lots[code]), 2)
+            for code, role in enumerate(self.c.roles) if war_lots[code]
+        }
+
+        # With bid lines, count how many teams fought over each lot
+        bid_cols = self.c.bids
+        if bid_cols['room'].size:
+            _, lot_group = group_keys(bid_cols['room'], bid_cols['player'])
+            _, bidder_group = group_keys(lot_group, bid_cols['team'])
+            first = np.unique(bidder_group, return_index=True)[1]
+            bidders = np.bincount(lot_group[first]).astype(np.float64)
+            result["biddersPerLot"] = {"mean": round(float(bidders.mean()), 2), **quantiles(bidders)}
+        return result
+
+    def report(self):
+        return {
+            "rooms": len(self.c.rooms),
+            "priceInflation": self.price_inflation(),
+            "roleSpend": self.role_spend(),
+            "teamValue": self.team_value(),
+            "biddingWars": self.bidding_wars()
+        }
+
+
+def iter_file_chunks(path):
+    handle = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        while True:
+            chunk = handle.read(READ_CHUNK)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        if handle is not sys.stdin.buffer:
+            handle.close()
+
+
+def iter_url_chunks(url):
+    import requests  # only needed when reading straight from a server
+    response = requests.get(url, stream=True, timeout=60)
+    response.raise_for_status()
+    yield from response.iter_content(chunk_size=READ_CHUNK)
+
+
+def print_report(report, load_seconds, analyse_seconds, lines):
+    inflation = report['priceInflation']
+    print(f"📦 {lines:,} lines, {report['rooms']:,} rooms, {inflation['lots']:,} lots "
+          f"(loaded in {load_seconds:.2f}s, analysed in {analyse_seconds:.2f}s)")
+
+    print("\n💹 Price / base price")
+    print(f"   all: weighted {inflation['weighted']}, mean {inflation['mean']}, "
+          f"p10 {inflation['p10']}, median {inflation['p50']}, p90 {inflation['p90']}")
+    for role, stats in inflation['byRole'].items():
+        print(f"   {role}: weighted {stats['weighted']}, median {stats['p50']}, p90 {stats['p90']}")
+
+    print("\n💰 Spend by role")
+    for role, stats in report['roleSpend'].items():
+        print(f"   {role}: {stats['share'] * 100:.1f}% of spend, {stats['players']:,} players, "
+              f"avg £{stats['averagePrice']:,}")
+
+    teams = report['teamValue']
+    if teams['teams']:
+        print(f"\n🏏 Team value ({teams['teams']:,} teams)")
+        print(f"   base value per £ spent: p10 {teams['baseValuePerSpend']['p10']}, "
+              f"median {teams['baseValuePerSpend']['p50']}, p90 {teams['baseValuePerSpend']['p90']}")
+        print(f"   budget used: median {teams['budgetUsed']['p50']}, squad size median {teams['squadSize']['p50']}")
+
+    wars = report['biddingWars']
+    print("\n⚔️  Bidding wars")
+    print(f"   bids per sold lot: mean {wars['bidsPerSoldLot']['mean']}, median {wars['bidsPerSoldLot']['p50']}, "
+          f"p90 {wars['bidsPerSoldLot']['p90']}, max {wars['bidsPerSoldLot']['max']}; {wars['unsoldLots']:,} unsold")
+    if 'inflationCorrelation' in wars:
+        print(f"   correlation of war length with inflation: {wars['inflationCorrelation']}")
+    if 'biddersPerLot' in wars:
+        print(f"   teams bidding per lot: mean {wars['biddersPerLot']['mean']}, p90 {wars['biddersPerLot']['p90']}")
+
+
+def main():
+    """Load exports and print the pricing report"""
+    parser = argparse.ArgumentParser(description="Pricing analytics over Sport X auction NDJSON exports")
+    parser.add_argument("exports", nargs="*", help="NDJSON export files ('-' for stdin)")
+    parser.add_argument("--url", action="append", default=[],
+                        help="stream an export from a server, e.g. http://localhost:5000/api/rooms/export.ndjson")
+    parser.add_argument("--skip-bids", action="store_true", help="ignore bid lines (faster; drops bidders per lot)")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    if not args.exports and not args.url:
+        parser.error("give at least one export file or --url")
+
+    print(f"📊 Sport X Auction Analytics - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    started = time.perf_counter()
+    columns = AuctionColumns()
+    for path in args.exports:
+        columns.load(iter_file_chunks(path), include_bids=not args.skip_bids)
+    for url in args.url:
+        columns.load(iter_url_chunks(url), include_bids=not args.skip_bids)
+    columns.finish()
+    loaded = time.perf_counter()
+
+    if columns.lots['sold'].size == 0:
+        print("❌ No lots found in the export")
+        return 1
+
+    report = AuctionAnalytics(columns).report()
+    print_report(report, loaded - started, time.perf_counter() - loaded, columns.lines)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,9 @@ import sys
 import time
 from datetime import datetime
 
+from stream_validation import (LEADERBOARD_VALIDATOR, PLAYER_VALIDATOR, TOURNAMENT_PLAYER_VALIDATOR,
+                               validate_response)
+
 class SportXAPITester:
     def __init__(self, base_url="https://player-auction-1.preview.emergentagent.com"):
         self.base_url = base_url
@@ -45,23 +48,19 @@ class SportXAPITester:
     def test_players_endpoint(self):
         """Test /api/players endpoint"""
         try:
-            response = self.session.get(f"{self.base_url}/api/players")
+            response = self.session.get(f"{self.base_url}/api/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                players = response.json()
-                player_count = len(players)
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player 
-                    for player in players[:5]  # Check first 5 players
-                )
-                success = player_count >= 50 and has_required_fields
-                details = f"Found {player_count} players, Required fields present: {has_required_fields}"
+                # Every player is validated as it streams in; only a small sample is kept
+                report = validate_response(response, PLAYER_VALIDATOR)
+                success = report.records >= 50 and report.ok
+                details = f"Validated {report.summary()}"
             else:
                 details = f"HTTP {response.status_code}"
                 
             self.log_test("Players API Endpoint", success, details)
-            return success, players if success else []
+            return success, report.sample if success else []
             
         except Exception as e:
             self.log_test("Players API Endpoint", False, str(e))
@@ -96,7 +95,7 @@ class SportXAPITester:
                                        json=payload, timeout=30)
             
             # Note: This might fail if GEMINI_API_KEY is not set
-            if response.status_code == 500:
+            if response.status_code in (500, 503):
                 details = "AI service unavailable (likely missing API key)"
                 success = True  # We consider this a pass since the endpoint exists
             else:
@@ -133,7 +132,7 @@ class SportXAPITester:
                                        json=payload, timeout=30)
             
             # Similar to prediction, might fail without API key
-            if response.status_code == 500:
+            if response.status_code in (500, 503):
                 details = "AI service unavailable (likely missing API key)"
                 success = True  # Endpoint exists
             else:
@@ -211,9 +210,11 @@ class SportXAPITester:
             success = response.status_code == 200
             
             if success:
-                tournaments = response.json()
+                page = response.json()
+                tournaments = page.get('tournaments', [])
                 is_array = isinstance(tournaments, list)
-                details = f"Returned {len(tournaments)} tournaments, Is array: {is_array}"
+                success = is_array and 'nextCursor' in page
+                details = f"Returned {len(tournaments)} tournaments, Is array: {is_array}, Next cursor: {page.get('nextCursor')}"
             else:
                 details = f"HTTP {response.status_code}"
                 
@@ -304,7 +305,7 @@ class SportXAPITester:
             if success:
                 tournament = response.json()
                 has_required_fields = all(
-                    field in tournament for field in ['id', 'settings', 'status', 'participants']
+                    field in tournament for field in ['id', 'settings', 'status', 'participantCount']
                 )
                 details = f"Tournament details retrieved, Required fields: {has_required_fields}"
             else:
@@ -317,6 +318,31 @@ class SportXAPITester:
             self.log_test("Get Tournament Details", False, str(e))
             return False
 
+    def test_tournament_participants(self, tournament_id):
+        """Test paginated tournament participants endpoint"""
+        if not tournament_id:
+            self.log_test("Tournament Participants", False, "No tournament ID provided")
+            return False
+            
+        try:
+            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/participants", params={"limit": 10})
+            success = response.status_code == 200
+            
+            if success:
+                page = response.json()
+                has_page_fields = all(field in page for field in ['participants', 'total', 'nextCursor'])
+                success = has_page_fields and isinstance(page.get('participants'), list)
+                details = f"Participants page retrieved, Page fields: {has_page_fields}, Total: {page.get('total')}"
+            else:
+                details = f"HTTP {response.status_code}"
+                
+            self.log_test("Tournament Participants", success, details)
+            return success
+            
+        except Exception as e:
+            self.log_test("Tournament Participants", False, str(e))
+            return False
+
     def test_tournament_leaderboard(self, tournament_id):
         """Test tournament leaderboard endpoint"""
         if not tournament_id:
@@ -324,13 +350,14 @@ class SportXAPITester:
             return False
             
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/leaderboard")
+            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/leaderboard", stream=True)
             success = response.status_code == 200
             
             if success:
-                leaderboard = response.json()
-                is_array = isinstance(leaderboard, list)
-                details = f"Leaderboard retrieved, Is array: {is_array}, Entries: {len(leaderboard)}"
+                report = validate_response(response, LEADERBOARD_VALIDATOR)
+                is_array = report.error is None
+                success = report.ok
+                details = f"Leaderboard retrieved, Is array: {is_array}, Validated {report.summary()}"
             else:
                 details = f"HTTP {response.status_code}"
                 
@@ -504,7 +531,7 @@ class SportXAPITester:
             if success:
                 tournament = response.json()
                 has_required_fields = all(
-                    field in tournament for field in ['id', 'settings', 'status', 'participants']
+                    field in tournament for field in ['id', 'settings', 'status', 'participantCount']
                 )
                 has_kabaddi_sport = tournament.get('sport') == 'kabaddi'
                 has_kabaddi_rules = 'squadRules' in tournament.get('settings', {}) and \
@@ -581,28 +608,25 @@ class SportXAPITester:
     def test_tournament_specific_players_ipl_2024(self):
         """Test /api/tournaments/ipl-2024/players endpoint"""
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/ipl-2024/players")
+            response = self.session.get(f"{self.base_url}/api/tournaments/ipl-2024/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                data = response.json()
+                report = validate_response(response, TOURNAMENT_PLAYER_VALIDATOR, array_key='players')
+                data = {**report.envelope, 'players': report.sample}
                 has_tournament_info = 'tournament' in data and data['tournament'] == 'ipl-2024'
                 has_total_players = 'totalPlayers' in data
-                has_players_array = 'players' in data and isinstance(data['players'], list)
+                has_players_array = report.error is None and report.records > 0
                 has_message = 'message' in data
                 
                 player_count = data.get('totalPlayers', 0)
                 # Adjusted expectation based on actual data (50 total players, IPL gets most of them)
                 expected_count_range = player_count >= 40 and player_count <= 60
                 
-                # Check if players have required fields
-                players = data.get('players', [])
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player and 'country' in player
-                    for player in players[:5]  # Check first 5 players
-                ) if players else False
+                # Every streamed player must pass validation and match the advertised total
+                has_required_fields = report.ok and report.records == player_count
                 
-                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 40-60, Required fields: {has_required_fields}"
+                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 40-60, Required fields: {has_required_fields}, Validated {report.summary()}"
                 success = has_tournament_info and has_total_players and has_players_array and has_message and expected_count_range and has_required_fields
             else:
                 details = f"HTTP {response.status_code}"
@@ -617,28 +641,25 @@ class SportXAPITester:
     def test_tournament_specific_players_world_cup_2024(self):
         """Test /api/tournaments/world-cup-2024/players endpoint"""
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/world-cup-2024/players")
+            response = self.session.get(f"{self.base_url}/api/tournaments/world-cup-2024/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                data = response.json()
+                report = validate_response(response, TOURNAMENT_PLAYER_VALIDATOR, array_key='players')
+                data = {**report.envelope, 'players': report.sample}
                 has_tournament_info = 'tournament' in data and data['tournament'] == 'world-cup-2024'
                 has_total_players = 'totalPlayers' in data
-                has_players_array = 'players' in data and isinstance(data['players'], list)
+                has_players_array = report.error is None and report.records > 0
                 has_message = 'message' in data
                 
                 player_count = data.get('totalPlayers', 0)
                 # Adjusted expectation - World Cup gets fewer players from the 50 available
                 expected_count_range = player_count >= 15 and player_count <= 35
                 
-                # Check if players have required fields
-                players = data.get('players', [])
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player and 'country' in player
-                    for player in players[:5]  # Check first 5 players
-                ) if players else False
+                # Every streamed player must pass validation and match the advertised total
+                has_required_fields = report.ok and report.records == player_count
                 
-                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 15-35, Required fields: {has_required_fields}"
+                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 15-35, Required fields: {has_required_fields}, Validated {report.summary()}"
                 success = has_tournament_info and has_total_players and has_players_array and has_message and expected_count_range and has_required_fields
             else:
                 details = f"HTTP {response.status_code}"
@@ -653,28 +674,25 @@ class SportXAPITester:
     def test_tournament_specific_players_the_hundred_2024(self):
         """Test /api/tournaments/the-hundred-2024/players endpoint"""
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/the-hundred-2024/players")
+            response = self.session.get(f"{self.base_url}/api/tournaments/the-hundred-2024/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                data = response.json()
+                report = validate_response(response, TOURNAMENT_PLAYER_VALIDATOR, array_key='players')
+                data = {**report.envelope, 'players': report.sample}
                 has_tournament_info = 'tournament' in data and data['tournament'] == 'the-hundred-2024'
                 has_total_players = 'totalPlayers' in data
-                has_players_array = 'players' in data and isinstance(data['players'], list)
+                has_players_array = report.error is None and report.records > 0
                 has_message = 'message' in data
                 
                 player_count = data.get('totalPlayers', 0)
                 # Adjusted expectation - The Hundred gets moderate number of players
                 expected_count_range = player_count >= 30 and player_count <= 50
                 
-                # Check if players have required fields
-                players = data.get('players', [])
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player and 'country' in player
-                    for player in players[:5]  # Check first 5 players
-                ) if players else False
+                # Every streamed player must pass validation and match the advertised total
+                has_required_fields = report.ok and report.records == player_count
                 
-                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 30-50, Required fields: {has_required_fields}"
+                details = f"Tournament: {data.get('tournament')}, Players: {player_count}, Expected range: 30-50, Required fields: {has_required_fields}, Validated {report.summary()}"
                 success = has_tournament_info and has_total_players and has_players_array and has_message and expected_count_range and has_required_fields
             else:
                 details = f"HTTP {response.status_code}"
@@ -689,32 +707,30 @@ class SportXAPITester:
     def test_tournament_specific_players_invalid_tournament(self):
         """Test /api/tournaments/invalid-tournament/players endpoint - should fallback to all players"""
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/invalid-tournament/players")
+            response = self.session.get(f"{self.base_url}/api/tournaments/invalid-tournament/players", stream=True)
             success = response.status_code == 200
             
             if success:
                 # For invalid tournament, it should return all players (fallback behavior)
-                data = response.json()
+                report = validate_response(response, PLAYER_VALIDATOR, array_key='players')
                 
                 # Check if it's the fallback response (all players)
-                is_fallback = isinstance(data, list)  # All players endpoint returns array directly
+                is_fallback = 'tournament' not in report.envelope  # All players endpoint returns array directly
                 
                 if is_fallback:
-                    player_count = len(data)
+                    data = report.sample
+                    player_count = report.records
                     expected_fallback_count = player_count >= 50  # Should be all players (50 total)
                     
-                    # Check if players have required fields
-                    has_required_fields = all(
-                        'id' in player and 'name' in player and 'role' in player
-                        for player in data[:5]  # Check first 5 players
-                    ) if data else False
+                    # Every streamed player must pass validation
+                    has_required_fields = report.ok and player_count > 0
                     
-                    details = f"Fallback to all players: {is_fallback}, Total players: {player_count}, Expected 50: {expected_fallback_count}, Required fields: {has_required_fields}"
+                    details = f"Fallback to all players: {is_fallback}, Total players: {player_count}, Expected 50: {expected_fallback_count}, Required fields: {has_required_fields}, Validated {report.summary()}"
                     success = is_fallback and expected_fallback_count and has_required_fields
                 else:
                     # If it returns tournament-specific format, check that
-                    has_tournament_info = 'tournament' in data
-                    player_count = data.get('totalPlayers', len(data.get('players', [])))
+                    data = {**report.envelope, 'players': report.sample}
+                    player_count = data.get('totalPlayers', report.records)
                     details = f"Tournament format returned, Players: {player_count}"
                     success = True  # Any valid response is acceptable for invalid tournament
             else:
@@ -770,22 +786,19 @@ class SportXAPITester:
     def test_original_players_endpoint_unchanged(self):
         """Test that original /api/players endpoint still works unchanged"""
         try:
-            response = self.session.get(f"{self.base_url}/api/players")
+            response = self.session.get(f"{self.base_url}/api/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                players = response.json()
-                is_array = isinstance(players, list)
-                player_count = len(players) if is_array else 0
+                report = validate_response(response, PLAYER_VALIDATOR)
+                is_array = report.error is None
+                player_count = report.records
                 expected_count = player_count >= 50  # Should have all 50 players
                 
-                # Check if players have required fields
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player
-                    for player in players[:5]  # Check first 5 players
-                ) if players else False
+                # Every streamed player must pass validation
+                has_required_fields = report.ok and player_count > 0
                 
-                details = f"Is array: {is_array}, Total players: {player_count}, Expected 50: {expected_count}, Required fields: {has_required_fields}"
+                details = f"Is array: {is_array}, Total players: {player_count}, Expected 50: {expected_count}, Required fields: {has_required_fields}, Validated {report.summary()}"
                 success = is_array and expected_count and has_required_fields
             else:
                 details = f"HTTP {response.status_code}"
@@ -895,6 +908,7 @@ class SportXAPITester:
         tournament_created, tournament_id = self.test_create_tournament()
         if tournament_created and tournament_id:
             self.test_get_tournament_details(tournament_id)
+            self.test_tournament_participants(tournament_id)
             self.test_tournament_leaderboard(tournament_id)
             self.test_tournament_chat(tournament_id)
         
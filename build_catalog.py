@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Sport X Player Catalog Builder
+Streams player stats exports (CSV, JSON arrays, NDJSON), validates and
+deduplicates them, and writes the compact catalog, tournament pools and
+secondary indexes the server loads from data/catalog/
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_SOURCES = [os.path.join(DATA_DIR, "players.json"), os.path.join(DATA_DIR, "sources")]
+DEFAULT_OUTPUT = os.path.join(DATA_DIR, "catalog")
+
+# Same rules as SportXAPITester.validate_player_data_structure
+REQUIRED_FIELDS = ['id', 'name', 'age', 'country', 'role', 'basePrice', 'rating']
+INT_FIELDS = ['id', 'age', 'rating', 'basePrice']
+VALID_ROLES = ['Batsman', 'Bowler', 'All-rounder', 'Wicket-Keeper']
+
+# Spellings seen in stats exports
+ROLE_ALIASES = {
+    'batsman': 'Batsman', 'batter': 'Batsman', 'bat': 'Batsman',
+    'bowler': 'Bowler', 'bowl': 'Bowler',
+    'all-rounder': 'All-rounder', 'allrounder': 'All-rounder', 'all rounder': 'All-rounder', 'ar': 'All-rounder',
+    'wicket-keeper': 'Wicket-Keeper', 'wicketkeeper': 'Wicket-Keeper', 'wicket keeper': 'Wicket-Keeper',
+    'wk': 'Wicket-Keeper', 'keeper': 'Wicket-Keeper'
+}
+
+CATALOG_FIELDS = ['id', 'name', 'age', 'country', 'role', 'basePrice', 'rating',
+                  'battingAverage', 'bowlingAverage', 'experience']
+
+# Tournament pools: home countries are always in, overseas players need the minimum rating.
+# The server's curated pools win for tournaments it lists; these fill in the rest.
+POOL_RULES = {
+    'ipl-2024': {'home': ['India'], 'overseasMinRating': 85},
+    'world-cup-2024': {'home': None, 'overseasMinRating': 80},
+    'the-hundred-2024': {'home': ['England'], 'overseasMinRating': 88},
+    'cpl-2024': {'home': ['West Indies'], 'overseasMinRating': 88},
+    'bbl-2024': {'home': ['Australia'], 'overseasMinRating': 88},
+    'psl-2024': {'home': ['Pakistan'], 'overseasMinRating': 88},
+    'eng-vs-ind-2024': {'home': ['England', 'India'], 'overseasMinRating': None},
+    'aus-vs-sa-2024': {'home': ['Australia', 'South Africa'], 'overseasMinRating': None}
+}
+
+READ_CHUNK = 64 * 1024
+
+
+def iter_json_array(path):
+    """Yield objects from a top-level JSON array without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as handle:
+        buffer = ""
+        started = False
+        eof = False
+        while True:
+            if not eof:
+                chunk = handle.read(READ_CHUNK)
+                eof = chunk == ""
+                buffer += chunk
+
+            position = 0
+            while True:
+                # Skip whitespace, separators and the opening/closing brackets
+                while position < len(buffer) and buffer[position] in " \t\r\n,[]":
+                    if buffer[position] == "[":
+                        started = True
+                    position += 1
+                if position >= len(buffer):
+                    break
+                if not started:
+                    raise ValueError(f"{path}: expected a JSON array")
+                try:
+                    record, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break  # object continues in the next chunk
+                yield record
+                position = end
+
+            buffer = buffer[position:]
+            if eof:
+                return
+
+
+def iter_ndjson(path):
+    """Yield one object per non-empty line"""
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def iter_csv(path):
+    """Yield CSV rows as dicts"""
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        yield from csv.DictReader(handle)
+
+
+def iter_source(path):
+    """Pick a streaming reader by file extension"""
+    if path.endswith(".csv"):
+        return iter_csv(path)
+    if path.endswith(".ndjson") or path.endswith(".jsonl"):
+        return iter_ndjson(path)
+    if path.endswith(".json"):
+        return iter_json_array(path)
+    raise ValueError(f"Unsupported source format: {path}")
+
+
+def to_int(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        number = float(str(value).replace(",", "").strip())
+    except ValueError:
+        return value  # left as-is so validation reports the bad type
+    return int(number) if number.is_integer() else value
+
+
+def to_float(value):
+    if value is None or value == "" or str(value).strip().lower() in ("null", "none", "-", "n/a"):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_player(raw):
+    """Map a raw export row onto catalog field names and types"""
+    role = raw.get('role')
+    if isinstance(role, str):
+        role = ROLE_ALIASES.get(role.strip().lower(), role.strip())
+
+    player = {
+        'id': to_int(raw.get('id')),
+        'name': raw.get('name').strip() if isinstance(raw.get('name'), str) else raw.get('name'),
+        'age': to_int(raw.get('age')),
+        'country': raw.get('country').strip() if isinstance(raw.get('country'), str) else raw.get('country'),
+        'role': role,
+        'basePrice': to_int(raw.get('basePrice')),
+        'rating': to_int(raw.get('rating')),
+        'battingAverage': to_float(raw.get('battingAverage')),
+        'bowlingAverage': to_float(raw.get('bowlingAverage')),
+        'experience': to_int(raw.get('experience'))
+    }
+    return player
+
+
+def validate_player(player):
+    """Return a list of rule violations (empty when the record is valid)"""
+    errors = [f"missing {field}" for field in REQUIRED_FIELDS if player.get(field) in (None, "")]
+    errors += [
+        f"{field} must be an integer"
+        for field in INT_FIELDS
+        if player.get(field) is not None and not isinstance(player.get(field), int)
+    ]
+    if player.get('name') is not None and not isinstance(player.get('name'), str):
+        errors.append("name must be a string")
+    if player.get('role') is not None and player.get('role') not in VALID_ROLES:
+        errors.append(f"invalid role {player.get('role')!r}")
+    return errors
+
+
+class CatalogBuilder:
+    def __init__(self, sources, output_dir):
+        self.sources = sources
+        self.output_dir = output_dir
+        self.cache_dir = os.path.join(output_dir, ".cache")
+        self.manifest_path = os.path.join(output_dir, "manifest.json")
+        self.manifest = self.load_manifest()
+        self.stats = {'sources': 0, 'reprocessed': 0, 'records': 0, 'rejected': 0, 'duplicates': 0}
+
+    def load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        return {'sources': {}}
+
+    def source_files(self):
+        """Expand directories into the supported files they contain, in a stable order"""
+        files = []
+        for source in self.sources:
+            if os.path.isdir(source):
+                for name in sorted(os.listdir(source)):
+                    if name.endswith((".csv", ".json", ".ndjson", ".jsonl")):
+                        files.append(os.path.join(source, name))
+            elif os.path.exists(source):
+                files.append(source)
+        return files
+
+    def fingerprint(self, path):
+        """Content hash, computed only when size or mtime changed since the last build"""
+        stat = os.stat(path)
+        previous = self.manifest['sources'].get(path)
+        if previous and previous['size'] == stat.st_size and previous['mtime'] == stat.st_mtime:
+            return previous['sha1'], stat
+        digest = hashlib.sha1()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+                digest.update(chunk)
+        return digest.hexdigest(), stat
+
+    def cache_path(self, path):
+        key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.ndjson")
+
+    def process_source(self, path, rejects):
+        """Normalize and validate one source into its cache file"""
+        valid = 0
+        with open(self.cache_path(path), "w", encoding="utf-8") as cache:
+            for line_number, raw in enumerate(iter_source(path), start=1):
+                player = normalize_player(raw)
+                errors = validate_player(player)
+                if errors:
+                    rejects.write(json.dumps({'source': path, 'record': line_number,
+                                              'errors': errors, 'raw': raw}) + "\n")
+                    self.stats['rejected'] += 1
+                    continue
+                cache.write(json.dumps(player, separators=(",", ":")) + "\n")
+                valid += 1
+        return valid
+
+    def build(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        started = time.time()
+        files = self.source_files()
+        self.stats['sources'] = len(files)
+        sources_manifest = {}
+
+        rejects_path = os.path.join(self.output_dir, "rejects.ndjson")
+        # Rejects from unchanged sources are carried over from the previous build
+        previous_rejects = []
+        if os.path.exists(rejects_path):
+            with open(rejects_path, "r", encoding="utf-8") as handle:
+                previous_rejects = [json.loads(line) for line in handle if line.strip()]
+
+        with open(rejects_path + ".tmp", "w", encoding="utf-8") as rejects:
+            for path in files:
+                sha1, stat = self.fingerprint(path)
+                previous = self.manifest['sources'].get(path)
+                if previous and previous['sha1'] == sha1 and os.path.exists(self.cache_path(path)):
+                    valid = previous['valid']
+                    for reject in previous_rejects:
+                        if reject['source'] == path:
+                            rejects.write(json.dumps(reject) + "\n")
+                            self.stats['rejected'] += 1
+                else:
+                    print(f"🔄 Processing {path}")
+                    valid = self.process_source(path, rejects)
+                    self.stats['reprocessed'] += 1
+                sources_manifest[path] = {'sha1': sha1, 'size': stat.st_size,
+                                          'mtime': stat.st_mtime, 'valid': valid}
+        os.replace(rejects_path + ".tmp", rejects_path)
+
+        players = self.merge(files)
+        self.write_outputs(players)
+
+        self.manifest = {'sources': sources_manifest, 'builtAt': datetime.now().isoformat(),
+                         'players': len(players)}
+        with open(self.manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(self.manifest, handle, indent=2)
+
+        self.stats['records'] = len(players)
+        self.stats['seconds'] = round(time.time() - started, 3)
+        return self.stats
+
+    def merge(self, files):
+        """Later sources override earlier ones by id; a name+country seen under another id is a duplicate"""
+        by_id = {}
+        id_by_identity = {}
+        for path in files:
+            with open(self.cache_path(path), "r", encoding="utf-8") as cache:
+                for line in cache:
+                    player = json.loads(line)
+                    identity = (player['name'].lower(), str(player['country']).lower())
+                    owner = id_by_identity.get(identity)
+                    if owner is not None and owner != player['id']:
+                        self.stats['duplicates'] += 1
+                        continue
+                    id_by_identity[identity] = player['id']
+                    if player['id'] in by_id:
+                        self.stats['duplicates'] += 1
+                        # Keep fields the newer row leaves blank
+                        merged = dict(by_id[player['id']])
+                        merged.update({key: value for key, value in player.items() if value is not None})
+                        player = merged
+                    by_id[player['id']] = player
+        return [by_id[player_id] for player_id in sorted(by_id)]
+
+    def write_outputs(self, players):
+        compact = (",", ":")
+
+        catalog = [{field: player.get(field) for field in CATALOG_FIELDS} for player in players]
+        self.write_json("players.json", catalog, compact)
+
+        indexes = {'byRole': {}, 'byCountry': {}}
+        for player in players:
+            indexes['byRole'].setdefault(player['role'], []).append(player['id'])
+            indexes['byCountry'].setdefault(player['country'], []).append(player['id'])
+        self.write_json("indexes.json", indexes, compact)
+
+        pools = {}
+        for tournament_id, rule in POOL_RULES.items():
+            home = rule['home']
+            min_rating = rule['overseasMinRating']
+            pools[tournament_id] = [
+                player['id'] for player in players
+                if (home is not None and player['country'] in home)
+                or (min_rating is not None and player['rating'] >= min_rating)
+            ]
+        self.write_json("pools.json", pools, compact)
+
+    def write_json(self, name, payload, separators):
+        path = os.path.join(self.output_dir, name)
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=separators)
+        os.replace(path + ".tmp", path)
+
+
+def main():
+    """Build the catalog from the given sources"""
+    parser = argparse.ArgumentParser(description="Build the Sport X player catalog")
+    parser.add_argument("sources", nargs="*", default=DEFAULT_SOURCES,
+                        help="Source files or directories (CSV, JSON array, NDJSON)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Catalog output directory")
+    args = parser.parse_args()
+
+    print(f"🏗️  Sport X Catalog Build - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    builder = CatalogBuilder(args.sources, args.output)
+    stats = builder.build()
+
+    print(f"📊 Sources: {stats['sources']} ({stats['reprocessed']} reprocessed)")
+    print(f"   Players: {stats['records']}, Rejected: {stats['rejected']}, Duplicates: {stats['duplicates']}")
+    print(f"   Built in {stats['seconds']}s -> {args.output}")
+    return 0 if stats['records'] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
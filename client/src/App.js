@@ -1,19 +1,18 @@
-import React, { useState, useEffect } from 'react';
+import React, { Suspense } from 'react';
 import { Routes, Route } from 'react-router-dom';
 import { SocketProvider } from './context/SocketContext';
 import { ThemeProvider } from './context/ThemeContext';
-import HomePage from './pages/HomePage';
-import AuctionRoom from './pages/AuctionRoom';
-import CreateRoom from './pages/CreateRoom';
-import JoinRoom from './pages/JoinRoom';
-import TeamManagement from './pages/TeamManagement';
-import Simulation from './pages/Simulation';
-import TournamentHub from './pages/TournamentHub';
-import CreateTournament from './pages/CreateTournament';
-import TestingGuide from './pages/TestingGuide';
+import { routes } from './routes';
 import Header from './components/Header';
 import Footer from './components/Footer';
 
+// Shown while a page chunk downloads; plain CSS so the shell doesn't pull in framer-motion
+const PageFallback = () => (
+  <div className="flex items-center justify-center py-24">
+    <div className="w-10 h-10 border-4 border-blue-200 border-t-blue-600 rounded-full animate-spin" />
+  </div>
+);
+
 function App() {
   return (
     <ThemeProvider>
@@ -22,17 +21,13 @@ function App() {
           <Header />
           
           <main className="container mx-auto px-4 py-8">
-            <Routes>
-              <Route path="/" element={<HomePage />} />
-              <Route path="/create-room" element={<CreateRoom />} />
-              <Route path="/join-room" element={<JoinRoom />} />
-              <Route path="/room/:roomId" element={<AuctionRoom />} />
-              <Route path="/teams" element={<TeamManagement />} />
-              <Route path="/simulation" element={<Simulation />} />
-              <Route path="/tournaments" element={<TournamentHub />} />
-              <Route path="/create-tournament" element={<CreateTournament />} />
-              <Route path="/testing-guide" element={<TestingGuide />} />
-            </Routes>
+            <Suspense fallback={<PageFallback />}>
+              <Routes>
+                {routes.map(({ path, Component }) => (
+                  <Route key={path} path={path} element={<Component />} />
+                ))}
+              </Routes>
+            </Suspense>
           </main>
           
           <Footer />
@@ -34,7 +34,7 @@ const AuctionControls = ({ status, currentAuction }) => {
       return;
     }
 
-    placeBid(roomId, selectedTeam, amount);
+    placeBid(roomId, selectedTeam, amount, currentAuction?.lotId);
     setBidAmount('');
   };
 
@@ -3,7 +3,7 @@ import { motion } from 'framer-motion';
 import { Trophy, Users, DollarSign, Award } from 'lucide-react';
 import Confetti from 'react-confetti';
 
-const AuctionSummary = ({ teams, auctionHistory }) => {
+const AuctionSummary = ({ teams, historySummary = { sold: 0, unsold: 0, highestSale: 0 } }) => {
   const formatCurrency = (amount) => {
     return new Intl.NumberFormat('en-IN', {
       style: 'currency',
@@ -13,11 +13,10 @@ const AuctionSummary = ({ teams, auctionHistory }) => {
   };
 
   const getTeamStats = (team) => {
-    const soldPlayers = auctionHistory.filter(
-      entry => entry.status === 'sold' && entry.soldTo === team.id
-    );
+    // Team squads arrive resolved against the catalog, with soldPrice attached
+    const soldPlayers = team.players || [];
     
-    const totalSpent = soldPlayers.reduce((sum, entry) => sum + entry.soldPrice, 0);
+    const totalSpent = soldPlayers.reduce((sum, player) => sum + player.soldPrice, 0);
     const averagePrice = soldPlayers.length > 0 ? totalSpent / soldPlayers.length : 0;
     
     const roleCount = {
@@ -27,9 +26,9 @@ const AuctionSummary = ({ teams, auctionHistory }) => {
       'Wicket-Keeper': 0
     };
     
-    soldPlayers.forEach(entry => {
-      if (roleCount.hasOwnProperty(entry.player.role)) {
-        roleCount[entry.player.role]++;
+    soldPlayers.forEach(player => {
+      if (roleCount.hasOwnProperty(player.role)) {
+        roleCount[player.role]++;
       }
     });
 
@@ -55,11 +54,9 @@ const AuctionSummary = ({ teams, auctionHistory }) => {
     .map(team => ({ ...team, stats: getTeamStats(team) }))
     .sort((a, b) => b.stats.totalPlayers - a.stats.totalPlayers);
 
-  const totalSoldPlayers = auctionHistory.filter(entry => entry.status === 'sold').length;
-  const totalUnsoldPlayers = auctionHistory.filter(entry => entry.status === 'unsold').length;
-  const highestSale = Math.max(...auctionHistory
-    .filter(entry => entry.status === 'sold')
-    .map(entry => entry.soldPrice), 0);
+  const totalSoldPlayers = historySummary.sold;
+  const totalUnsoldPlayers = historySummary.unsold;
+  const highestSale = historySummary.highestSale;
 
   return (
     <div className="space-y-8">
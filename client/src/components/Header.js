@@ -1,5 +1,6 @@
 import React from 'react';
-import { Link, useLocation } from 'react-router-dom';
+import { useLocation } from 'react-router-dom';
+import PrefetchLink from './PrefetchLink';
 import { useTheme } from '../context/ThemeContext';
 import { useSocket } from '../context/SocketContext';
 import { Sun, Moon, Wifi, WifiOff, Trophy } from 'lucide-react';
@@ -16,14 +17,14 @@ const Header = () => {
       <div className="container mx-auto px-4">
         <div className="flex items-center justify-between h-16">
           {/* Logo */}
-          <Link to="/" className="flex items-center space-x-2 text-xl font-bold text-blue-600 dark:text-blue-400">
+          <PrefetchLink to="/" className="flex items-center space-x-2 text-xl font-bold text-blue-600 dark:text-blue-400">
             <Trophy className="w-6 h-6" />
             <span>Sport X</span>
-          </Link>
+          </PrefetchLink>
 
           {/* Navigation */}
           <nav className="hidden md:flex items-center space-x-6">
-            <Link
+            <PrefetchLink
               to="/"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/') 
@@ -32,8 +33,8 @@ const Header = () => {
               }`}
             >
               Home
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/tournaments"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/tournaments') 
@@ -42,8 +43,8 @@ const Header = () => {
               }`}
             >
               Tournaments
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/create-room"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/create-room') 
@@ -52,8 +53,8 @@ const Header = () => {
               }`}
             >
               Create Auction
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/join-room"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/join-room') 
@@ -62,8 +63,8 @@ const Header = () => {
               }`}
             >
               Join Auction
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/teams"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/teams') 
@@ -72,8 +73,8 @@ const Header = () => {
               }`}
             >
               Teams
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/simulation"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/simulation') 
@@ -82,8 +83,8 @@ const Header = () => {
               }`}
             >
               AI Simulation
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/testing-guide"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/testing-guide') 
@@ -92,7 +93,7 @@ const Header = () => {
               }`}
             >
               Testing Guide
-            </Link>
+            </PrefetchLink>
           </nav>
 
           {/* Right side */}
@@ -136,7 +137,7 @@ const Header = () => {
         {/* Mobile navigation */}
         <div className="md:hidden border-t border-gray-200 dark:border-gray-700">
           <div className="flex justify-around py-2">
-            <Link
+            <PrefetchLink
               to="/"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/') 
@@ -145,8 +146,8 @@ const Header = () => {
               }`}
             >
               Home
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/tournaments"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/tournaments') 
@@ -155,8 +156,8 @@ const Header = () => {
               }`}
             >
               Tournaments
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/teams"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/teams') 
@@ -165,8 +166,8 @@ const Header = () => {
               }`}
             >
               Teams
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/simulation"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/simulation') 
@@ -175,8 +176,8 @@ const Header = () => {
               }`}
             >
               AI Simulation
-            </Link>
-            <Link
+            </PrefetchLink>
+            <PrefetchLink
               to="/testing-guide"
               className={`px-3 py-2 rounded-md text-sm font-medium transition-colors ${
                 isActive('/testing-guide') 
@@ -185,7 +186,7 @@ const Header = () => {
               }`}
             >
               Testing Guide
-            </Link>
+            </PrefetchLink>
           </div>
         </div>
       </div>
@@ -11,6 +11,9 @@ import {
   Target
 } from 'lucide-react';
 
+// Above this many players, name searches go to the server's search index
+const SERVER_SEARCH_THRESHOLD = 1000;
+
 const PlayerSelection = ({ selectedPlayers, onPlayersChange, tournamentId }) => {
   const [allPlayers, setAllPlayers] = useState([]);
   const [filteredPlayers, setFilteredPlayers] = useState([]);
@@ -19,6 +22,7 @@ const PlayerSelection = ({ selectedPlayers, onPlayersChange, tournamentId }) =>
   const [countryFilter, setCountryFilter] = useState('all');
   const [loading, setLoading] = useState(true);
   const [tournamentInfo, setTournamentInfo] = useState(null);
+  const [searchMatches, setSearchMatches] = useState(null); // { term, ids } from the server search
 
   useEffect(() => {
     fetchPlayers();
@@ -26,7 +30,30 @@ const PlayerSelection = ({ selectedPlayers, onPlayersChange, tournamentId }) =>
 
   useEffect(() => {
     filterPlayers();
-  }, [allPlayers, searchTerm, roleFilter, countryFilter]);
+  }, [allPlayers, searchTerm, roleFilter, countryFilter, searchMatches]);
+
+  // Debounced server-side search for large catalogs
+  useEffect(() => {
+    if (!searchTerm || allPlayers.length <= SERVER_SEARCH_THRESHOLD) {
+      setSearchMatches(null);
+      return;
+    }
+
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${process.env.REACT_APP_SERVER_URL || 'http://localhost:8001'}/api/players/search`, {
+          params: { q: searchTerm, limit: 50, match: 'contains' }
+        });
+        setSearchMatches({ term: searchTerm, ids: new Set(response.data.map(player => player.id)) });
+      } catch (error) {
+        // The local filter below keeps working without the server
+        console.error('Error searching players:', error);
+        setSearchMatches(null);
+      }
+    }, 150);
+
+    return () => clearTimeout(timer);
+  }, [searchTerm, allPlayers.length]);
 
   const fetchPlayers = async () => {
     try {
@@ -74,8 +101,11 @@ const PlayerSelection = ({ selectedPlayers, onPlayersChange, tournamentId }) =>
   const filterPlayers = () => {
     let filtered = [...allPlayers];
 
-    // Search filter
-    if (searchTerm) {
+    // Search filter: server results once they match the current term, otherwise
+    // (small catalogs, debounce pending, failed request) the local name/country filter
+    if (searchTerm && searchMatches && searchMatches.term === searchTerm) {
+      filtered = filtered.filter(player => searchMatches.ids.has(player.id));
+    } else if (searchTerm) {
       filtered = filtered.filter(player =>
         player.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
         player.country.toLowerCase().includes(searchTerm.toLowerCase())
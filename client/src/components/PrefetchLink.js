@@ -0,0 +1,26 @@
+import React from 'react';
+import { Link } from 'react-router-dom';
+import { preloadRoute } from '../routes';
+
+// Link that starts downloading the target page's chunk on hover, focus or touch
+const PrefetchLink = ({ to, onMouseEnter, onFocus, onTouchStart, ...props }) => {
+  const pathname = typeof to === 'string' ? to : to.pathname;
+  const withPrefetch = (handler) => (event) => {
+    preloadRoute(pathname);
+    if (handler) {
+      handler(event);
+    }
+  };
+
+  return (
+    <Link
+      to={to}
+      onMouseEnter={withPrefetch(onMouseEnter)}
+      onFocus={withPrefetch(onFocus)}
+      onTouchStart={withPrefetch(onTouchStart)}
+      {...props}
+    />
+  );
+};
+
+export default PrefetchLink;
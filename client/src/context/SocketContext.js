@@ -1,9 +1,86 @@
-import React, { createContext, useContext, useEffect, useState } from 'react';
+import React, { createContext, useContext, useEffect, useRef, useState } from 'react';
 import io from 'socket.io-client';
 import { toast } from 'react-toastify';
 
 const SocketContext = createContext();
 
+// Apply one versioned room event (see AuctionRoom.emit on the server) to a room snapshot
+const applyRoomEvent = (room, { version, type, payload }) => {
+  const next = { ...room, version };
+  switch (type) {
+    case 'team-added':
+      next.teams = [...room.teams, payload.team];
+      break;
+    case 'team-removed':
+      next.teams = room.teams.filter(team => team.id !== payload.teamId);
+      break;
+    case 'player-added':
+      next.totalPlayers = payload.totalPlayers;
+      break;
+    case 'auction-started':
+      next.status = payload.status;
+      break;
+    case 'lot-opened': {
+      const openLots = room.openLots || [];
+      next.openLots = [...openLots, payload.lot];
+      // A new lot becomes current unless an earlier one is still open
+      if (!room.currentAuction || !openLots.some(lot => lot.lotId === room.currentAuction.lotId)) {
+        next.currentAuction = payload.lot;
+      }
+      next.currentPlayerIndex = payload.currentPlayerIndex;
+      break;
+    }
+    case 'bid-placed': {
+      const applyBid = (lot) => (lot.lotId === payload.lotId
+        ? {
+            ...lot,
+            currentBid: payload.amount,
+            highestBidder: payload.teamId,
+            timeLeft: room.settings.bidTimeout || 30,
+            biddingHistory: [...lot.biddingHistory, payload]
+          }
+        : lot);
+      next.openLots = (room.openLots || []).map(applyBid);
+      if (room.currentAuction) {
+        next.currentAuction = applyBid(room.currentAuction);
+      }
+      break;
+    }
+    case 'lot-closed': {
+      const { record, squadEntry, remainingBudget } = payload;
+      next.recentHistory = [...room.recentHistory, record].slice(-10);
+      next.historyCount = room.historyCount + 1;
+      next.historySummary = record.status === 'sold'
+        ? {
+            ...room.historySummary,
+            sold: room.historySummary.sold + 1,
+            highestSale: Math.max(room.historySummary.highestSale, record.price)
+          }
+        : { ...room.historySummary, unsold: room.historySummary.unsold + 1 };
+      if (squadEntry) {
+        next.teams = room.teams.map(team => (team.id === record.teamId
+          ? { ...team, players: [...team.players, squadEntry], remainingBudget }
+          : team));
+      }
+      next.openLots = (room.openLots || []).filter(lot => lot.lotId !== payload.lotId);
+      if (room.currentAuction && room.currentAuction.lotId === payload.lotId) {
+        // Keep showing the settled lot until another one takes its place
+        next.currentAuction = next.openLots[0] || { ...room.currentAuction, timeLeft: 0 };
+      }
+      break;
+    }
+    case 'auction-completed':
+      next.status = payload.status;
+      next.currentAuction = null;
+      next.openLots = [];
+      next.historySummary = payload.historySummary;
+      break;
+    default:
+      break;
+  }
+  return next;
+};
+
 export const useSocket = () => {
   const context = useContext(SocketContext);
   if (!context) {
@@ -17,6 +94,16 @@ export const SocketProvider = ({ children }) => {
   const [connected, setConnected] = useState(false);
   const [roomState, setRoomState] = useState(null);
   const [currentUser, setCurrentUser] = useState(null);
+  const [leaderboard, setLeaderboard] = useState(null);
+  const [spectatorSummary, setSpectatorSummary] = useState(null);
+  const [memberships, setMemberships] = useState(null);
+  const spectatingRef = useRef(null); // roomId watched read-only, re-joined after a reconnect
+  const userRef = useRef(null); // registered userId, re-sent after a reconnect
+  const roomRef = useRef(null); // latest room state, read by socket handlers
+
+  useEffect(() => {
+    roomRef.current = roomState;
+  }, [roomState]);
 
   useEffect(() => {
     // Initialize socket connection
@@ -45,6 +132,20 @@ export const SocketProvider = ({ children }) => {
       console.log('Connected to server successfully');
       setConnected(true);
       // Remove the toast notification to avoid user anxiety
+
+      // A new connection is a new socket id on the server; register it again
+      if (userRef.current) {
+        newSocket.emit('register', userRef.current);
+      }
+
+      // After a reconnect, ask only for the room events missed while offline
+      if (spectatingRef.current) {
+        newSocket.emit('spectate-room', { roomId: spectatingRef.current });
+      }
+      const room = roomRef.current;
+      if (room && room.version !== undefined) {
+        newSocket.emit('get-room-state', { roomId: room.roomId, sinceVersion: room.version });
+      }
     });
 
     newSocket.on('disconnect', (reason) => {
@@ -70,44 +171,82 @@ export const SocketProvider = ({ children }) => {
       setConnected(false);
     });
 
+    // Full room snapshots; the ref is updated right away so deltas that follow apply to them
+    const replaceRoomState = (room) => {
+      roomRef.current = room;
+      setRoomState(room);
+    };
+
     // Room event handlers
     newSocket.on('room-created', (data) => {
       console.log('Room created:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
       toast.success(`Room created: ${data.roomId}`);
     });
 
     newSocket.on('room-joined', (data) => {
       console.log('Room joined:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
       toast.success('Joined room successfully');
     });
 
     newSocket.on('room-state', (data) => {
       console.log('Room state updated:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
+    });
+
+    // Versioned deltas: apply in order, resync from our version on a gap
+    const applyRoomEvents = (roomId, events) => {
+      const room = roomRef.current;
+      if (!room || room.roomId !== roomId) {
+        return;
+      }
+      let next = room;
+      for (const event of events) {
+        if (event.version <= next.version) {
+          continue; // already covered by a full state update
+        }
+        if (event.version !== next.version + 1) {
+          newSocket.emit('get-room-state', { roomId, sinceVersion: next.version });
+          break;
+        }
+        next = applyRoomEvent(next, event);
+      }
+      if (next !== room) {
+        roomRef.current = next;
+        setRoomState(next);
+      }
+    };
+
+    newSocket.on('room-event', (event) => {
+      applyRoomEvents(event.roomId, [event]);
+    });
+
+    newSocket.on('room-events', (data) => {
+      console.log('Caught up on room events:', data.events.length);
+      applyRoomEvents(data.roomId, data.events);
     });
 
     newSocket.on('team-added', (data) => {
       console.log('Team added:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
       toast.success(`Team "${data.teamData.name}" added`);
     });
 
     newSocket.on('auction-started', (data) => {
       console.log('Auction started:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
       toast.success('Auction has started!');
     });
 
     newSocket.on('bid-placed', (data) => {
       console.log('Bid placed:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
     });
 
     newSocket.on('next-player', (data) => {
       console.log('Next player:', data);
-      setRoomState(data.room);
+      replaceRoomState(data.room);
     });
 
     newSocket.on('player-added', (data) => {
@@ -120,6 +259,52 @@ export const SocketProvider = ({ children }) => {
       toast.info(`User ${data.userId} joined the room`);
     });
 
+    // Leaderboard pushes: snapshot on subscribe, then top-N diffs and own-rank updates
+    newSocket.on('leaderboard-snapshot', (data) => {
+      setLeaderboard(data);
+    });
+
+    newSocket.on('leaderboard-update', (data) => {
+      setLeaderboard(prev => {
+        if (!prev || prev.tournamentId !== data.tournamentId) {
+          return prev;
+        }
+        const rows = new Map(prev.top.map(row => [row.userId, row]));
+        data.removed.forEach(userId => rows.delete(userId));
+        data.changed.forEach(row => rows.set(row.userId, row));
+        const top = Array.from(rows.values())
+          .sort((a, b) => a.rank - b.rank)
+          .slice(0, data.topN);
+        return { ...prev, seq: data.seq, top };
+      });
+    });
+
+    newSocket.on('leaderboard-rank', (data) => {
+      setLeaderboard(prev => {
+        if (!prev || prev.tournamentId !== data.tournamentId) {
+          return prev;
+        }
+        const { tournamentId, seq, participants, ...own } = data;
+        return { ...prev, own, participants };
+      });
+    });
+
+    // Spectator summaries: the whole view is replaced on every tick
+    newSocket.on('spectator-joined', (data) => {
+      setSpectatorSummary(data.summary);
+    });
+
+    newSocket.on('spectator-summary', (data) => {
+      if (data.roomId === spectatingRef.current) {
+        setSpectatorSummary(data);
+      }
+    });
+
+    // Rooms and tournaments changed from this or another of the user's devices
+    newSocket.on('memberships-updated', (data) => {
+      setMemberships(data);
+    });
+
     // Error handler
     newSocket.on('error', (data) => {
       console.error('Socket error:', data);
@@ -136,6 +321,7 @@ export const SocketProvider = ({ children }) => {
   const registerUser = (userId) => {
     if (socket) {
       socket.emit('register', userId);
+      userRef.current = userId;
       setCurrentUser(userId);
     }
   };
@@ -164,9 +350,9 @@ export const SocketProvider = ({ children }) => {
     }
   };
 
-  const placeBid = (roomId, teamId, amount) => {
+  const placeBid = (roomId, teamId, amount, lotId) => {
     if (socket) {
-      socket.emit('place-bid', { roomId, teamId, amount });
+      socket.emit('place-bid', { roomId, teamId, amount, lotId });
     }
   };
 
@@ -188,6 +374,28 @@ export const SocketProvider = ({ children }) => {
     }
   };
 
+  const subscribeLeaderboard = (tournamentId) => {
+    if (socket) {
+      socket.emit('subscribe-leaderboard', { tournamentId });
+    }
+  };
+
+  const spectateRoom = (roomId) => {
+    spectatingRef.current = roomId;
+    setSpectatorSummary(null);
+    if (socket) {
+      socket.emit('spectate-room', { roomId });
+    }
+  };
+
+  const leaveSpectate = () => {
+    if (socket && spectatingRef.current) {
+      socket.emit('leave-spectate', { roomId: spectatingRef.current });
+    }
+    spectatingRef.current = null;
+    setSpectatorSummary(null);
+  };
+
   const value = {
     socket,
     connected,
@@ -202,7 +410,13 @@ export const SocketProvider = ({ children }) => {
     nextPlayer,
     addCustomPlayer,
     getRoomState,
-    setRoomState
+    setRoomState,
+    leaderboard,
+    subscribeLeaderboard,
+    spectatorSummary,
+    spectateRoom,
+    memberships,
+    leaveSpectate
   };
 
   return (
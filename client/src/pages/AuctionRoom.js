@@ -1,4 +1,4 @@
-import React, { useEffect } from 'react';
+import React, { useEffect, useState } from 'react';
 import { useParams } from 'react-router-dom';
 import { useSocket } from '../context/SocketContext';
 import { motion, AnimatePresence } from 'framer-motion';
@@ -13,6 +13,7 @@ import LoadingSpinner from '../components/LoadingSpinner';
 const AuctionRoom = () => {
   const { roomId } = useParams();
   const { roomState, getRoomState } = useSocket();
+  const [focusedLotId, setFocusedLotId] = useState(null);
 
   useEffect(() => {
     if (roomId) {
@@ -28,7 +29,10 @@ const AuctionRoom = () => {
     );
   }
 
-  const { currentAuction, status, teams, settings, auctionHistory } = roomState;
+  const { status, teams, settings, historySummary } = roomState;
+  const openLots = roomState.openLots || [];
+  // With parallel lots, bids and the player card follow the lot picked in the tabs
+  const currentAuction = openLots.find(lot => lot.lotId === focusedLotId) || roomState.currentAuction;
 
   const renderContent = () => {
     if (status === 'waiting') {
@@ -49,13 +53,27 @@ const AuctionRoom = () => {
     }
 
     if (status === 'completed') {
-      return <AuctionSummary teams={teams} auctionHistory={auctionHistory} />;
+      return <AuctionSummary teams={teams} historySummary={historySummary} />;
     }
 
     return (
       <div className="grid lg:grid-cols-3 gap-8">
         {/* Main auction area */}
         <div className="lg:col-span-2 space-y-8">
+          {openLots.length > 1 && (
+            <div className="flex flex-wrap gap-2">
+              {openLots.map(lot => (
+                <button
+                  key={lot.lotId}
+                  onClick={() => setFocusedLotId(lot.lotId)}
+                  className={lot.lotId === currentAuction?.lotId ? 'btn-primary' : 'btn-secondary'}
+                >
+                  {lot.player.name} · {lot.timeLeft}s
+                </button>
+              ))}
+            </div>
+          )}
+
           <AnimatePresence mode="wait">
             {currentAuction ? (
               <motion.div
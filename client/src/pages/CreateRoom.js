@@ -1,6 +1,7 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useSocket } from '../context/SocketContext';
+import { preloadRoute } from '../routes';
 import { toast } from 'react-toastify';
 import { ArrowRight } from 'lucide-react';
 
@@ -8,10 +9,16 @@ const CreateRoom = () => {
   const [roomName, setRoomName] = useState('');
   const [mode, setMode] = useState('standard');
   const [budget, setBudget] = useState(10000000);
+  const [parallelLots, setParallelLots] = useState(1);
   const [loading, setLoading] = useState(false);
   const navigate = useNavigate();
   const { createRoom, socket } = useSocket();
 
+  // Creating a room always lands in it, so fetch the auction room page up front
+  useEffect(() => {
+    preloadRoute('/room/new');
+  }, []);
+
   const handleCreateRoom = async () => {
     if (!roomName) {
       toast.error('Please enter a room name');
@@ -26,6 +33,7 @@ const CreateRoom = () => {
         mode,
         budget,
         bidTimeout: 30,
+        parallelLots,
       };
 
       // Listen for room-created event to get the actual room ID
@@ -87,6 +95,19 @@ const CreateRoom = () => {
               <option value="friendly">Friendly Draft</option>
             </select>
           </div>
+          <div className="mb-4">
+            <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Players Auctioned at Once</label>
+            <select
+              value={parallelLots}
+              onChange={e => setParallelLots(Number(e.target.value))}
+              className="mt-1 block w-full bg-white dark:bg-gray-900 border border-gray-300 dark:border-gray-700 rounded-md shadow-sm focus:ring-blue-500 focus:border-blue-500 sm:text-sm"
+            >
+              <option value={1}>1 (classic)</option>
+              <option value={2}>2</option>
+              <option value={4}>4</option>
+              <option value={8}>8</option>
+            </select>
+          </div>
           {mode === 'standard' && (
             <div className="mb-4">
               <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Budget</label>
@@ -1,5 +1,6 @@
 import React, { useEffect } from 'react';
-import { Link, useNavigate } from 'react-router-dom';
+import { useNavigate } from 'react-router-dom';
+import PrefetchLink from '../components/PrefetchLink';
 import { useSocket } from '../context/SocketContext';
 import { motion } from 'framer-motion';
 import { 
@@ -101,33 +102,33 @@ const HomePage = () => {
             </p>
             
             <div className="flex flex-col sm:flex-row gap-4 justify-center items-center">
-              <Link
+              <PrefetchLink
                 to="/tournaments"
                 className="btn-primary px-8 py-4 text-lg flex items-center space-x-2 hover:scale-105 transform transition-transform"
               >
                 <Trophy className="w-5 h-5" />
                 <span>Tournaments</span>
-              </Link>
+              </PrefetchLink>
               
-              <Link
+              <PrefetchLink
                 to="/create-room"
                 className="btn-secondary px-8 py-4 text-lg flex items-center space-x-2 hover:scale-105 transform transition-transform"
               >
                 <Play className="w-5 h-5" />
                 <span>Quick Auction</span>
-              </Link>
+              </PrefetchLink>
             </div>
 
             {/* Testing Guide Banner */}
             <div className="mt-8">
-              <Link
+              <PrefetchLink
                 to="/testing-guide"
                 className="inline-flex items-center space-x-2 bg-yellow-100 hover:bg-yellow-200 dark:bg-yellow-900 dark:hover:bg-yellow-800 text-yellow-800 dark:text-yellow-200 px-6 py-3 rounded-lg font-medium transition-colors"
               >
                 <span>🧪</span>
                 <span>New to Sport X? Check out our Testing Guide</span>
                 <ArrowRight className="w-4 h-4" />
-              </Link>
+              </PrefetchLink>
             </div>
           </motion.div>
         </div>
@@ -217,13 +218,13 @@ const HomePage = () => {
                     </li>
                   ))}
                 </ul>
-                <Link
+                <PrefetchLink
                   to="/create-room"
                   className={`btn-${mode.color === 'blue' ? 'primary' : 'success'} w-full flex items-center justify-center space-x-2`}
                 >
                   <span>Create {mode.title}</span>
                   <ArrowRight className="w-4 h-4" />
-                </Link>
+                </PrefetchLink>
               </motion.div>
             ))}
           </div>
@@ -293,20 +294,20 @@ const HomePage = () => {
               Build your dream cricket team with Sport X's advanced auction platform
             </p>
             <div className="flex flex-col sm:flex-row gap-4 justify-center">
-              <Link
+              <PrefetchLink
                 to="/create-room"
                 className="bg-white text-blue-600 hover:bg-gray-100 px-8 py-4 rounded-lg font-semibold transition-colors flex items-center justify-center space-x-2"
               >
                 <Play className="w-5 h-5" />
                 <span>Create Room</span>
-              </Link>
-              <Link
+              </PrefetchLink>
+              <PrefetchLink
                 to="/simulation"
                 className="border-2 border-white text-white hover:bg-white hover:text-blue-600 px-8 py-4 rounded-lg font-semibold transition-colors flex items-center justify-center space-x-2"
               >
                 <Zap className="w-5 h-5" />
                 <span>Try AI Simulation</span>
-              </Link>
+              </PrefetchLink>
             </div>
           </motion.div>
         </div>
@@ -1,9 +1,10 @@
 import React, { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useSocket } from '../context/SocketContext';
+import { preloadRoute } from '../routes';
 import { toast } from 'react-toastify';
 import { motion } from 'framer-motion';
-import { Users, ArrowRight, Hash } from 'lucide-react';
+import { Users, ArrowRight, Hash, Eye } from 'lucide-react';
 
 const JoinRoom = () => {
   const [roomCode, setRoomCode] = useState('');
@@ -90,7 +91,11 @@ const JoinRoom = () => {
               <input
                 type="text"
                 value={roomCode}
-                onChange={(e) => setRoomCode(e.target.value.toUpperCase())}
+                onChange={(e) => {
+                  setRoomCode(e.target.value.toUpperCase());
+                  // Fetch the auction room page while the code is still being typed
+                  preloadRoute('/room/' + e.target.value.toUpperCase());
+                }}
                 onKeyPress={handleKeyPress}
                 placeholder="Enter room code"
                 className="w-full pl-10 pr-4 py-3 bg-gray-50 dark:bg-gray-700 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent text-gray-900 dark:text-white placeholder-gray-500 dark:placeholder-gray-400 transition-colors"
@@ -121,6 +126,15 @@ const JoinRoom = () => {
             )}
           </button>
 
+          <button
+            onClick={() => navigate(`/watch/${roomCode.toUpperCase()}`)}
+            disabled={loading || !roomCode.trim()}
+            className="w-full mt-3 bg-gray-100 hover:bg-gray-200 dark:bg-gray-700 dark:hover:bg-gray-600 disabled:opacity-50 disabled:cursor-not-allowed text-gray-800 dark:text-gray-200 font-semibold py-3 px-4 rounded-lg transition-colors duration-200 flex items-center justify-center space-x-2"
+          >
+            <Eye className="w-5 h-5" />
+            <span>Watch as Spectator</span>
+          </button>
+
           <div className="mt-6 text-center">
             <p className="text-gray-600 dark:text-gray-400 text-sm">
               Don't have a room code?{' '}
@@ -1,8 +1,78 @@
-import React from 'react';
+import React, { useState } from 'react';
 import { motion } from 'framer-motion';
 import { Zap, Brain, Trophy, Target } from 'lucide-react';
+import { useSocket } from '../context/SocketContext';
+
+const serverUrl = process.env.REACT_APP_SERVER_URL || 'http://localhost:8001';
+
+// POST to an AI endpoint and pass each streamed text chunk to onText
+const streamAI = async (endpoint, body, onText) => {
+  const response = await fetch(`${serverUrl}${endpoint}?stream=true`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body)
+  });
+
+  if (!response.ok) {
+    const data = await response.json().catch(() => ({}));
+    throw new Error(data.error || `HTTP ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += decoder.decode(value, { stream: true });
+
+    // Server-sent events are separated by a blank line
+    const frames = buffer.split('\n\n');
+    buffer = frames.pop();
+
+    for (const frame of frames) {
+      let event = 'message';
+      let data = '';
+      frame.split('\n').forEach(line => {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        if (line.startsWith('data:')) data += line.slice(5).trim();
+      });
+
+      if (!data) continue;
+      const payload = JSON.parse(data);
+      if (event === 'error') throw new Error(payload.error);
+      if (event === 'message') onText(payload.text);
+    }
+  }
+};
 
 const Simulation = () => {
+  const { roomState } = useSocket();
+  const [output, setOutput] = useState('');
+  const [running, setRunning] = useState(false);
+  const [error, setError] = useState(null);
+
+  const teams = roomState?.status === 'completed' ? roomState.teams.filter(team => team.players.length > 0) : [];
+
+  const run = async (endpoint, body) => {
+    setOutput('');
+    setError(null);
+    setRunning(true);
+    try {
+      await streamAI(endpoint, body, text => setOutput(prev => prev + text));
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setRunning(false);
+    }
+  };
+
+  const predictMatch = () => run('/api/predict', { team1: teams[0], team2: teams[1], matchType: 'T20' });
+  const simulateTournament = () => run('/api/simulate-tournament', { teams, tournamentType: 'Round Robin' });
+
   return (
     <div className="container mx-auto px-4 py-8">
       <motion.div
@@ -90,9 +160,39 @@ const Simulation = () => {
         </div>
         
         <div className="mt-12">
-          <p className="text-gray-500 dark:text-gray-400">
-            Complete an auction first to unlock AI simulation features for your teams!
-          </p>
+          {teams.length >= 2 ? (
+            <div className="max-w-4xl mx-auto text-left">
+              <div className="flex justify-center space-x-4 mb-6">
+                <button
+                  onClick={predictMatch}
+                  disabled={running}
+                  className="px-6 py-3 bg-blue-600 hover:bg-blue-700 disabled:opacity-50 text-white font-semibold rounded-lg"
+                >
+                  Predict {teams[0].name} vs {teams[1].name}
+                </button>
+                <button
+                  onClick={simulateTournament}
+                  disabled={running}
+                  className="px-6 py-3 bg-purple-600 hover:bg-purple-700 disabled:opacity-50 text-white font-semibold rounded-lg"
+                >
+                  Simulate Tournament
+                </button>
+              </div>
+              {error && (
+                <p className="text-center text-red-600 dark:text-red-400 mb-4">{error}</p>
+              )}
+              {(output || running) && (
+                <pre className="bg-white dark:bg-gray-800 rounded-xl p-6 shadow-lg border border-gray-200 dark:border-gray-700 text-sm text-gray-800 dark:text-gray-200 whitespace-pre-wrap">
+                  {output}
+                  {running && <span className="animate-pulse">▍</span>}
+                </pre>
+              )}
+            </div>
+          ) : (
+            <p className="text-gray-500 dark:text-gray-400">
+              Complete an auction first to unlock AI simulation features for your teams!
+            </p>
+          )}
         </div>
       </motion.div>
     </div>
@@ -0,0 +1,90 @@
+import React, { useEffect } from 'react';
+import { useParams } from 'react-router-dom';
+import { useSocket } from '../context/SocketContext';
+import { Eye, Clock, Gavel } from 'lucide-react';
+
+// Read-only view of an auction, fed by the server's periodic spectator summaries
+const SpectateRoom = () => {
+  const { roomId } = useParams();
+  const { connected, spectatorSummary, spectateRoom, leaveSpectate } = useSocket();
+
+  useEffect(() => {
+    if (connected) {
+      spectateRoom(roomId);
+    }
+    return () => leaveSpectate();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [roomId, connected]);
+
+  const formatCurrency = (amount) => {
+    return new Intl.NumberFormat('en-IN', {
+      style: 'currency',
+      currency: 'INR',
+      maximumFractionDigits: 0
+    }).format(amount);
+  };
+
+  if (!spectatorSummary) {
+    return (
+      <div className="flex items-center justify-center py-24">
+        <div className="loading-spinner"></div>
+      </div>
+    );
+  }
+
+  const { status, lots, teams, sold, totalPlayers, currentPlayerIndex } = spectatorSummary;
+
+  return (
+    <div className="max-w-4xl mx-auto">
+      <div className="flex items-center justify-between mb-6">
+        <div>
+          <h1 className="text-3xl font-bold text-gray-900 dark:text-white flex items-center space-x-2">
+            <Eye className="w-7 h-7 text-blue-600 dark:text-blue-400" />
+            <span>Watching {roomId}</span>
+          </h1>
+          <p className="text-gray-600 dark:text-gray-300">
+            {teams} teams · {sold} sold · player {currentPlayerIndex} of {totalPlayers}
+          </p>
+        </div>
+        <span className="px-3 py-1 rounded-full text-sm font-medium bg-blue-100 text-blue-800 dark:bg-blue-900 dark:text-blue-200 capitalize">
+          {status}
+        </span>
+      </div>
+
+      {lots.length === 0 ? (
+        <div className="bg-white dark:bg-gray-800 p-8 rounded-2xl shadow-xl border border-gray-200 dark:border-gray-700 text-center text-gray-600 dark:text-gray-300">
+          {status === 'completed' ? 'This auction has finished.' : 'Waiting for the next player...'}
+        </div>
+      ) : (
+        <div className="grid gap-4 md:grid-cols-2">
+          {lots.map(lot => (
+            <div
+              key={lot.lotId}
+              className="bg-white dark:bg-gray-800 p-6 rounded-2xl shadow-xl border border-gray-200 dark:border-gray-700"
+            >
+              <div className="flex items-center justify-between mb-4">
+                <div>
+                  <h2 className="text-xl font-bold text-gray-900 dark:text-white">{lot.playerName}</h2>
+                  <p className="text-sm text-gray-500 dark:text-gray-400">{lot.role}</p>
+                </div>
+                <div className="flex items-center space-x-1 text-gray-700 dark:text-gray-300">
+                  <Clock className="w-4 h-4" />
+                  <span className="font-mono">{lot.timeLeft}s</span>
+                </div>
+              </div>
+              <p className="text-2xl font-bold text-green-600 dark:text-green-400">
+                {formatCurrency(lot.currentBid)}
+              </p>
+              <p className="text-sm text-gray-600 dark:text-gray-300 flex items-center space-x-1 mt-1">
+                <Gavel className="w-4 h-4" />
+                <span>{lot.leader ? `${lot.leader} leads` : 'No bids yet'} · {lot.bids} bids</span>
+              </p>
+            </div>
+          ))}
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default SpectateRoom;
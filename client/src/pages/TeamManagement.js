@@ -26,7 +26,7 @@ const TeamManagement = () => {
     try {
       // Fetch tournaments
       const tournamentsResponse = await axios.get(`${process.env.REACT_APP_SERVER_URL || 'http://localhost:8001'}/api/tournaments`);
-      setTournaments(tournamentsResponse.data);
+      setTournaments(tournamentsResponse.data.tournaments);
       
       // Note: Auction rooms API would need to be implemented
       // For now, we'll show tournaments
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
-import { Link, useNavigate } from 'react-router-dom';
+import { useNavigate } from 'react-router-dom';
+import PrefetchLink from '../components/PrefetchLink';
 import { motion } from 'framer-motion';
 import axios from 'axios';
 import { 
@@ -25,7 +26,7 @@ const TournamentHub = () => {
   const fetchTournaments = async () => {
     try {
       const response = await axios.get(`${process.env.REACT_APP_SERVER_URL || 'http://localhost:8001'}/api/tournaments`);
-      setTournaments(response.data);
+      setTournaments(response.data.tournaments);
     } catch (error) {
       console.error('Error fetching tournaments:', error);
     } finally {
@@ -86,21 +87,21 @@ const TournamentHub = () => {
             </p>
             
             <div className="flex flex-col sm:flex-row gap-4 justify-center">
-              <Link
+              <PrefetchLink
                 to="/create-tournament"
                 className="btn-primary px-8 py-4 text-lg flex items-center space-x-2 hover:scale-105 transform transition-transform"
               >
                 <Plus className="w-5 h-5" />
                 <span>Create Tournament</span>
-              </Link>
+              </PrefetchLink>
               
-              <Link
+              <PrefetchLink
                 to="/tournaments/browse"
                 className="btn-secondary px-8 py-4 text-lg flex items-center space-x-2 hover:scale-105 transform transition-transform"
               >
                 <Users className="w-5 h-5" />
                 <span>Browse Tournaments</span>
-              </Link>
+              </PrefetchLink>
             </div>
           </motion.div>
         </div>
@@ -126,13 +127,13 @@ const TournamentHub = () => {
               <p className="text-gray-500 dark:text-gray-500 mb-6">
                 Be the first to create a cricket tournament!
               </p>
-              <Link
+              <PrefetchLink
                 to="/create-tournament"
                 className="btn-primary inline-flex items-center space-x-2"
               >
                 <Plus className="w-5 h-5" />
                 <span>Create First Tournament</span>
-              </Link>
+              </PrefetchLink>
             </motion.div>
           ) : (
             <div className="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
@@ -0,0 +1,45 @@
+import { lazy } from 'react';
+import { matchPath } from 'react-router-dom';
+
+// Pages load on demand so the first visit only downloads the shell and the
+// page it lands on. preload() starts fetching a page's chunk early, e.g. when
+// the pointer reaches a link to it; webpack dedupes repeated imports.
+function lazyWithPreload(factory) {
+  const Component = lazy(factory);
+  Component.preload = factory;
+  return Component;
+}
+
+export const HomePage = lazyWithPreload(() => import(/* webpackChunkName: "home" */ './pages/HomePage'));
+export const CreateRoom = lazyWithPreload(() => import(/* webpackChunkName: "create-room" */ './pages/CreateRoom'));
+export const JoinRoom = lazyWithPreload(() => import(/* webpackChunkName: "join-room" */ './pages/JoinRoom'));
+export const AuctionRoom = lazyWithPreload(() => import(/* webpackChunkName: "auction-room" */ './pages/AuctionRoom'));
+export const SpectateRoom = lazyWithPreload(() => import(/* webpackChunkName: "spectate-room" */ './pages/SpectateRoom'));
+export const TeamManagement = lazyWithPreload(() => import(/* webpackChunkName: "teams" */ './pages/TeamManagement'));
+export const Simulation = lazyWithPreload(() => import(/* webpackChunkName: "simulation" */ './pages/Simulation'));
+export const TournamentHub = lazyWithPreload(() => import(/* webpackChunkName: "tournaments" */ './pages/TournamentHub'));
+export const CreateTournament = lazyWithPreload(() => import(/* webpackChunkName: "create-tournament" */ './pages/CreateTournament'));
+export const TestingGuide = lazyWithPreload(() => import(/* webpackChunkName: "testing-guide" */ './pages/TestingGuide'));
+
+export const routes = [
+  { path: '/', Component: HomePage },
+  { path: '/create-room', Component: CreateRoom },
+  { path: '/join-room', Component: JoinRoom },
+  { path: '/room/:roomId', Component: AuctionRoom },
+  { path: '/watch/:roomId', Component: SpectateRoom },
+  { path: '/teams', Component: TeamManagement },
+  { path: '/simulation', Component: Simulation },
+  { path: '/tournaments', Component: TournamentHub },
+  { path: '/create-tournament', Component: CreateTournament },
+  { path: '/testing-guide', Component: TestingGuide }
+];
+
+// Start loading the page a path will render; unknown paths are ignored
+export const preloadRoute = (pathname) => {
+  const route = routes.find(({ path }) => matchPath(path, pathname));
+  if (route) {
+    route.Component.preload().catch(() => {
+      // A failed prefetch is retried by React.lazy when the route actually renders
+    });
+  }
+};
@@ -10,6 +10,8 @@ import sys
 import time
 from datetime import datetime
 
+from stream_validation import LEADERBOARD_VALIDATOR, PLAYER_VALIDATOR, validate_response
+
 class CricketAPITester:
     def __init__(self, base_url="https://player-auction-1.preview.emergentagent.com"):
         self.base_url = base_url
@@ -17,6 +19,7 @@ class CricketAPITester:
         self.tests_passed = 0
         self.session = requests.Session()
         self.created_tournament_id = None
+        self.joined_user_id = None
 
     def log_test(self, name, success, details=""):
         """Log test results"""
@@ -45,28 +48,19 @@ class CricketAPITester:
     def test_players_endpoint(self):
         """Test /api/players endpoint (cricket players)"""
         try:
-            response = self.session.get(f"{self.base_url}/api/players")
+            response = self.session.get(f"{self.base_url}/api/players", stream=True)
             success = response.status_code == 200
             
             if success:
-                players = response.json()
-                player_count = len(players)
-                has_required_fields = all(
-                    'id' in player and 'name' in player and 'role' in player 
-                    for player in players[:5]  # Check first 5 players
-                )
-                # Verify cricket roles
-                cricket_roles = ['Batsman', 'Bowler', 'All-rounder', 'Wicket-Keeper']
-                has_cricket_roles = all(
-                    player.get('role') in cricket_roles for player in players[:10]
-                )
-                success = player_count >= 50 and has_required_fields and has_cricket_roles
-                details = f"Found {player_count} cricket players, Required fields: {has_required_fields}, Cricket roles: {has_cricket_roles}"
+                # Every player is checked for required fields, types and cricket roles as it streams in
+                report = validate_response(response, PLAYER_VALIDATOR)
+                success = report.records >= 50 and report.ok
+                details = f"Validated {report.summary()}"
             else:
                 details = f"HTTP {response.status_code}"
                 
             self.log_test("Cricket Players API Endpoint", success, details)
-            return success, players if success else []
+            return success, report.sample if success else []
             
         except Exception as e:
             self.log_test("Cricket Players API Endpoint", False, str(e))
@@ -110,9 +104,11 @@ class CricketAPITester:
             success = response.status_code == 200
             
             if success:
-                tournaments = response.json()
+                page = response.json()
+                tournaments = page.get('tournaments', [])
                 is_array = isinstance(tournaments, list)
-                details = f"Returned {len(tournaments)} cricket tournaments, Is array: {is_array}"
+                success = is_array and 'nextCursor' in page
+                details = f"Returned {len(tournaments)} cricket tournaments, Is array: {is_array}, Next cursor: {page.get('nextCursor')}"
             else:
                 details = f"HTTP {response.status_code}"
                 
@@ -178,7 +174,7 @@ class CricketAPITester:
             if success:
                 tournament = response.json()
                 has_required_fields = all(
-                    field in tournament for field in ['id', 'settings', 'status', 'participants']
+                    field in tournament for field in ['id', 'settings', 'status', 'participantCount']
                 )
                 # Check cricket-specific squad rules
                 squad_rules = tournament.get('settings', {}).get('squadRules', {})
@@ -211,6 +207,7 @@ class CricketAPITester:
                 }
             }
             
+            self.joined_user_id = join_data["userId"]
             response = self.session.post(f"{self.base_url}/api/tournaments/{tournament_id}/join", json=join_data)
             success = response.status_code == 200
             
@@ -230,6 +227,32 @@ class CricketAPITester:
             self.log_test("Join Cricket Tournament", False, str(e))
             return False
 
+    def test_tournament_participants(self, tournament_id):
+        """Test the paginated participants endpoint lists the joined user"""
+        if not tournament_id:
+            self.log_test("Cricket Tournament Participants", False, "No tournament ID provided")
+            return False
+            
+        try:
+            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/participants", params={"q": "CricketFan2024"})
+            success = response.status_code == 200
+            
+            if success:
+                page = response.json()
+                user_ids = [p.get('userId') for p in page.get('participants', [])]
+                has_joined_user = self.joined_user_id in user_ids
+                success = has_joined_user and page.get('total', 0) >= 1
+                details = f"Participants page retrieved, Total: {page.get('total')}, Joined user listed: {has_joined_user}"
+            else:
+                details = f"HTTP {response.status_code}"
+                
+            self.log_test("Cricket Tournament Participants", success, details)
+            return success
+            
+        except Exception as e:
+            self.log_test("Cricket Tournament Participants", False, str(e))
+            return False
+
     def test_tournament_leaderboard(self, tournament_id):
         """Test cricket tournament leaderboard endpoint"""
         if not tournament_id:
@@ -237,13 +260,14 @@ class CricketAPITester:
             return False
             
         try:
-            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/leaderboard")
+            response = self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/leaderboard", stream=True)
             success = response.status_code == 200
             
             if success:
-                leaderboard = response.json()
-                is_array = isinstance(leaderboard, list)
-                details = f"Cricket leaderboard retrieved, Is array: {is_array}, Entries: {len(leaderboard)}"
+                report = validate_response(response, LEADERBOARD_VALIDATOR)
+                is_array = report.error is None
+                success = report.ok
+                details = f"Cricket leaderboard retrieved, Is array: {is_array}, Validated {report.summary()}"
             else:
                 details = f"HTTP {response.status_code}"
                 
@@ -285,7 +309,7 @@ class CricketAPITester:
                                        json=payload, timeout=30)
             
             # Note: This might fail if GEMINI_API_KEY is not set
-            if response.status_code == 500:
+            if response.status_code in (500, 503):
                 details = "AI service unavailable (likely missing API key) - Endpoint exists"
                 success = True  # We consider this a pass since the endpoint exists
             else:
@@ -328,7 +352,7 @@ class CricketAPITester:
                                        json=payload, timeout=30)
             
             # Similar to prediction, might fail without API key
-            if response.status_code == 500:
+            if response.status_code in (500, 503):
                 details = "AI service unavailable (likely missing API key) - Endpoint exists"
                 success = True  # Endpoint exists
             else:
@@ -462,6 +486,7 @@ class CricketAPITester:
         if tournament_created and tournament_id:
             self.test_get_tournament_details(tournament_id)
             self.test_join_tournament(tournament_id)
+            self.test_tournament_participants(tournament_id)
             self.test_tournament_leaderboard(tournament_id)
         
         # Test AI & Simulation features
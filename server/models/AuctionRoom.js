@@ -0,0 +1,370 @@
+const { systemClock } = require('../utils/VirtualClock');
+const EventLog = require('../utils/EventLog');
+
+// Pause between one lot closing and the next opening
+const LOT_GAP_MS = 2000;
+
+// Auction Room Class
+// Time comes from an injectable clock (real timers by default), so the same
+// state machine runs live in server.js and headless under a VirtualClock.
+// Every change is recorded as a compact event in a versioned log so
+// reconnecting clients can catch up without a full snapshot.
+class AuctionRoom {
+  constructor(roomId, hostId, settings, options = {}) {
+    this.roomId = roomId;
+    this.hostId = hostId;
+    this.settings = settings;
+    this.catalog = options.catalog || { players: [], byId: new Map() };
+    this.clock = options.clock || systemClock;
+    this.onEvent = options.onEvent || null; // (type, room, payload) after each logged event
+    this.eventLog = new EventLog(options.eventLogCapacity);
+    this.teams = new Map();
+    // settings.playerIds restricts the auction to a subset of the catalog, in that order
+    this.players = Array.isArray(settings.playerIds)
+      ? settings.playerIds.map(id => this.catalog.byId.get(id)).filter(Boolean)
+      : [...this.catalog.players];
+    this.customPlayers = new Map(); // players added during this auction only
+    this.currentAuction = null; // oldest open lot, or the last settled one between lots
+    // settings.parallelLots runs that many lots at once, each with its own deadline
+    this.parallelLots = Math.max(1, parseInt(settings.parallelLots, 10) || 1);
+    this.openLots = new Map(); // lotId (player id) -> lot, in opening order
+    this.lotTimers = new Map(); // lotId -> deadline timer
+    this.reserved = new Map(); // teamId -> total of the bids it leads on open lots
+    this.auctionHistory = []; // compact records: { playerId, teamId, price, timestamp, status, bids }
+    this.bidLog = []; // every accepted bid: { playerId, teamId, amount, timestamp }, for exports
+    this.historySummary = { sold: 0, unsold: 0, highestSale: 0 };
+    this.status = 'waiting'; // waiting, active, completed
+    this.currentPlayerIndex = 0;
+    this.nextLotTimers = new Set();
+    this.biddingSequence = [];
+    this.createdAt = this.clock.now();
+    this.completedAt = null;
+  }
+
+  get version() {
+    return this.eventLog.version;
+  }
+
+  // Log a state change and pass it on; payloads are self-contained deltas
+  emit(type, payload) {
+    this.eventLog.append(type, payload);
+    if (this.onEvent) {
+      this.onEvent(type, this, payload);
+    }
+  }
+
+  // Events since a client's last seen version, or null when it needs a snapshot
+  getEventsSince(version) {
+    return this.eventLog.since(version);
+  }
+
+  addTeam(teamId, teamData) {
+    const team = {
+      ...teamData,
+      players: [],
+      budget: this.settings.budget || 0,
+      remainingBudget: this.settings.budget || 0
+    };
+    this.teams.set(teamId, team);
+    this.emit('team-added', { team: { id: teamId, ...team, players: [] } });
+  }
+
+  removeTeam(teamId) {
+    if (this.teams.delete(teamId)) {
+      this.emit('team-removed', { teamId });
+    }
+  }
+
+  addCustomPlayer(player) {
+    this.customPlayers.set(player.id, player);
+    this.players.push(player);
+    this.emit('player-added', { player, totalPlayers: this.players.length });
+  }
+
+  getPlayer(playerId) {
+    return this.customPlayers.get(playerId) || this.catalog.byId.get(playerId);
+  }
+
+  get bidTimeoutMs() {
+    return (this.settings.bidTimeout || 30) * 1000;
+  }
+
+  startAuction() {
+    if (this.teams.size < 2) {
+      throw new Error('Need at least 2 teams to start auction');
+    }
+    this.status = 'active';
+    this.emit('auction-started', { status: this.status });
+    for (let i = 0; i < this.parallelLots; i++) {
+      this.openNextLot();
+    }
+  }
+
+  // Host skip: open the next lot now, closing the oldest one if every slot is taken
+  nextPlayer() {
+    const [pendingTimer] = this.nextLotTimers;
+    if (pendingTimer) {
+      this.clock.clearTimeout(pendingTimer);
+      this.nextLotTimers.delete(pendingTimer);
+    } else if (this.openLots.size >= this.parallelLots) {
+      const [oldestLot] = this.openLots.values();
+      this.closeLot(oldestLot, false);
+    }
+    return this.openNextLot();
+  }
+
+  openNextLot() {
+    if (this.currentPlayerIndex >= this.players.length) {
+      if (this.openLots.size === 0 && this.nextLotTimers.size === 0) {
+        this.completeAuction();
+      }
+      return null;
+    }
+
+    const player = this.players[this.currentPlayerIndex];
+    const lot = {
+      lotId: player.id,
+      player: player,
+      currentBid: this.settings.mode === 'standard' ? player.basePrice : 0,
+      highestBidder: null,
+      timeLeft: this.settings.bidTimeout || 30,
+      biddingHistory: [],
+      deadline: null
+    };
+
+    this.currentPlayerIndex++;
+    this.openLots.set(lot.lotId, lot);
+    if (!this.currentAuction || !this.openLots.has(this.currentAuction.lotId)) {
+      this.currentAuction = lot;
+    }
+    this.startBidTimer(lot);
+    this.emit('lot-opened', {
+      lot: this.snapshotLot(lot),
+      currentPlayerIndex: this.currentPlayerIndex
+    });
+    return lot;
+  }
+
+  // Budget a team can still commit to a lot: what remains after the bids it is
+  // leading on other open lots, so concurrent lots can never overspend
+  availableBudget(teamId, lot) {
+    const team = this.teams.get(teamId);
+    if (!team) {
+      return 0;
+    }
+    const reserved = this.reserved.get(teamId) || 0;
+    const ownBid = lot && lot.highestBidder === teamId ? lot.currentBid : 0;
+    return team.remainingBudget - reserved + ownBid;
+  }
+
+  reserve(teamId, amount) {
+    const reserved = (this.reserved.get(teamId) || 0) + amount;
+    if (reserved === 0) {
+      this.reserved.delete(teamId);
+    } else {
+      this.reserved.set(teamId, reserved);
+    }
+  }
+
+  // Bid on an open lot; without a lotId the bid goes to currentAuction
+  placeBid(teamId, amount, lotId) {
+    if (this.status !== 'active') {
+      throw new Error('No active auction');
+    }
+    const lot = lotId === undefined || lotId === null ? this.currentAuction : this.openLots.get(lotId);
+    if (!lot || !this.openLots.has(lot.lotId)) {
+      throw new Error(lotId === undefined || lotId === null ? 'No active auction' : 'Lot is not open');
+    }
+
+    if (this.settings.mode === 'standard') {
+      if (!this.teams.has(teamId) || this.availableBudget(teamId, lot) < amount) {
+        throw new Error('Insufficient budget');
+      }
+
+      if (amount <= lot.currentBid) {
+        throw new Error('Bid must be higher than current bid');
+      }
+    }
+
+    // Move the reservation from the previous leader to the new one
+    if (lot.highestBidder) {
+      this.reserve(lot.highestBidder, -lot.currentBid);
+    }
+    this.reserve(teamId, amount);
+
+    lot.currentBid = amount;
+    lot.highestBidder = teamId;
+    const bid = {
+      lotId: lot.lotId,
+      teamId,
+      amount,
+      timestamp: new Date(this.clock.now())
+    };
+    lot.biddingHistory.push(bid);
+    this.bidLog.push({ playerId: lot.player.id, teamId, amount, timestamp: this.clock.now() });
+
+    // Reset timer
+    lot.timeLeft = this.settings.bidTimeout || 30;
+    this.startBidTimer(lot);
+
+    this.emit('bid-placed', bid);
+    return lot;
+  }
+
+  // One timer per lot at its deadline; timeLeft is derived from it when read
+  startBidTimer(lot) {
+    this.clock.clearTimeout(this.lotTimers.get(lot.lotId));
+    lot.deadline = this.clock.now() + this.bidTimeoutMs;
+    this.lotTimers.set(lot.lotId, this.clock.setTimeout(() => this.closeLot(lot), this.bidTimeoutMs));
+  }
+
+  refreshTimeLeft(lot) {
+    if (lot && lot.deadline !== null) {
+      lot.timeLeft = Math.max(0, Math.ceil((lot.deadline - this.clock.now()) / 1000));
+    }
+  }
+
+  // Point-in-time copy of a lot for event payloads
+  snapshotLot(lot) {
+    return { ...lot, biddingHistory: [...lot.biddingHistory] };
+  }
+
+  // Settle a lot; the freed slot is refilled after the usual gap unless the host is skipping ahead
+  closeLot(lot, scheduleNext = true) {
+    this.clock.clearTimeout(this.lotTimers.get(lot.lotId));
+    this.lotTimers.delete(lot.lotId);
+    lot.deadline = null;
+    lot.timeLeft = 0;
+    this.openLots.delete(lot.lotId);
+
+    const playerId = lot.player.id;
+    let record;
+    let squadEntry = null;
+    let remainingBudget = null;
+    if (lot.highestBidder) {
+      // Player sold
+      const price = lot.currentBid;
+      const team = this.teams.get(lot.highestBidder);
+      this.reserve(lot.highestBidder, -price);
+      team.players.push({ playerId, soldPrice: price });
+
+      if (this.settings.mode === 'standard') {
+        team.remainingBudget -= price;
+      }
+      squadEntry = { ...this.getPlayer(playerId), soldPrice: price };
+      remainingBudget = team.remainingBudget;
+
+      record = {
+        playerId,
+        teamId: lot.highestBidder,
+        price,
+        timestamp: this.clock.now(),
+        status: 'sold',
+        bids: lot.biddingHistory.length
+      };
+      this.historySummary.sold++;
+      this.historySummary.highestSale = Math.max(this.historySummary.highestSale, price);
+    } else {
+      // Player unsold
+      record = {
+        playerId,
+        teamId: null,
+        price: null,
+        timestamp: this.clock.now(),
+        status: 'unsold',
+        bids: 0
+      };
+      this.historySummary.unsold++;
+    }
+    this.auctionHistory.push(record);
+
+    // Keep showing the settled lot until another one takes its place
+    if (this.currentAuction === lot && this.openLots.size > 0) {
+      this.currentAuction = this.openLots.values().next().value;
+    }
+    this.emit('lot-closed', { lotId: lot.lotId, record, squadEntry, remainingBudget });
+
+    // Move to next player
+    if (scheduleNext) {
+      const timer = this.clock.setTimeout(() => {
+        this.nextLotTimers.delete(timer);
+        this.openNextLot();
+      }, LOT_GAP_MS);
+      this.nextLotTimers.add(timer);
+    }
+  }
+
+  completeAuction() {
+    this.status = 'completed';
+    this.completedAt = this.clock.now();
+    this.currentAuction = null;
+    this.lotTimers.forEach(timer => this.clock.clearTimeout(timer));
+    this.lotTimers.clear();
+    this.openLots.clear();
+    this.nextLotTimers.forEach(timer => this.clock.clearTimeout(timer));
+    this.nextLotTimers.clear();
+    this.reserved.clear();
+    this.emit('auction-completed', { status: this.status, historySummary: { ...this.historySummary } });
+  }
+
+  // Expand a team's compact squad entries against the catalog for display
+  resolveSquad(team) {
+    return team.players.map(({ playerId, soldPrice }) => ({ ...this.getPlayer(playerId), soldPrice }));
+  }
+
+  // Page through the compact history; the full list is served by /api/room/:roomId/history
+  getHistory(offset = 0, limit = 50) {
+    return this.auctionHistory.slice(offset, offset + limit);
+  }
+
+  getState() {
+    this.openLots.forEach(lot => this.refreshTimeLeft(lot));
+    return {
+      roomId: this.roomId,
+      version: this.version,
+      settings: this.settings,
+      teams: Array.from(this.teams.entries()).map(([id, team]) => ({ id, ...team, players: this.resolveSquad(team) })),
+      currentAuction: this.currentAuction,
+      openLots: Array.from(this.openLots.values()),
+      parallelLots: this.parallelLots,
+      recentHistory: this.auctionHistory.slice(-10),
+      historyCount: this.auctionHistory.length,
+      historySummary: this.historySummary,
+      status: this.status,
+      totalPlayers: this.players.length,
+      currentPlayerIndex: this.currentPlayerIndex
+    };
+  }
+
+  // Compact view for read-only spectators: open lots with the top bid and countdown, no bid history
+  getSpectatorSummary() {
+    const lots = [];
+    this.openLots.forEach(lot => {
+      this.refreshTimeLeft(lot);
+      const leader = lot.highestBidder ? this.teams.get(lot.highestBidder) : null;
+      lots.push({
+        lotId: lot.lotId,
+        playerName: lot.player.name,
+        role: lot.player.role,
+        currentBid: lot.currentBid,
+        leader: leader ? leader.name : null,
+        bids: lot.biddingHistory.length,
+        timeLeft: lot.timeLeft
+      });
+    });
+    return {
+      roomId: this.roomId,
+      version: this.version,
+      status: this.status,
+      lots,
+      teams: this.teams.size,
+      sold: this.historySummary.sold,
+      totalPlayers: this.players.length,
+      currentPlayerIndex: this.currentPlayerIndex
+    };
+  }
+}
+
+AuctionRoom.LOT_GAP_MS = LOT_GAP_MS;
+
+module.exports = AuctionRoom;
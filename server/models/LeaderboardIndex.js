@@ -0,0 +1,129 @@
+// Ordered participant index: points descending, then join order.
+// Rank, top-N and rank-window lookups are binary searches over a sorted array.
+class LeaderboardIndex {
+  constructor() {
+    this.entries = [];        // sorted { userId, points, seq }
+    this.byUser = new Map();  // userId -> entry
+    this.nextSeq = 0;
+  }
+
+  get size() {
+    return this.entries.length;
+  }
+
+  compare(a, b) {
+    return (b.points - a.points) || (a.seq - b.seq);
+  }
+
+  // First position whose entry does not sort before the given one
+  lowerBound(entry) {
+    let low = 0;
+    let high = this.entries.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.compare(this.entries[mid], entry) < 0) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
+  insert(userId, points = 0) {
+    const entry = { userId, points, seq: this.nextSeq++ };
+    this.byUser.set(userId, entry);
+    this.entries.splice(this.lowerBound(entry), 0, entry);
+  }
+
+  remove(userId) {
+    const entry = this.byUser.get(userId);
+    if (!entry) {
+      return;
+    }
+    this.entries.splice(this.lowerBound(entry), 1);
+    this.byUser.delete(userId);
+  }
+
+  update(userId, points) {
+    const entry = this.byUser.get(userId);
+    if (!entry || entry.points === points) {
+      return;
+    }
+    this.entries.splice(this.lowerBound(entry), 1);
+    entry.points = points;
+    this.entries.splice(this.lowerBound(entry), 0, entry);
+  }
+
+  // 1-based rank, or null when the user is not in the index
+  rankOf(userId) {
+    const entry = this.byUser.get(userId);
+    return entry ? this.lowerBound(entry) + 1 : null;
+  }
+
+  // Join-order tie-break for a user, or null when not indexed
+  seqOf(userId) {
+    const entry = this.byUser.get(userId);
+    return entry ? entry.seq : null;
+  }
+
+  // Entries for ranks [start + 1, end]
+  slice(start, end) {
+    return this.entries.slice(Math.max(start, 0), end);
+  }
+
+  // Apply bulk point changes (e.g. a full re-score) with one linear merge:
+  // unchanged entries stay sorted, so only the moved ones need sorting
+  rebuild(pointsByUser) {
+    const kept = [];
+    const moved = [];
+    this.entries.forEach(entry => {
+      const points = pointsByUser.get(entry.userId);
+      if (points === undefined || points === entry.points) {
+        kept.push(entry);
+      } else {
+        entry.points = points;
+        moved.push(entry);
+      }
+    });
+    if (moved.length === 0) {
+      return;
+    }
+    moved.sort((a, b) => this.compare(a, b));
+
+    const merged = new Array(this.entries.length);
+    let i = 0;
+    let j = 0;
+    for (let k = 0; k < merged.length; k++) {
+      if (j >= moved.length || (i < kept.length && this.compare(kept[i], moved[j]) < 0)) {
+        merged[k] = kept[i++];
+      } else {
+        merged[k] = moved[j++];
+      }
+    }
+    this.entries = merged;
+  }
+
+  // Adopt an ordering computed elsewhere (a worker re-score): userIds sorted by
+  // compare() with their new points. Users it doesn't mention keep their points
+  // and are slotted back in; ids no longer indexed are skipped.
+  loadSorted(userIds, points) {
+    const entries = [];
+    userIds.forEach((userId, i) => {
+      const entry = this.byUser.get(userId);
+      if (entry) {
+        entry.points = points[i];
+        entries.push(entry);
+      }
+    });
+    let missing = [];
+    if (entries.length < this.entries.length) {
+      const listed = new Set(entries);
+      missing = this.entries.filter(entry => !listed.has(entry));
+    }
+    this.entries = entries;
+    missing.forEach(entry => this.entries.splice(this.lowerBound(entry), 0, entry));
+  }
+}
+
+module.exports = LeaderboardIndex;
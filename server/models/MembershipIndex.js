@@ -0,0 +1,122 @@
+// Per-user index of live sockets, auction rooms and tournaments, so "my rooms and
+// tournaments" and pushes to every device a user has open are lookups, not scans.
+// Room and tournament memberships outlive sockets (a user reconnecting or opening
+// another tab still belongs); a user's entry is dropped once it holds nothing.
+class MembershipIndex {
+  constructor() {
+    this.users = new Map(); // userId -> { sockets: Set, rooms: Map(roomId -> role), tournaments: Map(tournamentId -> role) }
+    this.onChange = null; // (userId) => void, after room or tournament membership changes
+  }
+
+  get size() {
+    return this.users.size;
+  }
+
+  entry(userId) {
+    let entry = this.users.get(userId);
+    if (!entry) {
+      entry = { sockets: new Set(), rooms: new Map(), tournaments: new Map() };
+      this.users.set(userId, entry);
+    }
+    return entry;
+  }
+
+  prune(userId, entry) {
+    if (entry.sockets.size === 0 && entry.rooms.size === 0 && entry.tournaments.size === 0) {
+      this.users.delete(userId);
+    }
+  }
+
+  // Record a socket registering as userId (one user may have many)
+  addSocket(userId, socketId) {
+    if (userId === undefined || userId === null) {
+      return;
+    }
+    this.entry(userId).sockets.add(socketId);
+  }
+
+  removeSocket(userId, socketId) {
+    const entry = this.users.get(userId);
+    if (entry && entry.sockets.delete(socketId)) {
+      this.prune(userId, entry);
+    }
+  }
+
+  // Socket ids of every connected device the user has registered from
+  socketsOf(userId) {
+    const entry = this.users.get(userId);
+    return entry ? Array.from(entry.sockets) : [];
+  }
+
+  // Role is 'host' or 'member' for rooms; a host stays host if they also join
+  joinRoom(userId, roomId, role = 'member') {
+    this.join(userId, 'rooms', roomId, role, 'host');
+  }
+
+  leaveRoom(userId, roomId) {
+    this.leave(userId, 'rooms', roomId);
+  }
+
+  // Role is 'admin' or 'participant' for tournaments
+  joinTournament(userId, tournamentId, role = 'participant') {
+    this.join(userId, 'tournaments', tournamentId, role, 'admin');
+  }
+
+  leaveTournament(userId, tournamentId) {
+    this.leave(userId, 'tournaments', tournamentId);
+  }
+
+  // Unregistered sockets (no userId yet) are not tracked
+  join(userId, kind, id, role, ownerRole) {
+    if (userId === undefined || userId === null) {
+      return;
+    }
+    const memberships = this.entry(userId)[kind];
+    const current = memberships.get(id);
+    if (current === role || current === ownerRole) {
+      return;
+    }
+    memberships.set(id, role);
+    this.notifyChange(userId);
+  }
+
+  leave(userId, kind, id) {
+    const entry = this.users.get(userId);
+    if (!entry || !entry[kind].delete(id)) {
+      return;
+    }
+    this.prune(userId, entry);
+    this.notifyChange(userId);
+  }
+
+  notifyChange(userId) {
+    if (this.onChange) {
+      this.onChange(userId);
+    }
+  }
+
+  // Room and tournament ids with roles, in the order they were joined
+  getMemberships(userId) {
+    const entry = this.users.get(userId);
+    return {
+      userId,
+      devices: entry ? entry.sockets.size : 0,
+      rooms: entry ? Array.from(entry.rooms, ([roomId, role]) => ({ roomId, role })) : [],
+      tournaments: entry ? Array.from(entry.tournaments, ([tournamentId, role]) => ({ tournamentId, role })) : []
+    };
+  }
+
+  getStats() {
+    let sockets = 0;
+    let rooms = 0;
+    let tournaments = 0;
+    this.users.forEach(entry => {
+      sockets += entry.sockets.size;
+      rooms += entry.rooms.size;
+      tournaments += entry.tournaments.size;
+    });
+    return { users: this.users.size, sockets, roomMemberships: rooms, tournamentMemberships: tournaments };
+  }
+}
+
+module.exports = MembershipIndex;
@@ -1,20 +1,33 @@
-const axios = require('axios');
+const SyntheticMatchFeed = require('../utils/SyntheticMatchFeed');
+const MatchDataFetcher = require('../utils/MatchDataFetcher');
 
 // Performance Tracking System for Real Cricket Data
 class PerformanceTracker {
   constructor() {
     this.tournaments = new Map(); // tournamentId -> Tournament instance
-    this.apiEndpoints = {
-      // These would be real cricket data APIs in production
-      ipl: 'https://api.cricapi.com/v1/matches',
-      testSeries: 'https://api.cricapi.com/v1/series'
-    };
     this.updateInterval = null;
+    this.pollIntervalMs = parseInt(process.env.MATCH_DATA_POLL_MS, 10) || 15 * 60 * 1000;
+    this.matchDataUrl = process.env.MATCH_DATA_URL || null; // unset: periodic updates use the mock feed
+    this.fetchers = new Map(); // realTournament -> MatchDataFetcher shared by its tournaments
+    this.caughtUp = new Set(); // tournamentIds holding every line their fetcher has seen
+    this.broadcaster = null; // LeaderboardBroadcaster, set once Socket.io is up
+    this.mockFeeds = new Map(); // tournamentId -> over-by-over feed behind the periodic mock updates
+    this.syntheticFeeds = new Map(); // tournamentId -> rate-driven SyntheticMatchFeed started by an admin
+  }
+
+  // Attach the Socket.io leaderboard broadcaster
+  setBroadcaster(broadcaster) {
+    this.broadcaster = broadcaster;
   }
 
   // Register tournament for tracking
   registerTournament(tournament) {
     this.tournaments.set(tournament.id, tournament);
+    if (tournament.settings.realTournament) {
+      const fetcher = this.getFetcher(tournament.settings.realTournament);
+      fetcher.subscribe(tournament);
+      this.catchUp(fetcher, tournament);
+    }
     
     // Start performance tracking if this is the first tournament
     if (this.tournaments.size === 1) {
@@ -24,7 +37,21 @@ class PerformanceTracker {
 
   // Unregister tournament
   unregisterTournament(tournamentId) {
+    const tournament = this.tournaments.get(tournamentId);
+    const fetcher = tournament && this.fetchers.get(tournament.settings.realTournament);
+    if (fetcher) {
+      fetcher.unsubscribe(tournamentId);
+      if (fetcher.subscriberCount === 0) {
+        this.fetchers.delete(tournament.settings.realTournament);
+      }
+    }
     this.tournaments.delete(tournamentId);
+    this.caughtUp.delete(tournamentId);
+    this.stopSyntheticFeed(tournamentId);
+    this.mockFeeds.delete(tournamentId);
+    if (this.broadcaster) {
+      this.broadcaster.forget(tournamentId);
+    }
     
     // Stop tracking if no tournaments left
     if (this.tournaments.size === 0) {
@@ -32,12 +59,25 @@ class PerformanceTracker {
     }
   }
 
+  // Shared upstream fetcher for a real tournament, created on first use
+  getFetcher(realTournament) {
+    let fetcher = this.fetchers.get(realTournament);
+    if (!fetcher) {
+      fetcher = new MatchDataFetcher(realTournament, {
+        url: this.matchDataUrl,
+        onChanges: changes => this.applyMatchDataChanges(fetcher, changes)
+      });
+      this.fetchers.set(realTournament, fetcher);
+    }
+    return fetcher;
+  }
+
   // Start periodic performance updates
   startPerformanceTracking() {
-    // Update every 15 minutes during matches
+    // Update every 15 minutes during matches unless MATCH_DATA_POLL_MS says otherwise
     this.updateInterval = setInterval(() => {
       this.updateAllTournaments();
-    }, 15 * 60 * 1000);
+    }, this.pollIntervalMs);
   }
 
   // Stop performance tracking
@@ -50,6 +90,12 @@ class PerformanceTracker {
 
   // Update all active tournaments
   async updateAllTournaments() {
+    if (this.matchDataUrl) {
+      // One upstream request per real tournament, fanned out to its fantasy tournaments
+      await Promise.all(Array.from(this.fetchers.values()).map(fetcher => this.updateFromMatchData(fetcher)));
+      return;
+    }
+
     for (const tournament of this.tournaments.values()) {
       if (tournament.status === 'tournament_active') {
         await this.updateTournamentPerformance(tournament);
@@ -65,7 +111,7 @@ class PerformanceTracker {
       const mockPerformances = this.generateMockPerformance(tournament);
       
       mockPerformances.forEach(performance => {
-        tournament.updatePlayerPerformance(performance.playerId, performance.stats);
+        tournament.updatePlayerPerformance(performance.playerId, performance.stats, performance.matchId);
       });
 
       // Broadcast updates to all tournament participants
@@ -76,108 +122,164 @@ class PerformanceTracker {
     }
   }
 
-  // Generate mock performance data for testing
-  generateMockPerformance(tournament) {
-    const performances = [];
-    
-    // Get all players from all squads
-    const allPlayers = new Set();
-    tournament.participants.forEach(participant => {
-      participant.squad.forEach(player => allPlayers.add(player));
-    });
+  // Poll one real tournament's feed while any of its fantasy tournaments is live
+  async updateFromMatchData(fetcher) {
+    const live = Array.from(fetcher.subscribers.values()).filter(t => t.status === 'tournament_active');
+    if (live.length > 0) {
+      // Tournaments that went live since the last poll first get the lines they missed
+      live.forEach(tournament => this.catchUp(fetcher, tournament));
+      await fetcher.refresh();
+    }
+  }
 
-    // Generate random performance updates for some players
-    const playersToUpdate = Array.from(allPlayers).slice(0, Math.floor(Math.random() * 5) + 1);
-    
-    playersToUpdate.forEach(player => {
-      const performance = {
-        playerId: player.id,
-        stats: {}
-      };
+  // Apply every line the fetcher already holds to a tournament that has just
+  // subscribed or gone live, so it scores the same as tournaments that were live
+  // all along. Inactive tournaments wait; they are caught up once live.
+  catchUp(fetcher, tournament) {
+    if (tournament.status !== 'tournament_active' || this.caughtUp.has(tournament.id)) {
+      return;
+    }
+    this.caughtUp.add(tournament.id);
+    const lines = fetcher.currentLines();
+    if (lines.length === 0) {
+      return;
+    }
+    try {
+      lines.forEach(line => {
+        tournament.updatePlayerPerformance(line.playerId, line.stats, line.matchId);
+      });
+      this.broadcastPerformanceUpdate(tournament);
+    } catch (error) {
+      console.error(`Error updating tournament ${tournament.id} performance:`, error);
+    }
+  }
 
-      // Generate stats based on player role
-      switch (player.role) {
-        case 'Batsman':
-          performance.stats.runs = Math.floor(Math.random() * 100);
-          performance.stats.catches = Math.floor(Math.random() * 3);
-          if (performance.stats.runs >= 50) {
-            performance.stats.fifties = performance.stats.runs >= 100 ? 0 : 1;
-            performance.stats.centuries = performance.stats.runs >= 100 ? 1 : 0;
-          }
-          break;
-          
-        case 'Bowler':
-          performance.stats.wickets = Math.floor(Math.random() * 6);
-          performance.stats.catches = Math.floor(Math.random() * 2);
-          if (performance.stats.wickets >= 5) {
-            performance.stats.fiveWickets = 1;
-          }
-          break;
-          
-        case 'All-rounder':
-          performance.stats.runs = Math.floor(Math.random() * 60);
-          performance.stats.wickets = Math.floor(Math.random() * 4);
-          performance.stats.catches = Math.floor(Math.random() * 3);
-          break;
-          
-        case 'Wicket-Keeper':
-          performance.stats.runs = Math.floor(Math.random() * 50);
-          performance.stats.catches = Math.floor(Math.random() * 5);
-          performance.stats.stumpings = Math.floor(Math.random() * 2);
-          break;
+  // Fan changed stat lines out to every active tournament tracking the fetcher's real tournament
+  applyMatchDataChanges(fetcher, changes) {
+    fetcher.subscribers.forEach(tournament => {
+      if (tournament.status !== 'tournament_active') {
+        return;
       }
-
-      // Add random run-outs
-      if (Math.random() > 0.8) {
-        performance.stats.runOuts = 1;
+      if (!this.caughtUp.has(tournament.id)) {
+        // The fetcher's lines already include these changes
+        this.catchUp(fetcher, tournament);
+        return;
+      }
+      try {
+        changes.forEach(change => {
+          tournament.updatePlayerPerformance(change.playerId, change.stats, change.matchId);
+        });
+        this.broadcastPerformanceUpdate(tournament);
+      } catch (error) {
+        console.error(`Error updating tournament ${tournament.id} performance:`, error);
       }
+    });
+  }
 
-      performances.push(performance);
+  getMatchDataStats() {
+    return {
+      source: this.matchDataUrl ? 'upstream' : 'mock',
+      pollIntervalMs: this.pollIntervalMs,
+      fetchers: Array.from(this.fetchers.values()).map(fetcher => fetcher.getStats())
+    };
+  }
+
+  // Squad players across all participants, one entry per player
+  getSquadPlayers(tournament) {
+    const players = new Map();
+    tournament.participants.forEach(participant => {
+      participant.squad.forEach(player => players.set(player.id, player));
     });
+    return Array.from(players.values());
+  }
+
+  // Generate mock performance data for testing: the next over of a feed seeded
+  // from the tournament id, so the same tournament always sees the same match
+  generateMockPerformance(tournament) {
+    let feed = this.mockFeeds.get(tournament.id);
+    if (!feed) {
+      const players = this.getSquadPlayers(tournament);
+      if (players.length < 2) {
+        return [];
+      }
+      const seed = Array.from(tournament.id).reduce((hash, char) => (Math.imul(hash, 31) + char.charCodeAt(0)) >>> 0, 7);
+      feed = new SyntheticMatchFeed(players, { seed, granularity: 'over', matchPrefix: `mock-${tournament.id}` });
+      this.mockFeeds.set(tournament.id, feed);
+    }
+
+    const event = feed.next();
+    if (!event) {
+      return [];
+    }
+    return event.updates.map(update => ({ ...update, matchId: event.matchId }));
+  }
+
+  // Drive a tournament's scoring from a seeded synthetic feed at options.eventsPerSecond.
+  // Restarting with the same seed and squads replays the exact same stat stream.
+  startSyntheticFeed(tournament, options = {}) {
+    this.stopSyntheticFeed(tournament.id);
+    const feed = new SyntheticMatchFeed(this.getSquadPlayers(tournament), options);
+    feed.start(
+      event => this.applyFeedEvent(tournament, event),
+      () => console.log(`Synthetic feed for tournament ${tournament.id} finished after ${feed.emitted} events`)
+    );
+    this.syntheticFeeds.set(tournament.id, feed);
+    return feed;
+  }
+
+  stopSyntheticFeed(tournamentId) {
+    const feed = this.syntheticFeeds.get(tournamentId);
+    if (!feed) {
+      return null;
+    }
+    feed.stop();
+    this.syntheticFeeds.delete(tournamentId);
+    return feed;
+  }
 
-    return performances;
+  // Apply one feed event through the normal performance update path
+  applyFeedEvent(tournament, event) {
+    event.updates.forEach(update => {
+      tournament.updatePlayerPerformance(update.playerId, update.stats, event.matchId);
+    });
+    this.broadcastPerformanceUpdate(tournament);
   }
 
   // Broadcast performance updates to tournament participants
   broadcastPerformanceUpdate(tournament) {
-    // This would integrate with the Socket.io system
-    // For now, just log the update
+    if (this.broadcaster) {
+      // Coalesced top-N diff plus per-participant rank over Socket.io
+      this.broadcaster.schedule(tournament);
+      return;
+    }
     console.log(`Performance updated for tournament ${tournament.id}`);
     console.log(`Current leaderboard:`, tournament.leaderboard.slice(0, 3));
   }
 
   // Manual performance update (for testing/admin use)
-  updatePlayerPerformance(tournamentId, playerId, performance) {
+  updatePlayerPerformance(tournamentId, playerId, performance, matchId) {
     const tournament = this.tournaments.get(tournamentId);
     if (tournament) {
-      tournament.updatePlayerPerformance(playerId, performance);
+      tournament.updatePlayerPerformance(playerId, performance, matchId);
       this.broadcastPerformanceUpdate(tournament);
       return true;
     }
     return false;
   }
 
-  // Get real-time match data (placeholder for API integration)
-  async getRealTimeMatchData(tournamentType) {
-    // In production, this would integrate with cricket APIs like:
-    // - CricAPI
-    // - ESPN Cricinfo API  
-    // - Official IPL API
-    
-    try {
-      // Example API call structure (would need real API keys)
-      // const response = await axios.get(`${this.apiEndpoints[tournamentType]}?apikey=${API_KEY}`);
-      // return response.data;
-      
-      // For now, return mock data
+  // Latest upstream match document for a real tournament, through its shared fetcher and cache
+  async getRealTimeMatchData(realTournament) {
+    if (!this.matchDataUrl) {
       return {
         matches: [],
-        message: 'Real-time data integration requires cricket API setup'
+        message: 'Real-time data integration requires MATCH_DATA_URL'
       };
-    } catch (error) {
-      console.error('Error fetching real-time data:', error);
-      return null;
     }
+
+    // Reuse the shared fetcher when tournaments track this real tournament; don't keep one for ad-hoc lookups
+    const fetcher = this.fetchers.get(realTournament) || new MatchDataFetcher(realTournament, { url: this.matchDataUrl });
+    const document = await fetcher.refresh();
+    return document || { matches: [] };
   }
 }
 
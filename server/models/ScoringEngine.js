@@ -0,0 +1,116 @@
+// Versioned fantasy scoring rules for Sport X
+
+// Rule tables by version. Published versions are never edited in place:
+// add a new version so past tournaments can still be re-scored exactly.
+const RULE_TABLES = {
+  1: {
+    runs: 1,           // 1 point per run
+    wickets: 25,       // 25 points per wicket
+    catches: 10,       // 10 points per catch
+    stumpings: 15,     // 15 points per stumping
+    runOuts: 10,       // 10 points per run-out
+    fifties: 25,       // Bonus for 50s
+    centuries: 50,     // Bonus for 100s
+    fiveWickets: 50    // Bonus for 5-wicket hauls
+  }
+};
+
+const CURRENT_VERSION = 1;
+
+// Turn a rule table into a scoring function over parallel stat/weight arrays
+function compileRuleTable(table) {
+  const stats = Object.keys(table);
+  const weights = stats.map(stat => table[stat]);
+
+  return (statLine) => {
+    let total = 0;
+    for (let i = 0; i < stats.length; i++) {
+      total += (statLine[stats[i]] || 0) * weights[i];
+    }
+    return total;
+  };
+}
+
+class ScoringEngine {
+  constructor() {
+    this.compiled = new Map(); // version -> scoring function
+    Object.keys(RULE_TABLES).forEach(version => this.registerRuleTable(Number(version), RULE_TABLES[version]));
+  }
+
+  registerRuleTable(version, table) {
+    if (this.compiled.has(version)) {
+      throw new Error(`Scoring rules version ${version} already registered`);
+    }
+    RULE_TABLES[version] = table;
+    this.compiled.set(version, compileRuleTable(table));
+  }
+
+  hasVersion(version) {
+    return this.compiled.has(version);
+  }
+
+  getScorer(version = CURRENT_VERSION) {
+    const scorer = this.compiled.get(version);
+    if (!scorer) {
+      throw new Error(`Unknown scoring rules version ${version}`);
+    }
+    return scorer;
+  }
+
+  getRuleTable(version = CURRENT_VERSION) {
+    return RULE_TABLES[version];
+  }
+
+  // Points for one stat line
+  score(statLine, version = CURRENT_VERSION) {
+    return this.getScorer(version)(statLine);
+  }
+
+  // Points and summed stats for every match a player has in the ledger
+  scorePlayer(matches, version = CURRENT_VERSION) {
+    const scorer = this.getScorer(version);
+    const totals = {};
+    let totalPoints = 0;
+
+    matches.forEach(statLine => {
+      totalPoints += scorer(statLine);
+      Object.keys(statLine).forEach(stat => {
+        if (typeof statLine[stat] === 'number') {
+          totals[stat] = (totals[stat] || 0) + statLine[stat];
+        }
+      });
+    });
+
+    return { ...totals, totalPoints, matches: matches.size };
+  }
+
+  // Fold one added or replaced stat line into a scorePlayer result without rescanning the ledger
+  applyLineChange(performance, previousLine, nextLine, version = CURRENT_VERSION) {
+    const scorer = this.getScorer(version);
+    const next = { ...performance, totalPoints: performance.totalPoints + scorer(nextLine) };
+
+    if (previousLine) {
+      next.totalPoints -= scorer(previousLine);
+      Object.keys(previousLine).forEach(stat => {
+        if (typeof previousLine[stat] === 'number') {
+          next[stat] -= previousLine[stat];
+        }
+      });
+    } else {
+      next.matches++;
+    }
+    Object.keys(nextLine).forEach(stat => {
+      if (typeof nextLine[stat] === 'number') {
+        next[stat] = (next[stat] || 0) + nextLine[stat];
+      }
+    });
+    return next;
+  }
+}
+
+// Engines are stateless apart from the rule tables, so share one instance
+const scoringEngine = new ScoringEngine();
+
+module.exports = scoringEngine;
+module.exports.ScoringEngine = ScoringEngine;
+module.exports.CURRENT_VERSION = CURRENT_VERSION;
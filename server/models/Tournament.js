@@ -1,4 +1,25 @@
 const { v4: uuidv4 } = require('uuid');
+const scoringEngine = require('./ScoringEngine');
+const LeaderboardIndex = require('./LeaderboardIndex');
+const EventLog = require('../utils/EventLog');
+
+// Stat lines or squad entries handled between event-loop yields during a worker re-score
+const RESCORE_SLICE = 1024;
+
+// Leaderboard rows carried in the lean state; deeper ranks come from the leaderboard endpoints
+const STATE_LEADERBOARD_SIZE = 10;
+
+// Async step that yields to the event loop once `budget` units of work have passed
+const workSlicer = (budget = RESCORE_SLICE) => {
+  let done = 0;
+  return async (units) => {
+    done += units;
+    if (done >= budget) {
+      done = 0;
+      await new Promise(resolve => setImmediate(resolve));
+    }
+  };
+};
 
 // Tournament Management System for Sport X
 class Tournament {
@@ -21,7 +42,8 @@ class Tournament {
       auctionSettings: {
         bidIncrement: settings.auctionSettings?.bidIncrement || 50000, // £50k default
         bidTimeout: settings.auctionSettings?.bidTimeout || 30, // 30 seconds default
-        minimumBid: settings.auctionSettings?.minimumBid || 100000 // £100k minimum
+        minimumBid: settings.auctionSettings?.minimumBid || 100000, // £100k minimum
+        parallelLots: settings.auctionSettings?.parallelLots || 1 // lots open at once
       },
       auctionDate: settings.auctionDate,
       tournamentStart: settings.tournamentStart,
@@ -29,12 +51,49 @@ class Tournament {
     };
     
     this.participants = new Map(); // userId -> participant data
+    this.joinOrder = []; // userIds in join order, for participant paging
+    this.paidCount = 0; // participants with entryFeePaid
     this.prizePool = 0;
     this.status = 'created'; // created, auction_scheduled, auction_active, tournament_active, completed
     this.selectedPlayers = settings.selectedPlayers || [];
     this.chatMessages = [];
-    this.leaderboard = [];
+    this.rankIndex = new LeaderboardIndex(); // ordered by points for rank queries
+    this.leaderboardCache = null; // full leaderboard, rebuilt lazily after changes
+    this.scoringVersion = settings.scoringVersion || scoringEngine.CURRENT_VERSION;
+    this.ledger = new Map(); // playerId -> Map(matchId -> stat line)
+    this.playerPoints = new Map(); // playerId -> points under scoringVersion
+    this.playerPerformance = new Map(); // playerId -> scored totals, kept in step with the ledger
+    this.scoreAudit = []; // corrections and re-scores, oldest first
+    this.pendingUpdates = null; // stat lines held back while a worker re-score runs
     this.createdAt = new Date();
+    this.onChange = null; // set by TournamentRegistry to keep its indexes current
+    // Versioned membership, status and chat changes for reconnect catch-up;
+    // points travel on the leaderboard channel instead
+    this.eventLog = new EventLog();
+  }
+
+  get version() {
+    return this.eventLog.version;
+  }
+
+  // Events since a client's last seen version, or null when it needs a snapshot
+  getEventsSince(version) {
+    return this.eventLog.since(version);
+  }
+
+  // Notify the registry that listing-visible state changed
+  notifyChange(previousStatus = this.status) {
+    if (this.onChange) {
+      this.onChange(this, previousStatus);
+    }
+  }
+
+  // Move the tournament to a new lifecycle status
+  setStatus(status) {
+    const previousStatus = this.status;
+    this.status = status;
+    this.eventLog.append('status-changed', { status });
+    this.notifyChange(previousStatus);
   }
 
   // Add participant to tournament
@@ -59,23 +118,31 @@ class Tournament {
     };
 
     this.participants.set(userId, participant);
+    this.joinOrder.push(userId);
+    this.rankIndex.insert(userId, participant.points);
+    this.updateLeaderboard(); // the cached full leaderboard lacks the new row
     this.updatePrizePool();
+    this.eventLog.append('participant-joined', { participant: { id: userId, ...participant, squad: [] } });
+    this.notifyChange();
     return participant;
   }
 
   // Update prize pool based on entry fees
   updatePrizePool() {
-    const paidParticipants = Array.from(this.participants.values())
-      .filter(p => p.entryFeePaid).length;
-    this.prizePool = paidParticipants * this.settings.entryFee;
+    this.prizePool = this.paidCount * this.settings.entryFee;
   }
 
   // Mark entry fee as paid
   markEntryFeePaid(userId) {
     const participant = this.participants.get(userId);
     if (participant) {
-      participant.entryFeePaid = true;
+      if (!participant.entryFeePaid) {
+        participant.entryFeePaid = true;
+        this.paidCount++;
+      }
       this.updatePrizePool();
+      this.eventLog.append('entry-fee-paid', { userId, prizePool: this.prizePool });
+      this.notifyChange();
     }
   }
 
@@ -98,6 +165,7 @@ class Tournament {
       this.chatMessages = this.chatMessages.slice(-100);
     }
     
+    this.eventLog.append('chat-message', { message: chatMessage });
     return chatMessage;
   }
 
@@ -113,88 +181,420 @@ class Tournament {
     };
     
     this.chatMessages.push(systemMessage);
+    this.eventLog.append('chat-message', { message: systemMessage });
     return systemMessage;
   }
 
-  // Update player performance and calculate points
-  updatePlayerPerformance(playerId, performance) {
-    // Points system as per requirements
-    const pointsSystem = {
-      runs: 1,           // 1 point per run
-      wickets: 25,       // 25 points per wicket
-      catches: 10,       // 10 points per catch
-      stumpings: 15,     // 15 points per stumping
-      runOuts: 10,       // 10 points per run-out
-      fifties: 25,       // Bonus for 50s
-      centuries: 50,     // Bonus for 100s
-      fiveWickets: 50    // Bonus for 5-wicket hauls
-    };
+  // Record a player's stat line for a match and update points.
+  // Without a matchId the line is treated as season totals, as before.
+  updatePlayerPerformance(playerId, performance, matchId = 'season') {
+    if (this.pendingUpdates) {
+      this.pendingUpdates.push([playerId, performance, matchId]);
+      return;
+    }
+    if (!this.ledger.has(playerId)) {
+      this.ledger.set(playerId, new Map());
+    }
+    const matches = this.ledger.get(playerId);
+    const previousLine = matches.get(matchId);
+    const nextLine = { ...performance };
+    matches.set(matchId, nextLine);
 
-    let totalPoints = 0;
-    
-    // Calculate points based on performance
-    totalPoints += (performance.runs || 0) * pointsSystem.runs;
-    totalPoints += (performance.wickets || 0) * pointsSystem.wickets;
-    totalPoints += (performance.catches || 0) * pointsSystem.catches;
-    totalPoints += (performance.stumpings || 0) * pointsSystem.stumpings;
-    totalPoints += (performance.runOuts || 0) * pointsSystem.runOuts;
-    
-    // Bonus points
-    if (performance.fifties) totalPoints += performance.fifties * pointsSystem.fifties;
-    if (performance.centuries) totalPoints += performance.centuries * pointsSystem.centuries;
-    if (performance.fiveWickets) totalPoints += performance.fiveWickets * pointsSystem.fiveWickets;
+    this.applyPlayerScore(playerId, previousLine, nextLine);
+    this.updateLeaderboard();
+  }
+
+  // Replace a recorded stat line, keeping the previous value in the audit log
+  correctPlayerPerformance(playerId, matchId, performance, source = 'official') {
+    if (this.pendingUpdates) {
+      throw new Error('A re-score is running; retry the correction shortly');
+    }
+    const matches = this.ledger.get(playerId);
+    if (!matches || !matches.has(matchId)) {
+      throw new Error('No stat line recorded for this player and match');
+    }
+
+    this.scoreAudit.push({
+      type: 'correction',
+      playerId,
+      matchId,
+      source,
+      previous: matches.get(matchId),
+      next: { ...performance },
+      previousPoints: this.playerPoints.get(playerId) || 0,
+      timestamp: new Date()
+    });
+
+    this.updatePlayerPerformance(playerId, performance, matchId);
+    this.scoreAudit[this.scoreAudit.length - 1].newPoints = this.playerPoints.get(playerId);
+  }
 
-    // Update participant points
+  // Update one player's points for a changed stat line and apply the delta to every squad holding them.
+  // Live feeds rewrite a match line on every ball, so fold in the change rather than rescoring every match.
+  applyPlayerScore(playerId, previousLine, nextLine) {
+    const cached = this.playerPerformance.get(playerId);
+    const performance = cached
+      ? scoringEngine.applyLineChange(cached, previousLine, nextLine, this.scoringVersion)
+      : scoringEngine.scorePlayer(this.ledger.get(playerId), this.scoringVersion);
+    this.playerPerformance.set(playerId, performance);
+    this.playerPoints.set(playerId, performance.totalPoints);
+
+    const pointsByUser = new Map();
     this.participants.forEach(participant => {
       const playerInSquad = participant.squad.find(p => p.id === playerId);
       if (playerInSquad) {
-        if (!playerInSquad.performance) {
-          playerInSquad.performance = { totalPoints: 0 };
+        const previousPoints = playerInSquad.performance?.totalPoints || 0;
+        playerInSquad.performance = performance;
+        participant.points += (performance.totalPoints - previousPoints);
+        pointsByUser.set(participant.userId, participant.points);
+      }
+    });
+
+    // A popular player moves many participants at once; one re-sort beats many splices
+    if (pointsByUser.size > 64) {
+      this.rankIndex.rebuild(pointsByUser);
+    } else {
+      pointsByUser.forEach((points, userId) => this.rankIndex.update(userId, points));
+    }
+  }
+
+  // Re-score the whole tournament in one pass, e.g. after a rules change
+  rescore(scoringVersion = this.scoringVersion) {
+    scoringEngine.getScorer(scoringVersion); // fail fast on an unknown version
+    if (this.pendingUpdates) {
+      throw new Error('A re-score is already running');
+    }
+    const previousVersion = this.scoringVersion;
+    this.scoringVersion = scoringVersion;
+
+    // Score each ledger player once, then sum squads from the cached results
+    const performances = new Map();
+    this.ledger.forEach((matches, playerId) => {
+      const performance = scoringEngine.scorePlayer(matches, scoringVersion);
+      performances.set(playerId, performance);
+      this.playerPerformance.set(playerId, performance);
+      this.playerPoints.set(playerId, performance.totalPoints);
+    });
+
+    const pointsByUser = new Map();
+    this.participants.forEach(participant => {
+      let points = 0;
+      participant.squad.forEach(player => {
+        const performance = performances.get(player.id);
+        if (performance) {
+          player.performance = performance;
+          points += performance.totalPoints;
+        }
+      });
+      participant.points = points;
+      pointsByUser.set(participant.userId, points);
+    });
+    this.rankIndex.rebuild(pointsByUser);
+
+    this.scoreAudit.push({
+      type: 'rescore',
+      previousVersion,
+      scoringVersion,
+      players: performances.size,
+      timestamp: new Date()
+    });
+
+    this.updateLeaderboard();
+  }
+
+  // rescore() with the scoring, ranking and (with options.leaderboardJson) the full
+  // leaderboard rendering done on a WorkerPool thread. The ledger is packed and the
+  // results applied in slices between event-loop turns; stat lines arriving
+  // meanwhile are held and replayed once the new scores are in.
+  async rescoreInWorker(pool, scoringVersion = this.scoringVersion, options = {}) {
+    scoringEngine.getScorer(scoringVersion); // fail fast on an unknown version
+    if (this.pendingUpdates) {
+      throw new Error('A re-score is already running');
+    }
+
+    this.pendingUpdates = [];
+    try {
+      const packed = await this.packLedger(scoringEngine.getRuleTable(scoringVersion), options.leaderboardJson);
+      const result = await pool.run('rescore', packed.payload);
+      await this.applyWorkerRescore(scoringVersion, packed, result);
+      return { leaderboardJson: result.leaderboardJson || null };
+    } finally {
+      const pending = this.pendingUpdates;
+      this.pendingUpdates = null;
+      pending.forEach(([playerId, performance, matchId]) => this.updatePlayerPerformance(playerId, performance, matchId));
+    }
+  }
+
+  // Ledger and squads as typed arrays for the 'rescore' worker task
+  async packLedger(ruleTable, renderLeaderboard = false) {
+    const ledgerPlayers = Array.from(this.ledger.keys());
+    const playerIndex = new Map(ledgerPlayers.map((playerId, i) => [playerId, i]));
+    let lineCount = 0;
+    this.ledger.forEach(matches => {
+      lineCount += matches.size;
+    });
+
+    const columns = new Map(); // stat -> Float64Array(lineCount), NaN where a line lacks it
+    const linePlayer = new Int32Array(lineCount);
+    const slice = workSlicer();
+    let line = 0;
+    for (let i = 0; i < ledgerPlayers.length; i++) {
+      const matches = this.ledger.get(ledgerPlayers[i]);
+      await slice(matches.size);
+      matches.forEach(statLine => {
+        Object.keys(statLine).forEach(stat => {
+          if (typeof statLine[stat] !== 'number') {
+            return;
+          }
+          let column = columns.get(stat);
+          if (!column) {
+            column = new Float64Array(lineCount).fill(NaN);
+            columns.set(stat, column);
+          }
+          column[line] = statLine[stat];
+        });
+        linePlayer[line++] = i;
+      });
+    }
+    const stats = Array.from(columns.keys());
+    const lineStats = new Float64Array(stats.length * lineCount);
+    stats.forEach((stat, c) => lineStats.set(columns.get(stat), c * lineCount));
+
+    const users = Array.from(this.participants.values());
+    const squadOffsets = new Int32Array(users.length + 1);
+    const squadPlayers = [];
+    const seq = new Float64Array(users.length);
+    const rowHeads = [];
+    const squadHeads = [];
+    for (let u = 0; u < users.length; u++) {
+      const participant = users[u];
+      await slice(participant.squad.length + 1);
+      participant.squad.forEach(player => {
+        let index = playerIndex.get(player.id);
+        if (index === undefined) {
+          index = playerIndex.size;
+          playerIndex.set(player.id, index);
+        }
+        squadPlayers.push(index);
+        if (renderLeaderboard && squadHeads[index] === undefined) {
+          squadHeads[index] = JSON.stringify({ name: player.name }).slice(1, -1);
+        }
+      });
+      squadOffsets[u + 1] = squadPlayers.length;
+      seq[u] = this.rankIndex.seqOf(participant.userId);
+      if (renderLeaderboard) {
+        rowHeads.push(JSON.stringify({ userId: participant.userId, username: participant.username }).slice(1, -1));
+      }
+    }
+
+    const payload = {
+      weights: Float64Array.from(stats, stat => ruleTable[stat] || 0),
+      lineStats,
+      linePlayer,
+      playerCount: playerIndex.size,
+      squadOffsets,
+      squadPlayers: Int32Array.from(squadPlayers),
+      seq
+    };
+    if (renderLeaderboard) {
+      payload.rowHeads = rowHeads.join('\0');
+      payload.squadHeads = squadHeads.join('\0');
+    }
+    return { payload, stats, ledgerPlayers, users };
+  }
+
+  // Install a worker re-score: scores, points and ranks switch over in one step
+  async applyWorkerRescore(scoringVersion, { stats, ledgerPlayers, users }, result) {
+    const statCount = stats.length;
+    const performances = new Map();
+    const slice = workSlicer();
+    for (let i = 0; i < ledgerPlayers.length; i++) {
+      await slice(statCount);
+      const performance = {};
+      for (let c = 0; c < statCount; c++) {
+        if (result.playerPresent[i * statCount + c]) {
+          performance[stats[c]] = result.playerTotals[i * statCount + c];
         }
-        
-        const previousPoints = playerInSquad.performance.totalPoints || 0;
-        playerInSquad.performance = { ...performance, totalPoints };
-        
-        // Update participant's total points
-        participant.points += (totalPoints - previousPoints);
       }
+      performance.totalPoints = result.playerPoints[i];
+      performance.matches = result.playerMatches[i];
+      performances.set(ledgerPlayers[i], performance);
+    }
+
+    const previousVersion = this.scoringVersion;
+    this.scoringVersion = scoringVersion;
+    performances.forEach((performance, playerId) => {
+      this.playerPerformance.set(playerId, performance);
+      this.playerPoints.set(playerId, performance.totalPoints);
+    });
+    users.forEach((participant, u) => {
+      participant.points = result.userPoints[u];
+    });
+    this.rankIndex.loadSorted(
+      Array.from(result.order, u => users[u].userId),
+      Array.from(result.order, u => result.userPoints[u])
+    );
+    this.scoreAudit.push({
+      type: 'rescore',
+      previousVersion,
+      scoringVersion,
+      players: performances.size,
+      timestamp: new Date()
     });
+    this.updateLeaderboard();
 
+    // Squad entries carry their player's totals for leaderboard breakdowns
+    for (let u = 0; u < users.length; u++) {
+      await slice(users[u].squad.length);
+      users[u].squad.forEach(player => {
+        const performance = performances.get(player.id);
+        if (performance) {
+          player.performance = performance;
+        }
+      });
+    }
     this.updateLeaderboard();
   }
 
-  // Update leaderboard
+  // Per-match stat lines for one player
+  getPlayerLedger(playerId) {
+    const matches = this.ledger.get(playerId);
+    if (!matches) {
+      return null;
+    }
+    return {
+      playerId,
+      scoringVersion: this.scoringVersion,
+      totalPoints: this.playerPoints.get(playerId) || 0,
+      matches: Array.from(matches.entries()).map(([matchId, statLine]) => ({
+        matchId,
+        stats: statLine,
+        points: scoringEngine.score(statLine, this.scoringVersion)
+      }))
+    };
+  }
+
+  // Mark the full leaderboard stale; rank queries read the index directly
   updateLeaderboard() {
-    this.leaderboard = Array.from(this.participants.values())
-      .sort((a, b) => b.points - a.points)
-      .map((participant, index) => ({
-        rank: index + 1,
+    this.leaderboardCache = null;
+  }
+
+  // Full leaderboard with squad breakdowns, built on first read after a change
+  get leaderboard() {
+    if (!this.leaderboardCache) {
+      this.leaderboardCache = this.getLeaderboardRows(0, this.rankIndex.size, true);
+    }
+    return this.leaderboardCache;
+  }
+
+  // Leaderboard rows for ranks [start + 1, end]
+  getLeaderboardRows(start, end, includeSquad = false) {
+    return this.rankIndex.slice(start, end).map((entry, offset) => {
+      const participant = this.participants.get(entry.userId);
+      const row = {
+        rank: Math.max(start, 0) + offset + 1,
         userId: participant.userId,
         username: participant.username,
-        points: participant.points,
-        squad: participant.squad.map(p => ({
+        points: participant.points
+      };
+      if (includeSquad) {
+        row.squad = participant.squad.map(p => ({
           name: p.name,
           points: p.performance?.totalPoints || 0
-        }))
-      }));
+        }));
+      }
+      return row;
+    });
+  }
+
+  // Top N participants
+  getTopN(limit, includeSquad = false) {
+    return this.getLeaderboardRows(0, limit, includeSquad);
+  }
+
+  // Rank and points for one participant, or null
+  getUserRank(userId, includeSquad = false) {
+    const rank = this.rankIndex.rankOf(userId);
+    if (rank === null) {
+      return null;
+    }
+    return this.getLeaderboardRows(rank - 1, rank, includeSquad)[0];
+  }
+
+  // Participants within `radius` ranks of the given user
+  getRankWindow(userId, radius, includeSquad = false) {
+    const rank = this.rankIndex.rankOf(userId);
+    if (rank === null) {
+      return null;
+    }
+    return this.getLeaderboardRows(rank - 1 - radius, rank + radius, includeSquad);
   }
 
-  // Get tournament state
+  // Lean tournament state: counts and the top of the leaderboard, independent of
+  // participant count. Participant details come from getParticipants().
   getState() {
     return {
       id: this.id,
+      version: this.version,
       adminId: this.adminId,
       settings: this.settings,
-      participants: Array.from(this.participants.entries()).map(([id, data]) => ({ id, ...data })),
       prizePool: this.prizePool,
       status: this.status,
       participantCount: this.participants.size,
+      paidCount: this.paidCount,
       chatMessages: this.chatMessages.slice(-20), // Last 20 messages
-      leaderboard: this.leaderboard,
+      leaderboard: this.getTopN(STATE_LEADERBOARD_SIZE),
       createdAt: this.createdAt
     };
   }
 
+  // Counters that change on joins, fee payments and status moves; what broadcasts carry
+  getCounts() {
+    return {
+      version: this.version,
+      status: this.status,
+      participantCount: this.participants.size,
+      paidCount: this.paidCount,
+      prizePool: this.prizePool
+    };
+  }
+
+  // One page of participants in join order (sort 'joined') or rank order (sort 'points').
+  // search matches username or userId case-insensitively; paid filters on entryFeePaid.
+  // The cursor is the position just past the previous page in the chosen order.
+  getParticipants({ sort = 'joined', search, paid, cursor, limit = 50 } = {}) {
+    const byPoints = sort === 'points';
+    const total = this.participants.size;
+    const needle = search ? search.toLowerCase() : null;
+    let position = Math.max(parseInt(cursor, 10) || 0, 0);
+
+    const participants = [];
+    while (position < total && participants.length < limit) {
+      const userId = byPoints ? this.rankIndex.entries[position].userId : this.joinOrder[position];
+      const participant = this.participants.get(userId);
+      position++;
+
+      if (paid !== undefined && participant.entryFeePaid !== paid) {
+        continue;
+      }
+      if (needle && !participant.username?.toLowerCase().includes(needle) && !String(userId).toLowerCase().includes(needle)) {
+        continue;
+      }
+
+      const row = { id: userId, ...participant };
+      if (byPoints) {
+        row.rank = position;
+      }
+      participants.push(row);
+    }
+
+    return {
+      participants,
+      total,
+      nextCursor: position < total ? String(position) : null
+    };
+  }
+
   // Check if user can join
   canUserJoin(userId) {
     return !this.participants.has(userId) && 
@@ -225,4 +625,5 @@ class Tournament {
   }
 }
 
-module.exports = Tournament;
\ No newline at end of file
+module.exports = Tournament;
+module.exports.STATE_LEADERBOARD_SIZE = STATE_LEADERBOARD_SIZE;
\ No newline at end of file
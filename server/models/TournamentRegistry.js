@@ -0,0 +1,205 @@
+// Tournament storage with status/realTournament indexes and cached listing rows
+class TournamentRegistry {
+  constructor() {
+    this.tournaments = new Map(); // tournamentId -> Tournament instance
+    this.bySeq = new Map();       // sequence number -> Tournament instance
+    this.seqById = new Map();     // tournamentId -> sequence number
+    this.byStatus = new Map();    // status -> ascending array of sequence numbers
+    this.byRealTournament = new Map(); // realTournament -> ascending array of sequence numbers
+    this.all = [];                // every sequence number, ascending (creation order)
+    this.summaryCache = new Map(); // tournamentId -> cached listing row
+    this.nextSeq = 1;
+  }
+
+  get size() {
+    return this.tournaments.size;
+  }
+
+  get(tournamentId) {
+    return this.tournaments.get(tournamentId);
+  }
+
+  has(tournamentId) {
+    return this.tournaments.has(tournamentId);
+  }
+
+  values() {
+    return this.tournaments.values();
+  }
+
+  // Register a new tournament and index it
+  add(tournament) {
+    const seq = this.nextSeq++;
+    this.tournaments.set(tournament.id, tournament);
+    this.bySeq.set(seq, tournament);
+    this.seqById.set(tournament.id, seq);
+    this.all.push(seq);
+    this.appendToIndex(this.byStatus, tournament.status, seq);
+    this.appendToIndex(this.byRealTournament, tournament.settings.realTournament, seq);
+
+    tournament.onChange = (changed, previousStatus) => this.handleChange(changed, previousStatus);
+    return tournament;
+  }
+
+  delete(tournamentId) {
+    const tournament = this.tournaments.get(tournamentId);
+    if (!tournament) {
+      return false;
+    }
+
+    const seq = this.seqById.get(tournamentId);
+    this.removeFromIndex(this.byStatus, tournament.status, seq);
+    this.removeFromIndex(this.byRealTournament, tournament.settings.realTournament, seq);
+    removeSorted(this.all, seq);
+
+    this.tournaments.delete(tournamentId);
+    this.bySeq.delete(seq);
+    this.seqById.delete(tournamentId);
+    this.summaryCache.delete(tournamentId);
+    tournament.onChange = null;
+    return true;
+  }
+
+  // Invalidate the cached row and move the tournament between status indexes
+  handleChange(tournament, previousStatus) {
+    this.summaryCache.delete(tournament.id);
+
+    if (previousStatus !== tournament.status) {
+      const seq = this.seqById.get(tournament.id);
+      this.removeFromIndex(this.byStatus, previousStatus, seq);
+      this.insertIntoIndex(this.byStatus, tournament.status, seq);
+    }
+  }
+
+  appendToIndex(index, key, seq) {
+    if (!index.has(key)) {
+      index.set(key, []);
+    }
+    index.get(key).push(seq);
+  }
+
+  insertIntoIndex(index, key, seq) {
+    if (!index.has(key)) {
+      index.set(key, []);
+    }
+    const seqs = index.get(key);
+    seqs.splice(lowerBound(seqs, seq), 0, seq);
+  }
+
+  removeFromIndex(index, key, seq) {
+    const seqs = index.get(key);
+    if (!seqs) {
+      return;
+    }
+    removeSorted(seqs, seq);
+    if (seqs.length === 0) {
+      index.delete(key);
+    }
+  }
+
+  // Listing row, rebuilt only after the tournament reports a change
+  getSummary(tournament) {
+    let row = this.summaryCache.get(tournament.id);
+    if (!row) {
+      row = {
+        id: tournament.id,
+        name: tournament.settings.name,
+        realTournament: tournament.settings.realTournament,
+        entryFee: tournament.settings.entryFee,
+        prizePool: tournament.prizePool,
+        participants: tournament.participants.size,
+        maxParticipants: tournament.settings.maxParticipants,
+        status: tournament.status,
+        createdAt: tournament.createdAt
+      };
+      this.summaryCache.set(tournament.id, row);
+    }
+    return row;
+  }
+
+  // Newest-first page of summary rows.
+  // The cursor is the sequence number of the last row on the previous page.
+  list({ status, realTournament, cursor, limit = 50 } = {}) {
+    const statuses = status ? status.split(',') : null;
+
+    // Walk the smallest matching index and check the other filters per row
+    let candidates;
+    if (statuses && statuses.length === 1) {
+      candidates = this.byStatus.get(statuses[0]) || [];
+    } else if (statuses) {
+      candidates = mergeSorted(statuses.map(s => this.byStatus.get(s) || []));
+    } else {
+      candidates = this.all;
+    }
+
+    if (realTournament) {
+      const realIndex = this.byRealTournament.get(realTournament) || [];
+      if (realIndex.length < candidates.length) {
+        candidates = realIndex;
+      }
+    }
+
+    const cursorSeq = cursor ? parseInt(cursor, 10) : Infinity;
+    let position = lowerBound(candidates, cursorSeq) - 1;
+
+    const rows = [];
+    let lastSeq = null;
+    while (position >= 0 && rows.length < limit) {
+      const seq = candidates[position];
+      const tournament = this.bySeq.get(seq);
+      position--;
+
+      if (statuses && !statuses.includes(tournament.status)) {
+        continue;
+      }
+      if (realTournament && tournament.settings.realTournament !== realTournament) {
+        continue;
+      }
+
+      rows.push(this.getSummary(tournament));
+      lastSeq = seq;
+    }
+
+    return {
+      tournaments: rows,
+      nextCursor: position >= 0 && lastSeq !== null ? String(lastSeq) : null
+    };
+  }
+
+  // Tournament counts per status, read straight from the index
+  getStatusCounts() {
+    const counts = {};
+    this.byStatus.forEach((seqs, status) => {
+      counts[status] = seqs.length;
+    });
+    return counts;
+  }
+}
+
+// First position in an ascending array whose value is >= target
+function lowerBound(values, target) {
+  let low = 0;
+  let high = values.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (values[mid] < target) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+}
+
+function removeSorted(values, target) {
+  const position = lowerBound(values, target);
+  if (values[position] === target) {
+    values.splice(position, 1);
+  }
+}
+
+function mergeSorted(arrays) {
+  return arrays.flat().sort((a, b) => a - b);
+}
+
+module.exports = TournamentRegistry;
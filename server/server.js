@@ -8,8 +8,23 @@ const path = require('path');
 const fs = require('fs');
 
 // Import new models
+const AuctionRoom = require('./models/AuctionRoom');
 const Tournament = require('./models/Tournament');
 const PerformanceTracker = require('./models/PerformanceTracker');
+const scoringEngine = require('./models/ScoringEngine');
+const TournamentRegistry = require('./models/TournamentRegistry');
+const MembershipIndex = require('./models/MembershipIndex');
+const SocketRateLimiter = require('./utils/SocketRateLimiter');
+const LeaderboardBroadcaster = require('./utils/LeaderboardBroadcaster');
+const SpectatorBroadcaster = require('./utils/SpectatorBroadcaster');
+const AIClient = require('./utils/AIClient');
+const PlayerSearchIndex = require('./utils/PlayerSearchIndex');
+const AdmissionController = require('./utils/AdmissionController');
+const WorkerPool = require('./utils/WorkerPool');
+const { roomLines, selectRooms, writeLines } = require('./utils/AuctionExport');
+const {
+  roomMessage, serializeRoomState, serializeTournamentState, serializeParticipantPage, serializeLeaderboard, serializePlayers, sendJson
+} = require('./utils/Payloads');
 // KABADDI: Commented out for production - Cricket-focused deployment
 // const KabaddiTournament = require('./models/KabaddiTournament');
 // const KabaddiPerformanceTracker = require('./models/KabaddiPerformanceTracker');
@@ -28,207 +43,142 @@ const io = socketIo(server, {
   pingTimeout: 60000,
   pingInterval: 25000,
   maxHttpBufferSize: 1e6,
+  parser: require('./utils/SocketParser'), // writes pre-serialized room payloads verbatim
   allowRequest: (req, callback) => {
     // Allow all requests
     callback(null, true);
   }
 });
 
+// Sheds low-priority traffic first when the event loop falls behind
+const admissionController = new AdmissionController();
+
 // Middleware
 app.use(cors());
+app.use(admissionController.middleware());
 app.use(express.json());
 app.use(express.static('public'));
 
 // In-memory storage
 const auctionRooms = new Map();
-const tournaments = new Map(); // Cricket tournaments
+const tournaments = new TournamentRegistry(); // Cricket tournaments, indexed by status
 // KABADDI: Commented out for production - Cricket-focused deployment
 // const kabaddiTournaments = new Map(); // Kabaddi tournaments
-const userSockets = new Map();
+const memberships = new MembershipIndex(); // userId -> live sockets, rooms and tournaments
 
 // Initialize performance trackers
 const performanceTracker = new PerformanceTracker();
+const leaderboardBroadcaster = new LeaderboardBroadcaster(io);
+performanceTracker.setBroadcaster(leaderboardBroadcaster);
 // KABADDI: Commented out for production - Cricket-focused deployment
 // const kabaddiPerformanceTracker = new KabaddiPerformanceTracker();
 
-// Load players data
-const playersData = JSON.parse(fs.readFileSync(path.join(__dirname, '../data/players.json'), 'utf8'));
-
-// Auction Room Class
-class AuctionRoom {
-  constructor(roomId, hostId, settings) {
-    this.roomId = roomId;
-    this.hostId = hostId;
-    this.settings = settings;
-    this.teams = new Map();
-    this.players = [...playersData];
-    this.currentAuction = null;
-    this.auctionHistory = [];
-    this.status = 'waiting'; // waiting, active, completed
-    this.currentPlayerIndex = 0;
-    this.bidTimer = null;
-    this.biddingSequence = [];
-  }
-
-  addTeam(teamId, teamData) {
-    this.teams.set(teamId, {
-      ...teamData,
-      players: [],
-      budget: this.settings.budget || 0,
-      remainingBudget: this.settings.budget || 0
-    });
-  }
-
-  removeTeam(teamId) {
-    this.teams.delete(teamId);
-  }
-
-  startAuction() {
-    if (this.teams.size < 2) {
-      throw new Error('Need at least 2 teams to start auction');
-    }
-    this.status = 'active';
-    this.nextPlayer();
-  }
-
-  nextPlayer() {
-    if (this.currentPlayerIndex >= this.players.length) {
-      this.completeAuction();
-      return;
-    }
-
-    const player = this.players[this.currentPlayerIndex];
-    this.currentAuction = {
-      player: player,
-      currentBid: this.settings.mode === 'standard' ? player.basePrice : 0,
-      highestBidder: null,
-      timeLeft: this.settings.bidTimeout || 30,
-      biddingHistory: []
-    };
-
-    this.currentPlayerIndex++;
-    this.startBidTimer();
-    return this.currentAuction;
-  }
-
-  placeBid(teamId, amount) {
-    if (!this.currentAuction || this.status !== 'active') {
-      throw new Error('No active auction');
-    }
-
-    if (this.settings.mode === 'standard') {
-      const team = this.teams.get(teamId);
-      if (!team || team.remainingBudget < amount) {
-        throw new Error('Insufficient budget');
-      }
-
-      if (amount <= this.currentAuction.currentBid) {
-        throw new Error('Bid must be higher than current bid');
-      }
-    }
-
-    this.currentAuction.currentBid = amount;
-    this.currentAuction.highestBidder = teamId;
-    this.currentAuction.biddingHistory.push({
-      teamId,
-      amount,
-      timestamp: new Date()
-    });
-
-    // Reset timer
-    this.currentAuction.timeLeft = this.settings.bidTimeout || 30;
-    this.startBidTimer();
-
-    return this.currentAuction;
-  }
-
-  startBidTimer() {
-    if (this.bidTimer) {
-      clearInterval(this.bidTimer);
-    }
-
-    this.bidTimer = setInterval(() => {
-      this.currentAuction.timeLeft--;
-      
-      if (this.currentAuction.timeLeft <= 0) {
-        this.completeBid();
-      }
-    }, 1000);
-  }
-
-  completeBid() {
-    clearInterval(this.bidTimer);
-    
-    if (this.currentAuction.highestBidder) {
-      // Player sold
-      const team = this.teams.get(this.currentAuction.highestBidder);
-      team.players.push({
-        ...this.currentAuction.player,
-        soldPrice: this.currentAuction.currentBid
-      });
-      
-      if (this.settings.mode === 'standard') {
-        team.remainingBudget -= this.currentAuction.currentBid;
-      }
-
-      this.auctionHistory.push({
-        player: this.currentAuction.player,
-        soldTo: this.currentAuction.highestBidder,
-        soldPrice: this.currentAuction.currentBid,
-        status: 'sold'
-      });
-    } else {
-      // Player unsold
-      this.auctionHistory.push({
-        player: this.currentAuction.player,
-        status: 'unsold'
-      });
-    }
-
-    // Move to next player
-    setTimeout(() => {
-      this.nextPlayer();
-    }, 2000);
+// Shared AI client (one model instance, bounded queue, circuit breaker)
+const aiClient = new AIClient();
+
+// Worker threads for CPU-heavy jobs (full re-scores of large tournaments)
+const workerPool = new WorkerPool().warm();
+const WORKER_RESCORE_MIN_PARTICIPANTS = parseInt(process.env.WORKER_RESCORE_MIN_PARTICIPANTS, 10) || 1000;
+
+// Per-connection socket event limits and slow-consumer handling
+const socketRateLimiter = new SocketRateLimiter();
+
+// Fixed-rate auction summaries for read-only viewers, kept off the bidders' broadcast path
+const spectatorBroadcaster = new SpectatorBroadcaster(io, { rateLimiter: socketRateLimiter, admission: admissionController });
+
+// Load players data: the built catalog (python3 build_catalog.py) when present,
+// otherwise the hand-edited data/players.json
+const catalogDir = path.join(__dirname, '../data/catalog');
+const readCatalogFile = (name) => {
+  const file = path.join(catalogDir, name);
+  return fs.existsSync(file) ? JSON.parse(fs.readFileSync(file, 'utf8')) : null;
+};
+const playersData = readCatalogFile('players.json') ||
+  JSON.parse(fs.readFileSync(path.join(__dirname, '../data/players.json'), 'utf8'));
+const catalogPools = readCatalogFile('pools.json'); // realTournament -> player ids
+const catalogIndexes = readCatalogFile('indexes.json'); // byRole / byCountry -> player ids
+// Shared catalog lookup, auction history and squads refer to players by id
+const playersById = new Map(playersData.map(player => [player.id, player]));
+// Unfiltered catalog responses are the same bytes every time
+const playersJson = Buffer.from(serializePlayers(playersData));
+// Typeahead index over player names and countries
+const playerSearchIndex = new PlayerSearchIndex(playersData);
+
+// Room events whose socket handler already broadcasts the full room state. Only
+// events that are the sole change logged by their handler belong here: starting
+// an auction also opens lots, and their deltas are sent before the handler's
+// state message, so auction-started must go out as a delta too or every client
+// sees a version gap and resyncs.
+const ROOM_EVENTS_SENT_WITH_STATE = new Set(['team-added', 'bid-placed']);
+
+// Push every other room change (timer-driven lot results, next lots, completion)
+// as a versioned delta; clients that miss one catch up via get-room-state
+const broadcastRoomEvent = (type, room, payload) => {
+  if (ROOM_EVENTS_SENT_WITH_STATE.has(type)) {
+    return;
   }
-
-  completeAuction() {
-    this.status = 'completed';
-    this.currentAuction = null;
-    clearInterval(this.bidTimer);
+  io.to(room.roomId).emit('room-event', { roomId: room.roomId, version: room.version, type, payload });
+};
+
+// Push to every device a user has open
+const emitToUser = (userId, event, payload) => {
+  const socketIds = memberships.socketsOf(userId);
+  if (socketIds.length > 0) {
+    io.to(socketIds).emit(event, payload);
   }
+};
+
+// A user's rooms and tournaments with enough state to list them; ids that no
+// longer resolve are left out
+const describeMemberships = (userId) => {
+  const { devices, rooms, tournaments: joined } = memberships.getMemberships(userId);
+  return {
+    userId,
+    devices,
+    rooms: rooms
+      .filter(({ roomId }) => auctionRooms.has(roomId))
+      .map(({ roomId, role }) => {
+        const room = auctionRooms.get(roomId);
+        return { roomId, role, status: room.status, teams: room.teams.size, hostId: room.hostId };
+      }),
+    tournaments: joined
+      .filter(({ tournamentId }) => tournaments.has(tournamentId))
+      .map(({ tournamentId, role }) => ({ ...tournaments.getSummary(tournaments.get(tournamentId)), role }))
+  };
+};
 
-  getState() {
-    return {
-      roomId: this.roomId,
-      settings: this.settings,
-      teams: Array.from(this.teams.entries()).map(([id, team]) => ({ id, ...team })),
-      currentAuction: this.currentAuction,
-      auctionHistory: this.auctionHistory,
-      status: this.status,
-      totalPlayers: this.players.length,
-      currentPlayerIndex: this.currentPlayerIndex
-    };
-  }
-}
+// Other tabs and devices refresh their "my rooms and tournaments" lists from this
+memberships.onChange = (userId) => {
+  emitToUser(userId, 'memberships-updated', describeMemberships(userId));
+};
 
 // Socket.io connection handling
 io.on('connection', (socket) => {
   console.log('User connected:', socket.id);
+  admissionController.attach(socket);
+  socketRateLimiter.attach(socket);
 
   // Store user socket
   socket.on('register', (userId) => {
-    userSockets.set(userId, socket.id);
+    if (socket.userId && socket.userId !== userId) {
+      memberships.removeSocket(socket.userId, socket.id);
+    }
+    memberships.addSocket(userId, socket.id);
     socket.userId = userId;
   });
 
   // Create auction room
   socket.on('create-room', (data) => {
     const roomId = uuidv4().substring(0, 8).toUpperCase();
-    const room = new AuctionRoom(roomId, socket.userId, data.settings);
+    const room = new AuctionRoom(roomId, socket.userId, data.settings, {
+      catalog: { players: playersData, byId: playersById },
+      onEvent: broadcastRoomEvent
+    });
     auctionRooms.set(roomId, room);
+    memberships.joinRoom(socket.userId, roomId, 'host');
     
     socket.join(roomId);
-    socket.emit('room-created', { roomId, room: room.getState() });
+    socket.emit('room-created', roomMessage({ roomId, room }));
   });
 
   // Join auction room
@@ -242,10 +192,36 @@ io.on('connection', (socket) => {
     }
 
     socket.join(roomId);
-    socket.emit('room-joined', { room: room.getState() });
+    memberships.joinRoom(socket.userId, roomId);
+    socket.emit('room-joined', roomMessage({ room }));
     socket.to(roomId).emit('user-joined', { userId: socket.userId });
   });
 
+  // Leave an auction room on this device and drop it from the user's memberships
+  socket.on('leave-room', (data) => {
+    const { roomId } = data;
+    socket.leave(roomId);
+    memberships.leaveRoom(socket.userId, roomId);
+    socket.to(roomId).emit('user-left', { userId: socket.userId });
+  });
+
+  // Watch an auction room read-only: periodic summaries instead of every bid
+  socket.on('spectate-room', (data) => {
+    const { roomId } = data;
+    const room = auctionRooms.get(roomId);
+    
+    if (!room) {
+      socket.emit('error', { message: 'Room not found' });
+      return;
+    }
+
+    spectatorBroadcaster.watch(socket, room);
+  });
+
+  socket.on('leave-spectate', (data) => {
+    spectatorBroadcaster.unwatch(socket, data.roomId);
+  });
+
   // Add team
   socket.on('add-team', (data) => {
     const { roomId, teamData } = data;
@@ -259,7 +235,7 @@ io.on('connection', (socket) => {
     const teamId = uuidv4();
     room.addTeam(teamId, teamData);
     
-    io.to(roomId).emit('team-added', { teamId, teamData, room: room.getState() });
+    io.to(roomId).emit('team-added', roomMessage({ teamId, teamData, room }));
   });
 
   // Start auction
@@ -274,7 +250,7 @@ io.on('connection', (socket) => {
 
     try {
       room.startAuction();
-      io.to(roomId).emit('auction-started', { room: room.getState() });
+      io.to(roomId).emit('auction-started', roomMessage({ room }));
     } catch (error) {
       socket.emit('error', { message: error.message });
     }
@@ -282,7 +258,7 @@ io.on('connection', (socket) => {
 
   // Place bid
   socket.on('place-bid', (data) => {
-    const { roomId, teamId, amount } = data;
+    const { roomId, teamId, amount, lotId } = data;
     const room = auctionRooms.get(roomId);
     
     if (!room) {
@@ -291,11 +267,11 @@ io.on('connection', (socket) => {
     }
 
     try {
-      const updatedAuction = room.placeBid(teamId, amount);
-      io.to(roomId).emit('bid-placed', { 
+      const updatedAuction = room.placeBid(teamId, amount, lotId);
+      socketRateLimiter.emitToRoom(io, roomId, 'bid-placed', roomMessage({ 
         auction: updatedAuction, 
-        room: room.getState() 
-      });
+        room 
+      }));
     } catch (error) {
       socket.emit('error', { message: error.message });
     }
@@ -312,10 +288,10 @@ io.on('connection', (socket) => {
     }
 
     const nextAuction = room.nextPlayer();
-    io.to(roomId).emit('next-player', { 
+    io.to(roomId).emit('next-player', roomMessage({ 
       auction: nextAuction, 
-      room: room.getState() 
-    });
+      room 
+    }));
   });
 
   // Add custom player
@@ -334,13 +310,14 @@ io.on('connection', (socket) => {
       basePrice: playerData.basePrice || 100000
     };
 
-    room.players.push(newPlayer);
+    room.addCustomPlayer(newPlayer);
     io.to(roomId).emit('player-added', { player: newPlayer });
   });
 
-  // Get room state
+  // Get room state; with sinceVersion (after a reconnect) only the missed events
+  // are sent, falling back to a full snapshot when the log no longer covers the gap
   socket.on('get-room-state', (data) => {
-    const { roomId } = data;
+    const { roomId, sinceVersion } = data;
     const room = auctionRooms.get(roomId);
     
     if (!room) {
@@ -348,7 +325,16 @@ io.on('connection', (socket) => {
       return;
     }
 
-    socket.emit('room-state', { room: room.getState() });
+    if (sinceVersion !== undefined) {
+      socket.join(roomId);
+      const events = room.getEventsSince(sinceVersion);
+      if (events) {
+        socket.emit('room-events', { roomId, version: room.version, events });
+        return;
+      }
+    }
+
+    socket.emit('room-state', roomMessage({ room }));
   });
 
   // ======================= TOURNAMENT EVENTS =======================
@@ -357,8 +343,9 @@ io.on('connection', (socket) => {
   socket.on('create-tournament', (data) => {
     try {
       const tournament = new Tournament(socket.userId, data.settings);
-      tournaments.set(tournament.id, tournament);
+      tournaments.add(tournament);
       performanceTracker.registerTournament(tournament);
+      memberships.joinTournament(socket.userId, tournament.id, 'admin');
       
       socket.join(`tournament-${tournament.id}`);
       socket.emit('tournament-created', { tournament: tournament.getState() });
@@ -386,13 +373,15 @@ io.on('connection', (socket) => {
       }
 
       const participant = tournament.addParticipant(socket.userId, userData);
+      memberships.joinTournament(socket.userId, tournamentId);
       socket.join(`tournament-${tournamentId}`);
       
-      // Notify all tournament participants
+      // Notify all tournament participants: the new member and the changed counts
       io.to(`tournament-${tournamentId}`).emit('tournament-updated', { 
-        tournament: tournament.getState(),
+        tournamentId,
         event: 'participant-joined',
-        participant: participant
+        participant: { id: socket.userId, ...participant },
+        ...tournament.getCounts()
       });
       
       // Send system message
@@ -428,10 +417,11 @@ io.on('connection', (socket) => {
       return;
     }
 
-    tournament.status = 'auction_active';
+    tournament.setStatus('auction_active');
     io.to(`tournament-${tournamentId}`).emit('tournament-updated', { 
-      tournament: tournament.getState(),
-      event: 'auction-started'
+      tournamentId,
+      event: 'auction-started',
+      ...tournament.getCounts()
     });
 
     const systemMsg = tournament.addSystemMessage('Tournament auction has started!');
@@ -450,14 +440,16 @@ io.on('connection', (socket) => {
 
     tournament.markEntryFeePaid(userId);
     io.to(`tournament-${tournamentId}`).emit('tournament-updated', { 
-      tournament: tournament.getState(),
-      event: 'entry-fee-paid'
+      tournamentId,
+      event: 'entry-fee-paid',
+      userId,
+      ...tournament.getCounts()
     });
   });
 
-  // Get tournament state  
+  // Get tournament state; with sinceVersion only the missed events, as for rooms
   socket.on('get-tournament-state', (data) => {
-    const { tournamentId } = data;
+    const { tournamentId, sinceVersion } = data;
     const tournament = tournaments.get(tournamentId);
     
     if (!tournament) {
@@ -465,34 +457,65 @@ io.on('connection', (socket) => {
       return;
     }
 
+    if (sinceVersion !== undefined) {
+      socket.join(`tournament-${tournamentId}`);
+      const events = tournament.getEventsSince(sinceVersion);
+      if (events) {
+        socket.emit('tournament-events', { tournamentId, version: tournament.version, events });
+        return;
+      }
+    }
+
     socket.emit('tournament-state', { tournament: tournament.getState() });
   });
 
+  // Subscribe to live leaderboard pushes; replies with the current top-N and own rank
+  socket.on('subscribe-leaderboard', (data) => {
+    const { tournamentId } = data;
+    const tournament = tournaments.get(tournamentId);
+    
+    if (!tournament) {
+      socket.emit('error', { message: 'Tournament not found' });
+      return;
+    }
+
+    socket.join(`tournament-${tournamentId}`);
+    socket.emit('leaderboard-snapshot', leaderboardBroadcaster.getSnapshot(tournament, socket.userId));
+  });
+
   // Disconnect
   socket.on('disconnect', () => {
     console.log('User disconnected:', socket.id);
     if (socket.userId) {
-      userSockets.delete(socket.userId);
+      memberships.removeSocket(socket.userId, socket.id);
     }
   });
 });
 
 // ======================= TOURNAMENT API ENDPOINTS =======================
 
-// Get all tournaments
+// List tournaments, newest first, with optional status/realTournament filters
 app.get('/api/tournaments', (req, res) => {
-  const tournamentList = Array.from(tournaments.values()).map(t => ({
-    id: t.id,
-    name: t.settings.name,
-    realTournament: t.settings.realTournament,
-    entryFee: t.settings.entryFee,
-    prizePool: t.prizePool,
-    participants: t.participants.size,
-    maxParticipants: t.settings.maxParticipants,
-    status: t.status,
-    createdAt: t.createdAt
-  }));
-  res.json(tournamentList);
+  const { status, realTournament, cursor } = req.query;
+  // A repeated parameter arrives as an array and would match no index key
+  const repeated = ['status', 'realTournament', 'cursor', 'limit'].find(name =>
+    req.query[name] !== undefined && typeof req.query[name] !== 'string'
+  );
+  if (repeated) {
+    return res.status(400).json({ error: `${repeated} must be given once (use status=a,b for several statuses)` });
+  }
+  // Cursors are the nextCursor of a previous page; anything else would silently return an empty page
+  if (cursor && !/^\d+$/.test(cursor)) {
+    return res.status(400).json({ error: 'cursor must be a nextCursor value from a previous page' });
+  }
+  const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), 200);
+
+  const page = tournaments.list({ status, realTournament, cursor, limit });
+  res.json({
+    ...page,
+    total: tournaments.size,
+    statusCounts: tournaments.getStatusCounts()
+  });
 });
 
 // Get tournament details
@@ -501,7 +524,25 @@ app.get('/api/tournaments/:id', (req, res) => {
   if (!tournament) {
     return res.status(404).json({ error: 'Tournament not found' });
   }
-  res.json(tournament.getState());
+  sendJson(res, serializeTournamentState(tournament));
+});
+
+// Participants, one page at a time: sort=joined|points, q matches username or
+// user id, paid=true|false filters on entry fee, cursor is the previous nextCursor
+app.get('/api/tournaments/:id/participants', (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+
+  const { sort, q, cursor } = req.query;
+  if (sort && sort !== 'joined' && sort !== 'points') {
+    return res.status(400).json({ error: 'sort must be joined or points' });
+  }
+  const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), 200);
+  const paid = req.query.paid === undefined ? undefined : req.query.paid === 'true';
+
+  sendJson(res, serializeParticipantPage(tournament.getParticipants({ sort, search: q, paid, cursor, limit })));
 });
 
 // Create tournament
@@ -509,8 +550,9 @@ app.post('/api/tournaments', (req, res) => {
   try {
     const { adminId, settings } = req.body;
     const tournament = new Tournament(adminId, settings);
-    tournaments.set(tournament.id, tournament);
+    tournaments.add(tournament);
     performanceTracker.registerTournament(tournament);
+    memberships.joinTournament(adminId, tournament.id, 'admin');
     res.json({ 
       success: true, 
       tournament: tournament.getState(),
@@ -535,6 +577,7 @@ app.post('/api/tournaments/:id/join', (req, res) => {
     }
 
     const participant = tournament.addParticipant(userId, userData);
+    memberships.joinTournament(userId, tournament.id);
     res.json({ 
       success: true,
       participant,
@@ -552,25 +595,199 @@ app.post('/api/tournaments/:id/performance', (req, res) => {
     return res.status(404).json({ error: 'Tournament not found' });
   }
 
-  const { playerId, performance, adminId } = req.body;
+  const { playerId, performance, adminId, matchId } = req.body;
   if (tournament.adminId !== adminId) {
     return res.status(403).json({ error: 'Not authorized' });
   }
 
-  tournament.updatePlayerPerformance(playerId, performance);
+  tournament.updatePlayerPerformance(playerId, performance, matchId);
+  performanceTracker.broadcastPerformanceUpdate(tournament);
   res.json({ 
     success: true,
     leaderboard: tournament.leaderboard
   });
 });
 
-// Get tournament leaderboard
+// Start a seeded synthetic match feed into the scoring path (admin only, for load tests and replays)
+app.post('/api/tournaments/:id/synthetic-feed', (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+
+  const { adminId, seed, eventsPerSecond, granularity, matches, overs } = req.body;
+  if (tournament.adminId !== adminId) {
+    return res.status(403).json({ error: 'Not authorized' });
+  }
+
+  try {
+    const feed = performanceTracker.startSyntheticFeed(tournament, {
+      seed: parseInt(seed, 10) || 1,
+      eventsPerSecond: Math.min(parseInt(eventsPerSecond, 10) || 100, 50000),
+      granularity,
+      matches: parseInt(matches, 10) || undefined,
+      overs: parseInt(overs, 10) || undefined
+    });
+    res.json({ success: true, feed: feed.getStats() });
+  } catch (error) {
+    res.status(400).json({ error: error.message });
+  }
+});
+
+// Stop a running synthetic feed
+app.delete('/api/tournaments/:id/synthetic-feed', (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+  if (tournament.adminId !== req.body.adminId) {
+    return res.status(403).json({ error: 'Not authorized' });
+  }
+
+  const feed = performanceTracker.stopSyntheticFeed(tournament.id);
+  if (!feed) {
+    return res.status(404).json({ error: 'No synthetic feed running' });
+  }
+  res.json({ success: true, feed: feed.getStats() });
+});
+
+// Correct a recorded stat line (official scorer amendments, audited)
+app.post('/api/tournaments/:id/corrections', (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+
+  const { playerId, matchId, performance, adminId, source } = req.body;
+  if (tournament.adminId !== adminId) {
+    return res.status(403).json({ error: 'Not authorized' });
+  }
+
+  try {
+    tournament.correctPlayerPerformance(playerId, matchId, performance, source);
+    performanceTracker.broadcastPerformanceUpdate(tournament);
+    res.json({
+      success: true,
+      correction: tournament.scoreAudit[tournament.scoreAudit.length - 1],
+      leaderboard: tournament.leaderboard
+    });
+  } catch (error) {
+    res.status(400).json({ error: error.message });
+  }
+});
+
+// Re-score every participant, optionally under a different rules version
+app.post('/api/tournaments/:id/rescore', async (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+
+  const { adminId } = req.body;
+  if (tournament.adminId !== adminId) {
+    return res.status(403).json({ error: 'Not authorized' });
+  }
+
+  // Rule tables are keyed by number; "2" from a form must mean the same as 2
+  let scoringVersion;
+  if (req.body.scoringVersion !== undefined) {
+    scoringVersion = Number(req.body.scoringVersion);
+    if (!Number.isInteger(scoringVersion) || !scoringEngine.hasVersion(scoringVersion)) {
+      return res.status(400).json({ error: `Unknown scoring rules version ${req.body.scoringVersion}` });
+    }
+  }
+
+  try {
+    if (tournament.participants.size >= WORKER_RESCORE_MIN_PARTICIPANTS) {
+      // Large tournaments score and render the leaderboard on a worker thread
+      const { leaderboardJson } = await tournament.rescoreInWorker(workerPool, scoringVersion, { leaderboardJson: true });
+      performanceTracker.broadcastPerformanceUpdate(tournament);
+      res.type('json');
+      res.write(`{"success":true,"scoringVersion":${JSON.stringify(tournament.scoringVersion)},"leaderboard":`);
+      res.write(Buffer.from(leaderboardJson.buffer, leaderboardJson.byteOffset, leaderboardJson.byteLength));
+      return res.end('}');
+    }
+
+    tournament.rescore(scoringVersion);
+    performanceTracker.broadcastPerformanceUpdate(tournament);
+    res.json({
+      success: true,
+      scoringVersion: tournament.scoringVersion,
+      leaderboard: tournament.leaderboard
+    });
+  } catch (error) {
+    res.status(400).json({ error: error.message });
+  }
+});
+
+// Per-match scoring ledger and audit trail
+app.get('/api/tournaments/:id/ledger', (req, res) => {
+  const tournament = tournaments.get(req.params.id);
+  if (!tournament) {
+    return res.status(404).json({ error: 'Tournament not found' });
+  }
+
+  if (req.query.playerId) {
+    // Catalog ids are numeric; custom ids may not be
+    const playerId = isNaN(Number(req.query.playerId)) ? req.query.playerId : Number(req.query.playerId);
+    const playerLedger = tournament.getPlayerLedger(playerId);
+    if (!playerLedger) {
+      return res.status(404).json({ error: 'No stat lines recorded for this player' });
+    }
+    return res.json(playerLedger);
+  }
+
+  res.json({
+    scoringVersion: tournament.scoringVersion,
+    players: tournament.ledger.size,
+    audit: tournament.scoreAudit
+  });
+});
+
+// Get tournament leaderboard.
+// Without a mode the full leaderboard is returned; mode=top, mode=around and
+// mode=rank answer from the rank index, with squads only when includeSquad=true.
 app.get('/api/tournaments/:id/leaderboard', (req, res) => {
   const tournament = tournaments.get(req.params.id);
   if (!tournament) {
     return res.status(404).json({ error: 'Tournament not found' });
   }
-  res.json(tournament.leaderboard);
+
+  const { mode, userId } = req.query;
+  const includeSquad = req.query.includeSquad === 'true';
+
+  if (!mode) {
+    return sendJson(res, serializeLeaderboard(tournament.leaderboard));
+  }
+
+  if (mode === 'top') {
+    const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 10, 1), 500);
+    return res.json({
+      participants: tournament.participants.size,
+      rows: tournament.getTopN(limit, includeSquad)
+    });
+  }
+
+  if (mode === 'around' || mode === 'rank') {
+    if (!userId) {
+      return res.status(400).json({ error: 'userId is required' });
+    }
+
+    const radius = Math.min(Math.max(parseInt(req.query.radius, 10) || 5, 0), 100);
+    const rows = mode === 'around'
+      ? tournament.getRankWindow(userId, radius, includeSquad)
+      : tournament.getUserRank(userId, includeSquad);
+    if (!rows) {
+      return res.status(404).json({ error: 'User is not in this tournament' });
+    }
+
+    return res.json({
+      participants: tournament.participants.size,
+      [mode === 'around' ? 'rows' : 'row']: rows
+    });
+  }
+
+  res.status(400).json({ error: 'Unknown leaderboard mode' });
 });
 
 // Get tournament chat messages
@@ -584,9 +801,9 @@ app.get('/api/tournaments/:id/chat', (req, res) => {
 
 // Real-time performance update endpoint (for external integrations)
 app.post('/api/performance/update', (req, res) => {
-  const { tournamentId, playerId, performance } = req.body;
+  const { tournamentId, playerId, performance, matchId } = req.body;
   
-  const success = performanceTracker.updatePlayerPerformance(tournamentId, playerId, performance);
+  const success = performanceTracker.updatePlayerPerformance(tournamentId, playerId, performance, matchId);
   
   if (success) {
     res.json({ success: true, message: 'Performance updated' });
@@ -748,15 +965,56 @@ app.get('/api/real-tournaments', (req, res) => {
 //
 // ======================= END KABADDI ENDPOINTS =======================
 
+// Clients opt into streaming with ?stream=true or Accept: text/event-stream
+const wantsStream = (req) => req.query.stream === 'true' ||
+  (req.headers.accept || '').includes('text/event-stream');
+
+// Relay model output as server-sent events: `data` frames carry text chunks,
+// followed by a final `done` or `error` event
+async function streamAIResponse(res, prompt, failureMessage) {
+  res.writeHead(200, {
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'X-Accel-Buffering': 'no'
+  });
+  res.write(': stream-open\n\n');
+
+  // A client that disconnects cancels the upstream call rather than leaving it to drain
+  let closed = false;
+  const abort = new AbortController();
+  res.on('close', () => {
+    closed = true;
+    abort.abort();
+  });
+
+  try {
+    await aiClient.generateStream(prompt, (text) => {
+      if (!closed) {
+        res.write(`data: ${JSON.stringify({ text })}\n\n`);
+      }
+    }, { signal: abort.signal });
+    if (!closed) {
+      res.write('event: done\ndata: {}\n\n');
+      res.end();
+    }
+  } catch (error) {
+    if (error.cancelled) {
+      return;
+    }
+    console.error(`${failureMessage}:`, error);
+    if (!closed) {
+      const message = error.statusCode === 503 ? error.message : failureMessage;
+      res.write(`event: error\ndata: ${JSON.stringify({ error: message })}\n\n`);
+      res.end();
+    }
+  }
+}
+
 // AI Prediction endpoint
 app.post('/api/predict', async (req, res) => {
   try {
     const { team1, team2, matchType } = req.body;
-    
-    // Import Gemini AI
-    const { GoogleGenerativeAI } = require('@google/generative-ai');
-    const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY);
-    const model = genAI.getGenerativeModel({ model: 'gemini-pro' });
 
     const prompt = `
     Analyze these two cricket teams and predict which team is more likely to win in a ${matchType} match:
@@ -782,12 +1040,19 @@ app.post('/api/predict', async (req, res) => {
     Format as JSON.
     `;
 
-    const result = await model.generateContent(prompt);
-    const response = await result.response;
-    const text = response.text();
+    if (wantsStream(req)) {
+      aiClient.checkCircuit(); // fail with a plain 503 before the stream opens
+      return streamAIResponse(res, prompt, 'Failed to generate prediction');
+    }
+
+    const text = await aiClient.generate(prompt);
 
     res.json({ prediction: text });
   } catch (error) {
+    if (error.statusCode === 503) {
+      res.set('Retry-After', String(error.retryAfter || 5));
+      return res.status(503).json({ error: error.message });
+    }
     console.error('AI Prediction error:', error);
     res.status(500).json({ error: 'Failed to generate prediction' });
   }
@@ -797,10 +1062,6 @@ app.post('/api/predict', async (req, res) => {
 app.post('/api/simulate-tournament', async (req, res) => {
   try {
     const { teams, tournamentType } = req.body;
-    
-    const { GoogleGenerativeAI } = require('@google/generative-ai');
-    const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY);
-    const model = genAI.getGenerativeModel({ model: 'gemini-pro' });
 
     const prompt = `
     Simulate a ${tournamentType} cricket tournament with these teams:
@@ -821,12 +1082,19 @@ app.post('/api/simulate-tournament', async (req, res) => {
     Format as detailed JSON with match results and analysis.
     `;
 
-    const result = await model.generateContent(prompt);
-    const response = await result.response;
-    const text = response.text();
+    if (wantsStream(req)) {
+      aiClient.checkCircuit(); // fail with a plain 503 before the stream opens
+      return streamAIResponse(res, prompt, 'Failed to simulate tournament');
+    }
+
+    const text = await aiClient.generate(prompt);
 
     res.json({ simulation: text });
   } catch (error) {
+    if (error.statusCode === 503) {
+      res.set('Retry-After', String(error.retryAfter || 5));
+      return res.status(503).json({ error: error.message });
+    }
     console.error('Tournament simulation error:', error);
     res.status(500).json({ error: 'Failed to simulate tournament' });
   }
@@ -834,7 +1102,36 @@ app.post('/api/simulate-tournament', async (req, res) => {
 
 // API Routes
 app.get('/api/players', (req, res) => {
-  res.json(playersData);
+  const { role, country } = req.query;
+  if (!role && !country) {
+    return sendJson(res, playersJson);
+  }
+
+  // Use the catalog's secondary indexes when available
+  if (catalogIndexes) {
+    const roleIds = role ? (catalogIndexes.byRole[role] || []) : null;
+    const countryIds = country ? new Set(catalogIndexes.byCountry[country] || []) : null;
+    const ids = roleIds ? roleIds.filter(id => !countryIds || countryIds.has(id)) : Array.from(countryIds);
+    return sendJson(res, serializePlayers(ids.map(id => playersById.get(id)).filter(Boolean)));
+  }
+
+  sendJson(res, serializePlayers(playersData.filter(player =>
+    (!role || player.role === role) && (!country || player.country === country)
+  )));
+});
+
+// Typeahead player search, ranked by match quality then rating
+// match=contains also matches names and countries containing q mid-word
+app.get('/api/players/search', (req, res) => {
+  const { q, role, country } = req.query;
+  const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 10, 1), 50);
+  const contains = req.query.match === 'contains';
+
+  const filter = role || country
+    ? (player) => (!role || player.role === role) && (!country || player.country === country)
+    : null;
+
+  res.json(playerSearchIndex.search(q, { limit, filter, contains }));
 });
 
 // Get players for a specific tournament
@@ -891,17 +1188,18 @@ app.get('/api/tournaments/:tournamentId/players', (req, res) => {
     }
   };
   
-  const tournamentData = tournamentPlayers[tournamentId];
+  // The curated lists above define each tournament's pool; pools precomputed by
+  // build_catalog.py only cover tournaments without one
+  const playerIds = tournamentPlayers[tournamentId]?.playerIds || catalogPools?.[tournamentId];
   
-  if (!tournamentData) {
+  if (!playerIds) {
     // If no specific tournament data, return all players
-    return res.json(playersData);
+    return sendJson(res, playersJson);
   }
   
-  // Filter players based on tournament
-  const filteredPlayers = playersData.filter(player => 
-    tournamentData.playerIds.includes(player.id)
-  );
+  // Filter players based on tournament (catalog order, constant-time membership)
+  const poolIds = new Set(playerIds);
+  const filteredPlayers = playersData.filter(player => poolIds.has(player.id));
   
   res.json({
     tournament: tournamentId,
@@ -911,12 +1209,172 @@ app.get('/api/tournaments/:tournamentId/players', (req, res) => {
   });
 });
 
+// Paginated auction history (compact, id-based records)
+app.get('/api/room/:roomId/history', (req, res) => {
+  const room = auctionRooms.get(req.params.roomId);
+  if (!room) {
+    return res.status(404).json({ error: 'Room not found' });
+  }
+
+  const offset = Math.max(parseInt(req.query.offset, 10) || 0, 0);
+  const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), 500);
+  const records = room.getHistory(offset, limit);
+
+  const response = {
+    roomId: room.roomId,
+    total: room.auctionHistory.length,
+    offset,
+    limit,
+    records
+  };
+
+  // Optionally include the catalog entries referenced by this page
+  if (req.query.include === 'players') {
+    response.players = {};
+    records.forEach(record => {
+      response.players[record.playerId] = room.getPlayer(record.playerId);
+    });
+  }
+
+  res.json(response);
+});
+
+// Full auction history as newline-delimited JSON
+app.get('/api/room/:roomId/history.ndjson', (req, res) => {
+  const room = auctionRooms.get(req.params.roomId);
+  if (!room) {
+    return res.status(404).json({ error: 'Room not found' });
+  }
+
+  res.setHeader('Content-Type', 'application/x-ndjson');
+  res.setHeader('Content-Disposition', `attachment; filename="auction-${room.roomId}.ndjson"`);
+
+  // Serialized lazily and written in batches that wait for the socket to drain
+  writeLines(res, (function* lines() {
+    for (const record of room.auctionHistory) {
+      yield JSON.stringify(record);
+    }
+  })());
+});
+
+// Lots and bids of one room as NDJSON, for auction_analytics.py (bids=0 leaves out bid lines)
+app.get('/api/room/:roomId/export.ndjson', (req, res) => {
+  const room = auctionRooms.get(req.params.roomId);
+  if (!room) {
+    return res.status(404).json({ error: 'Room not found' });
+  }
+
+  res.setHeader('Content-Type', 'application/x-ndjson');
+  res.setHeader('Content-Disposition', `attachment; filename="auction-export-${room.roomId}.ndjson"`);
+  writeLines(res, roomLines(room, { bids: req.query.bids !== '0' }));
+});
+
+// Lots and bids of many rooms as one NDJSON stream, filtered by ids, status and
+// creation time (from/to in epoch ms), oldest room first
+app.get('/api/rooms/export.ndjson', (req, res) => {
+  const from = req.query.from !== undefined ? Number(req.query.from) : undefined;
+  const to = req.query.to !== undefined ? Number(req.query.to) : undefined;
+  if (Number.isNaN(from) || Number.isNaN(to)) {
+    return res.status(400).json({ error: 'from and to must be epoch milliseconds' });
+  }
+
+  const rooms = selectRooms(auctionRooms, {
+    ids: req.query.ids ? String(req.query.ids).split(',') : null,
+    status: req.query.status,
+    from,
+    to
+  });
+  const includeBids = req.query.bids !== '0';
+
+  res.setHeader('Content-Type', 'application/x-ndjson');
+  res.setHeader('Content-Disposition', 'attachment; filename="auction-export.ndjson"');
+  res.setHeader('X-Room-Count', String(rooms.length));
+  writeLines(res, (function* lines() {
+    for (const room of rooms) {
+      yield* roomLines(room, { bids: includeBids });
+    }
+  })());
+});
+
+// Socket rate limiter counters, for tuning the limits
+app.get('/api/stats/socket-limits', (req, res) => {
+  res.json(socketRateLimiter.getStats());
+});
+
+// Event-loop pressure level and shed counts
+app.get('/api/stats/admission', (req, res) => {
+  res.json(admissionController.getStats());
+});
+
+// Memory, timer and object counts for soak runs (start with --expose-gc and pass gc=1
+// to measure after a full collection)
+app.get('/api/stats/runtime', (req, res) => {
+  const gcForced = req.query.gc === '1' && typeof global.gc === 'function';
+  if (gcForced) {
+    global.gc();
+  }
+
+  const resources = {};
+  process.getActiveResourcesInfo().forEach(type => {
+    resources[type] = (resources[type] || 0) + 1;
+  });
+  let activeRooms = 0;
+  auctionRooms.forEach(room => {
+    if (room.status === 'active') {
+      activeRooms++;
+    }
+  });
+
+  res.json({
+    uptime: process.uptime(),
+    gcForced,
+    memory: process.memoryUsage(),
+    timers: resources.Timeout || 0,
+    resources,
+    auctionRooms: auctionRooms.size,
+    activeRooms,
+    tournaments: tournaments.size,
+    users: memberships.size,
+    sockets: io.engine.clientsCount
+  });
+});
+
+// Shared upstream match-data fetchers: subscribers, conditional-request and cache counts
+app.get('/api/stats/match-data', (req, res) => {
+  res.json(performanceTracker.getMatchDataStats());
+});
+
+// Spectated rooms, audience size and summary tick counts
+app.get('/api/stats/spectators', (req, res) => {
+  res.json(spectatorBroadcaster.getStats());
+});
+
+// Worker pool size, queue depth and job counts
+app.get('/api/stats/workers', (req, res) => {
+  res.json(workerPool.getStats());
+});
+
+// Indexed users, their sockets and room/tournament memberships
+app.get('/api/stats/memberships', (req, res) => {
+  res.json(memberships.getStats());
+});
+
+// AI client queue and circuit breaker state
+app.get('/api/stats/ai', (req, res) => {
+  res.json(aiClient.getStats());
+});
+
+// Rooms and tournaments a user hosts, administers or has joined, from the membership index
+app.get('/api/users/:id/memberships', (req, res) => {
+  res.json(describeMemberships(req.params.id));
+});
+
 app.get('/api/room/:roomId', (req, res) => {
   const room = auctionRooms.get(req.params.roomId);
   if (!room) {
     return res.status(404).json({ error: 'Room not found' });
   }
-  res.json(room.getState());
+  sendJson(res, serializeRoomState(room));
 });
 
 const PORT = process.env.PORT || 5000;
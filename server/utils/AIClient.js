@@ -0,0 +1,387 @@
+// Shared Gemini client with a bounded call queue, per-call deadlines and a circuit breaker
+
+// Offline stand-in for the Gemini model, selected with AI_PROVIDER=stub
+class StubModel {
+  constructor(options = {}) {
+    this.latency = options.latency || 50;
+  }
+
+  async generateContent(prompt, options = {}) {
+    await new Promise((resolve, reject) => {
+      const timer = setTimeout(resolve, this.latency);
+      options.signal?.addEventListener('abort', () => {
+        clearTimeout(timer);
+        reject(new Error('Stub request aborted'));
+      }, { once: true });
+    });
+    const text = JSON.stringify({
+      stub: true,
+      message: 'Offline AI stub response',
+      promptLength: prompt.length
+    });
+    return { response: { text: () => text } };
+  }
+
+  // Mirrors generateContentStream: the text arrives as a series of small chunks
+  async generateContentStream(prompt, options = {}) {
+    const { response } = await this.generateContent(prompt, options);
+    const words = response.text().split(/(?<=,)/);
+    const latency = this.latency;
+
+    async function* chunks() {
+      for (const word of words) {
+        await new Promise(resolve => setTimeout(resolve, latency / words.length));
+        yield { text: () => word };
+      }
+    }
+
+    return { stream: chunks(), response: Promise.resolve(response) };
+  }
+}
+
+function cancelledError() {
+  const error = new Error('AI request cancelled');
+  error.cancelled = true;
+  return error;
+}
+
+function unavailableError(message, retryAfter) {
+  const error = new Error(message);
+  error.statusCode = 503;
+  error.retryAfter = retryAfter;
+  return error;
+}
+
+class AIClient {
+  constructor(options = {}) {
+    this.provider = options.provider || process.env.AI_PROVIDER || 'gemini';
+    this.modelName = options.modelName || 'gemini-pro';
+    this.maxConcurrent = options.maxConcurrent || parseInt(process.env.AI_MAX_CONCURRENCY, 10) || 4;
+    this.maxQueue = options.maxQueue || parseInt(process.env.AI_MAX_QUEUE, 10) || 50;
+    this.timeoutMs = options.timeoutMs || parseInt(process.env.AI_TIMEOUT_MS, 10) || 20000;
+
+    // Circuit breaker: open after consecutive failures, allow one trial call after the cooldown
+    this.failureThreshold = options.failureThreshold || 5;
+    this.cooldownMs = options.cooldownMs || 30000;
+    this.circuit = 'closed'; // closed, open, half-open
+    this.consecutiveFailures = 0;
+    this.openedAt = 0;
+
+    this.model = options.model || null;
+    this.active = 0;
+    this.overdue = 0; // running calls past their deadline whose upstream has not settled
+    this.queue = []; // { task, resolve, reject, deadline, timer, signal, onAbort, idle }
+    this.stats = { completed: 0, failed: 0, timedOut: 0, rejectedQueueFull: 0, rejectedCircuitOpen: 0, cancelled: 0 };
+  }
+
+  // Create the underlying model once and reuse it for every request
+  getModel() {
+    if (!this.model) {
+      if (this.provider === 'stub') {
+        this.model = new StubModel();
+      } else {
+        const { GoogleGenerativeAI } = require('@google/generative-ai');
+        const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY);
+        this.model = genAI.getGenerativeModel({ model: this.modelName });
+      }
+    }
+    return this.model;
+  }
+
+  // Generate text for a prompt through the queue and breaker. The abort signal
+  // fires on timeout; SDK versions that accept request options cancel the call.
+  async generate(prompt) {
+    return this.run(async (model, signal) => {
+      const result = await model.generateContent(prompt, { signal });
+      const response = await result.response;
+      return response.text();
+    });
+  }
+
+  // Stream generated text to onChunk as it arrives; resolves once the stream ends.
+  // The deadline covers the first chunk and each gap between chunks rather than the
+  // whole stream, so long answers that keep producing text are not cut off.
+  // options.signal cancels the call (e.g. the client went away) without counting
+  // against the circuit breaker.
+  async generateStream(prompt, onChunk, options = {}) {
+    return this.run(async (model, signal, touch) => {
+      const result = await model.generateContentStream(prompt, { signal });
+      const iterator = result.stream[Symbol.asyncIterator]();
+      // Stop pulling from upstream as soon as the call is aborted
+      const stop = () => iterator.return?.();
+      signal.addEventListener('abort', stop, { once: true });
+      try {
+        for (;;) {
+          const { value, done } = await iterator.next();
+          if (done || signal.aborted) {
+            return;
+          }
+          touch();
+          onChunk(value.text());
+        }
+      } finally {
+        signal.removeEventListener('abort', stop);
+      }
+    }, { signal: options.signal, idle: true });
+  }
+
+  // Queue an upstream call; rejects fast when the circuit is open or the queue is full.
+  // The task is called with (model, abortSignal, touch); with options.idle each
+  // touch() restarts the deadline.
+  run(task, options = {}) {
+    this.checkCircuit();
+
+    if (this.active >= this.maxConcurrent && this.queue.length >= this.maxQueue) {
+      this.stats.rejectedQueueFull++;
+      return Promise.reject(unavailableError('AI service is busy, please retry shortly', 5));
+    }
+
+    if (options.signal?.aborted) {
+      this.stats.cancelled++;
+      return Promise.reject(cancelledError());
+    }
+
+    return new Promise((resolve, reject) => {
+      const job = { task, resolve, reject, deadline: Date.now() + this.timeoutMs, signal: options.signal, idle: options.idle };
+      // Queued callers are answered at their own deadline or on cancel, even if no slot ever frees
+      job.timer = setTimeout(() => this.expireQueued(job), this.timeoutMs);
+      if (job.signal) {
+        job.onAbort = () => {
+          this.dequeue(job);
+          this.stats.cancelled++;
+          job.reject(cancelledError());
+        };
+        job.signal.addEventListener('abort', job.onAbort, { once: true });
+      }
+      this.queue.push(job);
+      this.drain();
+    });
+  }
+
+  // Take a job out of the queue and drop its queue timer and cancel listener
+  dequeue(job) {
+    const position = this.queue.indexOf(job);
+    if (position !== -1) {
+      this.queue.splice(position, 1);
+    }
+    clearTimeout(job.timer);
+    if (job.onAbort) {
+      job.signal.removeEventListener('abort', job.onAbort);
+    }
+  }
+
+  expireQueued(job) {
+    this.dequeue(job);
+    this.stats.timedOut++;
+    job.reject(unavailableError('AI request timed out while queued', 5));
+    // Waiting out a deadline because every slot is held by an overdue call is an
+    // upstream failure too; it is what lets the breaker open on a hung upstream
+    if (this.overdue >= this.maxConcurrent) {
+      this.recordFailure();
+    }
+  }
+
+  checkCircuit() {
+    if (this.circuit !== 'open') {
+      return;
+    }
+
+    const elapsed = Date.now() - this.openedAt;
+    if (elapsed >= this.cooldownMs) {
+      this.circuit = 'half-open';
+      return;
+    }
+
+    this.stats.rejectedCircuitOpen++;
+    throw unavailableError('AI service temporarily unavailable', Math.ceil((this.cooldownMs - elapsed) / 1000));
+  }
+
+  drain() {
+    while (this.active < this.maxConcurrent && this.queue.length > 0) {
+      // Half-open allows a single trial call until it settles
+      if (this.circuit === 'half-open' && this.active > 0) {
+        return;
+      }
+
+      const job = this.queue[0];
+      this.dequeue(job);
+      const remaining = job.deadline - Date.now();
+      if (remaining <= 0) {
+        this.expireQueued(job);
+        continue;
+      }
+
+      this.active++;
+      this.execute(job, remaining);
+    }
+  }
+
+  // The caller is answered at the deadline, but the slot is only released once the
+  // upstream call itself settles: an SDK that ignores the abort signal keeps its
+  // request running, and freeing the slot early would let a hung upstream push
+  // real in-flight calls past maxConcurrent.
+  async execute(job, remaining) {
+    const controller = new AbortController();
+    let timer;
+    let expire;
+    let cancel;
+    // Settle the caller first, then abort, so the task's own abort error never wins the race
+    const timeout = new Promise((resolve, reject) => {
+      expire = () => {
+        reject(unavailableError('AI request timed out', 5));
+        controller.abort();
+        // The slot stays held until upstream settles; with every slot in that state
+        // nothing can run, so stop accepting work
+        job.overdue = true;
+        this.overdue++;
+        if (this.overdue >= this.maxConcurrent) {
+          this.openCircuit();
+        }
+      };
+      cancel = () => {
+        reject(cancelledError());
+        controller.abort();
+      };
+    });
+    timer = setTimeout(expire, remaining);
+    // Streams push the deadline back on every chunk
+    const touch = () => {
+      if (job.idle && !controller.signal.aborted) {
+        clearTimeout(timer);
+        timer = setTimeout(expire, this.timeoutMs);
+      }
+    };
+    job.signal?.addEventListener('abort', cancel, { once: true });
+
+    const call = Promise.resolve().then(() => job.task(this.getModel(), controller.signal, touch));
+    try {
+      const result = await Promise.race([call, timeout]);
+      this.recordSuccess();
+      job.resolve(result);
+    } catch (error) {
+      if (error.cancelled) {
+        // The caller went away; says nothing about upstream health
+        this.stats.cancelled++;
+      } else {
+        if (error.statusCode === 503) {
+          this.stats.timedOut++;
+        }
+        this.recordFailure();
+      }
+      job.reject(error);
+    } finally {
+      clearTimeout(timer);
+      job.signal?.removeEventListener('abort', cancel);
+      call.catch(() => {}).finally(() => {
+        if (job.overdue) {
+          this.overdue--;
+        }
+        this.active--;
+        this.drain();
+      });
+    }
+  }
+
+  recordSuccess() {
+    this.stats.completed++;
+    this.consecutiveFailures = 0;
+    this.circuit = 'closed';
+  }
+
+  recordFailure() {
+    this.stats.failed++;
+    this.consecutiveFailures++;
+    if (this.circuit === 'half-open' || this.consecutiveFailures >= this.failureThreshold) {
+      this.openCircuit();
+    }
+  }
+
+  openCircuit() {
+    this.circuit = 'open';
+    this.openedAt = Date.now();
+    // Queued callers would only hit the same failing upstream
+    this.queue.slice().forEach(job => {
+      this.dequeue(job);
+      this.stats.rejectedCircuitOpen++;
+      job.reject(unavailableError('AI service temporarily unavailable', Math.ceil(this.cooldownMs / 1000)));
+    });
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      provider: this.provider,
+      circuit: this.circuit,
+      active: this.active,
+      overdue: this.overdue,
+      queued: this.queue.length,
+      maxConcurrent: this.maxConcurrent,
+      maxQueue: this.maxQueue,
+      timeoutMs: this.timeoutMs
+    };
+  }
+}
+
+// Upstream that accepts calls and never answers, ignoring abort like the pinned SDK
+const hungModel = {
+  generateContent: () => new Promise(() => {}),
+  generateContentStream: () => new Promise(() => {})
+};
+
+// Every caller must be answered by its deadline against a hung upstream, the
+// breaker must open, and a cancelled caller must leave the queue at once
+async function runCheck(timeoutMs) {
+  const settleAll = (calls) => Promise.all(calls.map(call => call.then(() => 'resolved', error => (error.cancelled ? 'cancelled' : error.statusCode))));
+
+  const client = new AIClient({ model: hungModel, maxConcurrent: 2, maxQueue: 10, timeoutMs, cooldownMs: 60000 });
+  const started = Date.now();
+  const outcomes = await settleAll(Array.from({ length: 5 }, (_, i) => (i % 2
+    ? client.generateStream('check', () => {}, { signal: new AbortController().signal })
+    : client.generate('check'))));
+  const settledMs = Date.now() - started;
+  const afterHang = client.getStats();
+  const rejectedFast = await settleAll([client.generate('check')]);
+
+  const cancelClient = new AIClient({ model: hungModel, maxConcurrent: 1, timeoutMs: 60000 });
+  cancelClient.generate('check').catch(() => {});
+  const abort = new AbortController();
+  const queued = cancelClient.generateStream('check', () => {}, { signal: abort.signal });
+  const cancelStarted = Date.now();
+  setTimeout(() => abort.abort(), 10);
+  const [cancelOutcome] = await settleAll([queued]);
+  const cancelMs = Date.now() - cancelStarted;
+
+  const hung = {
+    outcomes,
+    settledMs,
+    queued: afterHang.queued,
+    active: afterHang.active,
+    overdue: afterHang.overdue,
+    circuit: afterHang.circuit,
+    nextCall: rejectedFast[0]
+  };
+  const cancel = { outcome: cancelOutcome, settledMs: cancelMs, queued: cancelClient.getStats().queued };
+  return {
+    hung,
+    cancel,
+    ok: outcomes.every(outcome => outcome === 503) && settledMs < timeoutMs * 3 && hung.queued === 0 &&
+      hung.circuit === 'open' && hung.nextCall === 503 &&
+      cancel.outcome === 'cancelled' && cancel.settledMs < 1000 && cancel.queued === 0
+  };
+}
+
+if (require.main === module) {
+  const { parseArgs } = require('./cliArgs');
+  const args = parseArgs(process.argv.slice(2));
+  if (!args.check) {
+    console.log('Usage: node utils/AIClient.js --check [--timeout-ms 300]');
+    process.exit(1);
+  }
+  runCheck(parseInt(args['timeout-ms'], 10) || 300).then(result => {
+    console.log(JSON.stringify(result, null, 2));
+    process.exit(result.ok ? 0 : 1);
+  });
+}
+
+module.exports = AIClient;
+module.exports.StubModel = StubModel;
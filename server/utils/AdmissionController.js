@@ -0,0 +1,158 @@
+// Admission control driven by event-loop delay and in-flight HTTP requests.
+// Under pressure, low-priority work (AI, listings, catalog downloads) is shed
+// first with a fast 503, then normal traffic; live bidding is never shed.
+const { monitorEventLoopDelay } = require('perf_hooks');
+
+const PRIORITY_RANK = { low: 1, normal: 2, critical: 3 };
+
+// Pressure levels: 0 healthy, 1 elevated (shed low), 2 overloaded (shed low and normal)
+const LEVEL_NAMES = ['healthy', 'elevated', 'overloaded'];
+const RETRY_AFTER_SECONDS = [0, 2, 5];
+
+// HTTP routes by priority; anything unlisted is normal
+const DEFAULT_ROUTE_PRIORITIES = [
+  { method: 'POST', pattern: /^\/api\/(predict|simulate-tournament)\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/tournaments\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/real-tournaments\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/players\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/tournaments\/[^/]+\/players\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/room\/[^/]+\/history(\.ndjson)?\/?$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/room\/[^/]+\/export\.ndjson$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/rooms\/export\.ndjson$/, priority: 'low' },
+  { method: 'GET', pattern: /^\/api\/stats\//, priority: 'critical' }
+];
+
+// Socket events by priority; anything unlisted is normal
+const DEFAULT_EVENT_PRIORITIES = {
+  'place-bid': 'critical',
+  'tournament-chat': 'low',
+  'get-tournament-state': 'low',
+  'subscribe-leaderboard': 'low',
+  'spectate-room': 'low'
+};
+
+class AdmissionController {
+  constructor(options = {}) {
+    this.lagElevatedMs = options.lagElevatedMs || parseInt(process.env.ADMISSION_LAG_ELEVATED_MS, 10) || 100;
+    this.lagOverloadedMs = options.lagOverloadedMs || parseInt(process.env.ADMISSION_LAG_OVERLOADED_MS, 10) || 300;
+    this.maxInFlight = options.maxInFlight || parseInt(process.env.ADMISSION_MAX_INFLIGHT, 10) || 200;
+    this.sampleIntervalMs = options.sampleIntervalMs || 500;
+    this.routePriorities = options.routePriorities || DEFAULT_ROUTE_PRIORITIES;
+    this.eventPriorities = { ...DEFAULT_EVENT_PRIORITIES, ...(options.eventPriorities || {}) };
+
+    this.level = 0;
+    this.lagMs = 0; // p99 event-loop delay over the last sample window
+    this.inFlight = 0;
+    this.stats = { admitted: 0, shed: { low: 0, normal: 0 }, socketShed: 0, levelChanges: 0 };
+
+    this.histogram = monitorEventLoopDelay({ resolution: 10 });
+    this.histogram.enable();
+    this.sampler = setInterval(() => this.sample(), this.sampleIntervalMs);
+    this.sampler.unref();
+  }
+
+  // Read and reset the delay histogram, then recompute the pressure level
+  sample() {
+    this.lagMs = this.histogram.percentile(99) / 1e6;
+    this.histogram.reset();
+    this.updateLevel();
+  }
+
+  updateLevel() {
+    const inFlightRatio = this.inFlight / this.maxInFlight;
+    let target = 0;
+    if (this.lagMs >= this.lagOverloadedMs || inFlightRatio >= 1) {
+      target = 2;
+    } else if (this.lagMs >= this.lagElevatedMs || inFlightRatio >= 0.75) {
+      target = 1;
+    }
+
+    // Step down one level at a time, and only once well below the threshold, to avoid flapping
+    if (target < this.level) {
+      const threshold = this.level === 2 ? this.lagOverloadedMs : this.lagElevatedMs;
+      const ratioThreshold = this.level === 2 ? 1 : 0.75;
+      if (this.lagMs > threshold * 0.7 || inFlightRatio > ratioThreshold * 0.7) {
+        return;
+      }
+      target = this.level - 1;
+    }
+
+    if (target !== this.level) {
+      this.level = target;
+      this.stats.levelChanges++;
+      console.log(`Admission control: ${LEVEL_NAMES[target]} (event-loop p99 ${this.lagMs.toFixed(1)}ms, ${this.inFlight} in flight)`);
+    }
+  }
+
+  // Whether work of this priority should be turned away right now
+  shouldShed(priority) {
+    return PRIORITY_RANK[priority] <= this.level;
+  }
+
+  get retryAfter() {
+    return RETRY_AFTER_SECONDS[this.level];
+  }
+
+  routePriority(req) {
+    const rule = this.routePriorities.find(r => r.method === req.method && r.pattern.test(req.path));
+    return rule ? rule.priority : 'normal';
+  }
+
+  // Express middleware; install before body parsing so shed requests cost almost nothing
+  middleware() {
+    return (req, res, next) => {
+      const priority = this.routePriority(req);
+      if (this.shouldShed(priority)) {
+        this.stats.shed[priority]++;
+        res.set('Retry-After', String(this.retryAfter));
+        return res.status(503).json({ error: 'Server is busy, please retry shortly', retryAfter: this.retryAfter });
+      }
+
+      this.stats.admitted++;
+      this.inFlight++;
+      let finished = false;
+      const done = () => {
+        if (!finished) {
+          finished = true;
+          this.inFlight--;
+        }
+      };
+      res.on('finish', done);
+      res.on('close', done);
+      next();
+    };
+  }
+
+  // Per-socket middleware; bids and other critical events always pass
+  attach(socket) {
+    socket.use((packet, next) => {
+      const event = packet[0];
+      const priority = this.eventPriorities[event] || 'normal';
+      if (!this.shouldShed(priority)) {
+        next();
+        return;
+      }
+      this.stats.socketShed++;
+      socket.emit('error', { message: 'Server is busy, please retry shortly', event, retryAfter: this.retryAfter });
+    });
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      shed: { ...this.stats.shed },
+      level: LEVEL_NAMES[this.level],
+      eventLoopDelayP99Ms: Math.round(this.lagMs * 10) / 10,
+      inFlight: this.inFlight,
+      maxInFlight: this.maxInFlight,
+      thresholds: { lagElevatedMs: this.lagElevatedMs, lagOverloadedMs: this.lagOverloadedMs }
+    };
+  }
+
+  stop() {
+    clearInterval(this.sampler);
+    this.histogram.disable();
+  }
+}
+
+module.exports = AdmissionController;
@@ -0,0 +1,109 @@
+// NDJSON export of auction rooms for offline pricing analysis (see auction_analytics.py).
+// Each line is one self-contained record tagged by type, so exports of many rooms
+// can simply be concatenated:
+//
+//   {"type":"room","roomId","mode","budget","status","createdAt","completedAt","teams":[{"teamId","name"}]}
+//   {"type":"lot","roomId","playerId","role","basePrice","rating","teamId","price","status","bids","timestamp"}
+//   {"type":"bid","roomId","playerId","teamId","amount","timestamp"}
+//
+// Lots carry the catalog fields the analysis needs so it never has to join against
+// the catalog; timestamps are epoch milliseconds on the room's clock.
+
+const BATCH_SIZE = 500;
+
+// Lines for one room: the room header, then its lots, then (optionally) every bid
+function* roomLines(room, options = {}) {
+  const includeBids = options.bids !== false;
+  const roomId = room.roomId;
+
+  yield JSON.stringify({
+    type: 'room',
+    roomId,
+    mode: room.settings.mode,
+    budget: room.settings.budget || 0,
+    parallelLots: room.parallelLots,
+    status: room.status,
+    createdAt: room.createdAt,
+    completedAt: room.completedAt,
+    teams: Array.from(room.teams.entries()).map(([teamId, team]) => ({ teamId, name: team.name }))
+  });
+
+  for (const record of room.auctionHistory) {
+    const player = room.getPlayer(record.playerId) || {};
+    yield JSON.stringify({
+      type: 'lot',
+      roomId,
+      playerId: record.playerId,
+      role: player.role || null,
+      basePrice: player.basePrice || null,
+      rating: player.rating || null,
+      teamId: record.teamId,
+      price: record.price,
+      status: record.status,
+      bids: record.bids || 0,
+      timestamp: record.timestamp
+    });
+  }
+
+  if (includeBids) {
+    for (const bid of room.bidLog) {
+      yield JSON.stringify({ type: 'bid', roomId, playerId: bid.playerId, teamId: bid.teamId, amount: bid.amount, timestamp: bid.timestamp });
+    }
+  }
+}
+
+// Rooms picked by id list, status and creation-time range ([from, to) in epoch ms), in creation order
+function selectRooms(rooms, { ids, status, from, to } = {}) {
+  const idSet = ids && ids.length > 0 ? new Set(ids) : null;
+  const selected = [];
+  rooms.forEach(room => {
+    if (idSet && !idSet.has(room.roomId)) {
+      return;
+    }
+    if (status && room.status !== status) {
+      return;
+    }
+    if ((from !== undefined && room.createdAt < from) || (to !== undefined && room.createdAt >= to)) {
+      return;
+    }
+    selected.push(room);
+  });
+  return selected;
+}
+
+// Stream lines to an HTTP response in batches, waiting for the socket to drain
+// so a large export never sits in memory; stops early if the client goes away
+async function writeLines(res, lines) {
+  let batch = [];
+  const flush = async () => {
+    const ok = res.write(batch.join('\n') + '\n');
+    batch = [];
+    if (!ok && !res.destroyed) {
+      await new Promise(resolve => {
+        const done = () => {
+          res.off('drain', done);
+          res.off('close', done);
+          resolve();
+        };
+        res.on('drain', done);
+        res.on('close', done);
+      });
+    }
+  };
+
+  for (const line of lines) {
+    if (res.destroyed) {
+      return;
+    }
+    batch.push(line);
+    if (batch.length >= BATCH_SIZE) {
+      await flush();
+    }
+  }
+  if (batch.length > 0 && !res.destroyed) {
+    await flush();
+  }
+  res.end();
+}
+
+module.exports = { roomLines, selectRooms, writeLines };
@@ -0,0 +1,55 @@
+// Bounded log of recent state changes for one room or tournament.
+// Every change bumps a monotonically increasing version; a reconnecting client
+// sends the last version it saw and gets only the events it missed, or null when
+// they have already been dropped and it needs a full snapshot instead.
+
+const DEFAULT_CAPACITY = parseInt(process.env.EVENT_LOG_CAPACITY, 10) || 256;
+
+class EventLog {
+  constructor(capacity = DEFAULT_CAPACITY) {
+    this.capacity = capacity;
+    this.entries = new Array(capacity); // ring buffer of { version, type, payload }
+    this.start = 0;
+    this.length = 0;
+    this.version = 0;
+  }
+
+  // Record an event and return its version
+  append(type, payload) {
+    this.version++;
+    const entry = { version: this.version, type, payload };
+    if (this.length < this.capacity) {
+      this.entries[(this.start + this.length) % this.capacity] = entry;
+      this.length++;
+    } else {
+      this.entries[this.start] = entry;
+      this.start = (this.start + 1) % this.capacity;
+    }
+    return this.version;
+  }
+
+  // Oldest version still held (version + 1 when empty)
+  get oldestVersion() {
+    return this.length > 0 ? this.entries[this.start].version : this.version + 1;
+  }
+
+  // Events after sinceVersion, oldest first; null when the gap is no longer covered
+  since(sinceVersion) {
+    if (!Number.isInteger(sinceVersion) || sinceVersion < 0 || sinceVersion > this.version) {
+      return null;
+    }
+    if (sinceVersion + 1 < this.oldestVersion) {
+      return null;
+    }
+    const skip = sinceVersion + 1 - this.oldestVersion;
+    const events = [];
+    for (let i = skip; i < this.length; i++) {
+      events.push(this.entries[(this.start + i) % this.capacity]);
+    }
+    return events;
+  }
+}
+
+EventLog.DEFAULT_CAPACITY = DEFAULT_CAPACITY;
+
+module.exports = EventLog;
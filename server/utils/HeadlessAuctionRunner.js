@@ -0,0 +1,198 @@
+// Runs AuctionRoom end to end on a VirtualClock with bot bidders, no sockets
+// or wall-clock waits. Used for fast end-to-end checks, pricing-balance runs
+// and throughput benchmarks of the bid logic:
+//
+//   node utils/HeadlessAuctionRunner.js --auctions 1000 --teams 8 --seed 42 [--parallel 4] [--export sim.ndjson]
+
+const fs = require('fs');
+const path = require('path');
+const AuctionRoom = require('../models/AuctionRoom');
+const VirtualClock = require('./VirtualClock');
+const SeededRandom = require('./SeededRandom');
+const { roomLines } = require('./AuctionExport');
+const { parseArgs } = require('./cliArgs');
+
+const DEFAULT_BID_INCREMENT = 100000;
+
+// Default bot: values a player at basePrice scaled by rating and its own appetite,
+// and raises by one increment while the price stays under that value
+function valuationStrategy(bot, auction, room) {
+  const { player, currentBid } = auction;
+  const increment = room.settings.bidIncrement || DEFAULT_BID_INCREMENT;
+  // Standard rooms open at basePrice and need a strictly higher bid; other modes open at 0
+  const nextBid = currentBid > 0 ? currentBid + increment : (player.basePrice || increment);
+  const value = (player.basePrice || increment) * (0.5 + (player.rating || 50) / 50) * bot.appetite;
+  return nextBid <= value ? nextBid : null;
+}
+
+class HeadlessAuctionRunner {
+  constructor(options = {}) {
+    this.players = options.players || [];
+    this.teams = options.teams || 4;
+    this.settings = { mode: 'standard', budget: 100000000, bidTimeout: 30, ...options.settings };
+    this.strategy = options.strategy || valuationStrategy;
+    this.seed = options.seed || 1;
+    this.maxSteps = options.maxSteps || 1000000;
+    this.onAuction = options.onAuction || null; // called with each finished room, e.g. to export it
+  }
+
+  // Play one auction to completion; returns the finished room, bid count and virtual duration
+  runAuction(seed = this.seed) {
+    const random = new SeededRandom(seed);
+    const clock = new VirtualClock();
+    const catalog = { players: this.players, byId: new Map(this.players.map(player => [player.id, player])) };
+    const bots = [];
+    const pendingBids = new Map(); // lotId -> timer
+    let bids = 0;
+
+    // Every bot still willing to pay answers each new price after a random think time
+    // and the quickest one raises. Only that first response matters, so draw it
+    // directly (the minimum of n uniform delays) and keep a single timer per lot.
+    const scheduleBid = (room, auction) => {
+      clock.clearTimeout(pendingBids.get(auction.lotId));
+      pendingBids.delete(auction.lotId);
+
+      const offers = [];
+      bots.forEach(bot => {
+        if (auction.highestBidder === bot.teamId) {
+          return;
+        }
+        const amount = this.strategy(bot, auction, room);
+        if (amount === null || amount === undefined) {
+          return;
+        }
+        if (room.settings.mode === 'standard' && room.availableBudget(bot.teamId, auction) < amount) {
+          return;
+        }
+        offers.push({ teamId: bot.teamId, amount });
+      });
+      if (offers.length === 0) {
+        return;
+      }
+
+      const offer = random.pick(offers);
+      const firstResponse = 1 - Math.pow(1 - random.next(), 1 / offers.length);
+      const delay = Math.round((0.05 + 0.85 * firstResponse) * room.bidTimeoutMs);
+      pendingBids.set(auction.lotId, clock.setTimeout(() => {
+        pendingBids.delete(auction.lotId);
+        try {
+          room.placeBid(offer.teamId, offer.amount, auction.lotId);
+        } catch (error) {
+          // A bid on another lot took the budget meanwhile; let the others reconsider
+          scheduleBid(room, auction);
+        }
+      }, delay));
+    };
+
+    const room = new AuctionRoom(`SIM-${seed}`, 'headless', this.settings, {
+      catalog,
+      clock,
+      onEvent: (type, eventRoom, payload) => {
+        if (type === 'lot-opened') {
+          scheduleBid(eventRoom, eventRoom.openLots.get(payload.lot.lotId));
+        } else if (type === 'bid-placed') {
+          bids++;
+          scheduleBid(eventRoom, eventRoom.openLots.get(payload.lotId));
+        } else if (type === 'lot-closed') {
+          clock.clearTimeout(pendingBids.get(payload.lotId));
+          pendingBids.delete(payload.lotId);
+        }
+      }
+    });
+
+    for (let i = 0; i < this.teams; i++) {
+      const teamId = `bot-${i + 1}`;
+      room.addTeam(teamId, { name: `Bot ${i + 1}` });
+      bots.push({ teamId, appetite: random.range(0.8, 1.3) });
+    }
+
+    room.startAuction();
+    clock.runAll(this.maxSteps);
+    if (room.status !== 'completed') {
+      throw new Error(`Auction ${room.roomId} did not finish within ${this.maxSteps} timer steps`);
+    }
+    return { room, bids, virtualMs: clock.now() };
+  }
+
+  // Play several auctions with consecutive seeds and aggregate the results
+  run(auctions = 1) {
+    const startedAt = process.hrtime.bigint();
+    const totals = { auctions, lots: 0, sold: 0, unsold: 0, bids: 0, spend: 0, virtualMs: 0 };
+    const priceToBase = []; // sale price / base price per sold lot
+
+    for (let i = 0; i < auctions; i++) {
+      const { room, bids, virtualMs } = this.runAuction(this.seed + i);
+      if (this.onAuction) {
+        this.onAuction(room);
+      }
+      totals.bids += bids;
+      totals.virtualMs += virtualMs;
+      room.auctionHistory.forEach(record => {
+        totals.lots++;
+        if (record.status === 'sold') {
+          totals.sold++;
+          totals.spend += record.price;
+          const player = room.getPlayer(record.playerId);
+          if (player && player.basePrice) {
+            priceToBase.push(record.price / player.basePrice);
+          }
+        } else {
+          totals.unsold++;
+        }
+      });
+    }
+
+    const elapsedMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+    priceToBase.sort((a, b) => a - b);
+    const quantile = (q) => (priceToBase.length ? priceToBase[Math.floor(q * (priceToBase.length - 1))] : null);
+
+    return {
+      ...totals,
+      elapsedMs: Math.round(elapsedMs),
+      auctionsPerSecond: Math.round(auctions / (elapsedMs / 1000)),
+      speedup: Math.round(totals.virtualMs / Math.max(elapsedMs, 1)),
+      priceToBase: { p10: quantile(0.1), median: quantile(0.5), p90: quantile(0.9) }
+    };
+  }
+}
+
+if (require.main === module) {
+  const args = parseArgs(process.argv.slice(2));
+  const catalogFile = path.join(__dirname, '../../data/catalog/players.json');
+  const playersFile = fs.existsSync(catalogFile) ? catalogFile : path.join(__dirname, '../../data/players.json');
+  let players = JSON.parse(fs.readFileSync(playersFile, 'utf8'));
+  if (args.players) {
+    players = players.slice(0, parseInt(args.players, 10));
+  }
+
+  // Append each finished auction to an NDJSON export for auction_analytics.py
+  let exportFd = null;
+  if (args.export) {
+    exportFd = fs.openSync(args.export, 'w');
+  }
+
+  const runner = new HeadlessAuctionRunner({
+    players,
+    teams: parseInt(args.teams, 10) || 4,
+    seed: parseInt(args.seed, 10) || 1,
+    settings: {
+      mode: args.mode || 'standard',
+      budget: parseInt(args.budget, 10) || 100000000,
+      bidIncrement: parseInt(args.increment, 10) || DEFAULT_BID_INCREMENT,
+      parallelLots: parseInt(args.parallel, 10) || 1
+    },
+    onAuction: exportFd === null ? null : (room) => {
+      fs.writeSync(exportFd, Array.from(roomLines(room, { bids: args.bids !== '0' })).join('\n') + '\n');
+    }
+  });
+
+  console.log(`🏏 Simulating ${args.auctions || 1} auction(s) over ${players.length} players...`);
+  console.log(JSON.stringify(runner.run(parseInt(args.auctions, 10) || 1), null, 2));
+  if (exportFd !== null) {
+    fs.closeSync(exportFd);
+    console.log(`📦 Exported to ${args.export}`);
+  }
+}
+
+module.exports = HeadlessAuctionRunner;
+module.exports.valuationStrategy = valuationStrategy;
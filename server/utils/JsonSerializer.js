@@ -0,0 +1,149 @@
+// Schema-compiled JSON serializers for hot payloads.
+//
+// compile(schema) turns a description of a payload's shape into a function that
+// writes exactly the keys the schema lists, with no per-call reflection. The
+// output parses to the same value JSON.stringify would produce (undefined keys
+// omitted, non-finite numbers as null); values that don't match their declared
+// type fall back to JSON.stringify, so a schema can be wrong about types but not
+// about which keys exist.
+//
+// Schema types:
+//   string | number | integer | boolean | any
+//   object   { properties: { key: schema }, additionalProperties: true to also copy undeclared keys }
+//   array    { items: schema }
+//   cached   objects that never change once built (catalog players): encoded once, by identity
+//   custom   { serialize: (value, ctx) => json }
+// Any property schema may add get: (parent, ctx) => value to compute the value instead of reading parent[key].
+
+// Pre-serialized JSON carried through objects and Socket.io emits (see SocketParser)
+class RawJson {
+  constructor(json) {
+    this.json = json;
+  }
+
+  // Only reached when something generic serializes it, e.g. res.json
+  toJSON() {
+    return JSON.parse(this.json);
+  }
+}
+
+function any(value) {
+  if (value instanceof RawJson) {
+    return value.json;
+  }
+  const json = JSON.stringify(value);
+  return json === undefined ? 'null' : json;
+}
+
+const fragments = new WeakMap(); // immutable object -> its JSON
+
+function cachedJson(value) {
+  if (value === null || typeof value !== 'object') {
+    return any(value);
+  }
+  let json = fragments.get(value);
+  if (json === undefined) {
+    json = JSON.stringify(value);
+    fragments.set(value, json);
+  }
+  return json;
+}
+
+// Cached object JSON with extra `"key":value` pairs appended, as JSON of { ...value, ...extra } would be
+function extendCached(value, pairs) {
+  const json = cachedJson(value === undefined ? {} : value);
+  return json.length > 2 ? `${json.slice(0, -1)},${pairs}}` : `{${pairs}}`;
+}
+
+function string(value) {
+  return typeof value === 'string' ? JSON.stringify(value) : any(value);
+}
+
+function number(value) {
+  if (typeof value === 'number') {
+    return Number.isFinite(value) ? '' + value : 'null';
+  }
+  return any(value);
+}
+
+function boolean(value) {
+  if (value === true) {
+    return 'true';
+  }
+  return value === false ? 'false' : any(value);
+}
+
+function compileArray(schema) {
+  const item = compile(schema.items || { type: 'any' });
+  return (value, ctx) => {
+    if (!Array.isArray(value)) {
+      return any(value);
+    }
+    let out = '[';
+    for (let i = 0; i < value.length; i++) {
+      const element = value[i];
+      if (i > 0) {
+        out += ',';
+      }
+      out += element === undefined || typeof element === 'function' ? 'null' : item(element, ctx);
+    }
+    return out + ']';
+  };
+}
+
+// Generates straight-line code: one read, one check and one append per declared key
+function compileObject(schema) {
+  const properties = schema.properties || {};
+  const keys = Object.keys(properties);
+  const serializers = keys.map(key => compile(properties[key]));
+  const getters = keys.map(key => properties[key].get || null);
+
+  let body = 'if (obj === null || typeof obj !== "object" || obj instanceof RawJson) return any(obj);\n';
+  body += 'let out = "{"; let sep = ""; let v;\n';
+  keys.forEach((key, i) => {
+    body += getters[i] ? `v = g${i}(obj, ctx);\n` : `v = obj[${JSON.stringify(key)}];\n`;
+    body += `if (v !== undefined && typeof v !== "function") { out += sep + ${JSON.stringify(JSON.stringify(key) + ':')} + s${i}(v, ctx); sep = ","; }\n`;
+  });
+  if (schema.additionalProperties) {
+    body += 'for (const key in obj) {\n';
+    body += '  if (declared.has(key) || !Object.prototype.hasOwnProperty.call(obj, key)) continue;\n';
+    body += '  v = obj[key];\n';
+    body += '  if (v !== undefined && typeof v !== "function") { out += sep + JSON.stringify(key) + ":" + any(v); sep = ","; }\n';
+    body += '}\n';
+  }
+  body += 'return out + "}";';
+
+  const params = ['any', 'RawJson', 'declared'];
+  const args = [any, RawJson, new Set(keys)];
+  keys.forEach((key, i) => {
+    params.push(`s${i}`, `g${i}`);
+    args.push(serializers[i], getters[i]);
+  });
+  // eslint-disable-next-line no-new-func
+  const factory = new Function(...params, `return function serialize(obj, ctx) {\n${body}\n};`);
+  return factory(...args);
+}
+
+function compile(schema) {
+  switch (schema.type) {
+    case 'object':
+      return compileObject(schema);
+    case 'array':
+      return compileArray(schema);
+    case 'string':
+      return string;
+    case 'number':
+    case 'integer':
+      return number;
+    case 'boolean':
+      return boolean;
+    case 'cached':
+      return cachedJson;
+    case 'custom':
+      return schema.serialize;
+    default:
+      return any;
+  }
+}
+
+module.exports = { compile, RawJson, cachedJson, extendCached, any, string, number };
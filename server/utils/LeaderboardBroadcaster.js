@@ -0,0 +1,108 @@
+// Coalesced leaderboard pushes to tournament-<id> Socket.io rooms
+class LeaderboardBroadcaster {
+  constructor(io, options = {}) {
+    this.io = io;
+    this.minInterval = options.minInterval || 250; // at most 4 pushes per second per tournament
+    this.topN = options.topN || 10;
+    this.pending = new Map();  // tournamentId -> { tournament, timer }
+    this.lastSent = new Map(); // tournamentId -> { seq, sentAt, top: Map(userId -> row), ranks: Map(userId -> row) }
+  }
+
+  // Request a push; bursts of updates within minInterval collapse into one
+  schedule(tournament) {
+    if (this.pending.has(tournament.id)) {
+      return;
+    }
+
+    const last = this.lastSent.get(tournament.id);
+    const wait = last ? Math.max(0, this.minInterval - (Date.now() - last.sentAt)) : 0;
+    const timer = setTimeout(() => this.flush(tournament.id), wait);
+    this.pending.set(tournament.id, { tournament, timer });
+  }
+
+  // Drop state for a tournament that is no longer tracked
+  forget(tournamentId) {
+    const pending = this.pending.get(tournamentId);
+    if (pending) {
+      clearTimeout(pending.timer);
+      this.pending.delete(tournamentId);
+    }
+    this.lastSent.delete(tournamentId);
+  }
+
+  compactRow(row) {
+    return { rank: row.rank, userId: row.userId, username: row.username, points: row.points };
+  }
+
+  flush(tournamentId) {
+    const pending = this.pending.get(tournamentId);
+    if (!pending) {
+      return;
+    }
+    this.pending.delete(tournamentId);
+
+    const { tournament } = pending;
+    const previous = this.lastSent.get(tournamentId) || { seq: 0, top: new Map(), ranks: new Map() };
+    const room = `tournament-${tournamentId}`;
+
+    // Top-N diff against what the room last saw
+    const top = new Map();
+    const changed = [];
+    tournament.getTopN(this.topN).forEach(row => {
+      const compact = this.compactRow(row);
+      top.set(compact.userId, compact);
+      const before = previous.top.get(compact.userId);
+      if (!before || before.rank !== compact.rank || before.points !== compact.points) {
+        changed.push(compact);
+      }
+    });
+    const removed = Array.from(previous.top.keys()).filter(userId => !top.has(userId));
+
+    const seq = previous.seq + 1;
+    if (changed.length > 0 || removed.length > 0) {
+      this.io.to(room).emit('leaderboard-update', {
+        tournamentId,
+        seq,
+        topN: this.topN,
+        changed,
+        removed
+      });
+    }
+
+    // Own-rank pushes only to connected participants whose rank or points moved
+    const ranks = new Map();
+    const socketIds = this.io.sockets.adapter.rooms.get(room) || new Set();
+    socketIds.forEach(socketId => {
+      const socket = this.io.sockets.sockets.get(socketId);
+      const row = socket && tournament.getUserRank(socket.userId);
+      if (!row) {
+        return;
+      }
+
+      const own = this.compactRow(row);
+      ranks.set(own.userId, own);
+      const before = previous.ranks.get(own.userId);
+      if (!before || before.rank !== own.rank || before.points !== own.points) {
+        socket.emit('leaderboard-rank', { tournamentId, seq, ...own, participants: tournament.participants.size });
+      }
+    });
+
+    this.lastSent.set(tournamentId, { seq, sentAt: Date.now(), top, ranks });
+  }
+
+  // Full top-N plus own rank for a client that has just subscribed
+  getSnapshot(tournament, userId) {
+    const last = this.lastSent.get(tournament.id);
+    const own = tournament.getUserRank(userId);
+    return {
+      tournamentId: tournament.id,
+      seq: last ? last.seq : 0,
+      topN: this.topN,
+      top: tournament.getTopN(this.topN).map(row => this.compactRow(row)),
+      own: own ? this.compactRow(own) : null,
+      participants: tournament.participants.size
+    };
+  }
+}
+
+module.exports = LeaderboardBroadcaster;
@@ -0,0 +1,150 @@
+// One shared upstream poller per real tournament (e.g. ipl-2024).
+// Every fantasy tournament tracking the same real tournament reads through the
+// same fetcher, so upstream sees one conditional request per poll however many
+// tournaments subscribe. Responses are cached briefly and diffed, and onChanges
+// receives only the stat lines that changed, once per upstream change whichever
+// caller triggered the refresh.
+//
+// Expected upstream document (MATCH_DATA_URL, with {realTournament} substituted):
+//   { matches: [{ id, status, performances: [{ playerId, stats: { runs, wickets, ... } }] }] }
+
+const axios = require('axios');
+
+const cacheSetting = parseInt(process.env.MATCH_DATA_CACHE_MS, 10);
+const DEFAULT_CACHE_MS = Number.isNaN(cacheSetting) ? 10000 : cacheSetting; // 0 disables the shared cache
+const DEFAULT_TIMEOUT_MS = parseInt(process.env.MATCH_DATA_TIMEOUT_MS, 10) || 10000;
+
+class MatchDataFetcher {
+  constructor(realTournament, options = {}) {
+    this.realTournament = realTournament;
+    this.url = (options.url || process.env.MATCH_DATA_URL || '').replace('{realTournament}', encodeURIComponent(realTournament));
+    this.apiKey = options.apiKey || process.env.MATCH_DATA_API_KEY || null;
+    this.cacheMs = options.cacheMs ?? DEFAULT_CACHE_MS;
+    this.timeoutMs = options.timeoutMs || DEFAULT_TIMEOUT_MS;
+    this.http = options.http || axios;
+    this.now = options.now || Date.now;
+    this.onChanges = options.onChanges || null; // (changes, fetcher) => void
+
+    this.subscribers = new Map(); // tournamentId -> Tournament
+    this.etag = null;
+    this.lastModified = null;
+    this.document = null; // last parsed upstream document
+    this.lines = new Map(); // `${matchId}:${playerId}` -> { matchId, playerId, serialized } latest stat line
+    this.fetchedAt = 0;
+    this.inFlight = null;
+    this.stats = { requests: 0, notModified: 0, cacheHits: 0, coalesced: 0, changedLines: 0, errors: 0 };
+  }
+
+  subscribe(tournament) {
+    this.subscribers.set(tournament.id, tournament);
+  }
+
+  unsubscribe(tournamentId) {
+    this.subscribers.delete(tournamentId);
+  }
+
+  get subscriberCount() {
+    return this.subscribers.size;
+  }
+
+  // Latest upstream document, refreshed with a conditional request once the cache window has passed.
+  // Calls within the window, or while a request is outstanding, share its result.
+  refresh() {
+    if (this.inFlight) {
+      this.stats.coalesced++;
+      return this.inFlight;
+    }
+    if (this.fetchedAt && this.now() - this.fetchedAt < this.cacheMs) {
+      this.stats.cacheHits++;
+      return Promise.resolve(this.document);
+    }
+
+    this.inFlight = this.request()
+      .finally(() => {
+        this.inFlight = null;
+      });
+    return this.inFlight;
+  }
+
+  async request() {
+    const headers = {};
+    if (this.etag) {
+      headers['If-None-Match'] = this.etag;
+    }
+    if (this.lastModified) {
+      headers['If-Modified-Since'] = this.lastModified;
+    }
+    if (this.apiKey) {
+      headers['X-Api-Key'] = this.apiKey;
+    }
+
+    this.stats.requests++;
+    try {
+      const response = await this.http.get(this.url, {
+        headers,
+        timeout: this.timeoutMs,
+        validateStatus: status => status === 200 || status === 304
+      });
+      this.fetchedAt = this.now();
+
+      if (response.status === 304) {
+        this.stats.notModified++;
+        return this.document;
+      }
+
+      this.etag = response.headers.etag || null;
+      this.lastModified = response.headers['last-modified'] || null;
+      this.document = response.data;
+      const changes = this.diff(response.data);
+      this.stats.changedLines += changes.length;
+      if (changes.length > 0 && this.onChanges) {
+        this.onChanges(changes, this);
+      }
+      return this.document;
+    } catch (error) {
+      // Back off for one cache window rather than hammering a failing upstream
+      this.fetchedAt = this.now();
+      this.stats.errors++;
+      console.error(`Match data fetch failed for ${this.realTournament}:`, error.message);
+      return this.document;
+    }
+  }
+
+  // Compare a fresh document with the lines seen so far and keep only what changed
+  diff(document) {
+    const changes = [];
+    (document && Array.isArray(document.matches) ? document.matches : []).forEach(match => {
+      (match.performances || []).forEach(({ playerId, stats }) => {
+        const key = `${match.id}:${playerId}`;
+        const serialized = JSON.stringify(stats);
+        if (this.lines.get(key)?.serialized !== serialized) {
+          this.lines.set(key, { matchId: String(match.id), playerId, serialized });
+          changes.push({ matchId: String(match.id), playerId, stats });
+        }
+      });
+    });
+    return changes;
+  }
+
+  // Every stat line seen so far, in the same shape as onChanges, for subscribers
+  // that were not live when the lines were first diffed
+  currentLines() {
+    return Array.from(this.lines.values(), ({ matchId, playerId, serialized }) => ({
+      matchId,
+      playerId,
+      stats: JSON.parse(serialized)
+    }));
+  }
+
+  getStats() {
+    return {
+      realTournament: this.realTournament,
+      subscribers: this.subscribers.size,
+      trackedLines: this.lines.size,
+      fetchedAt: this.fetchedAt ? new Date(this.fetchedAt).toISOString() : null,
+      ...this.stats
+    };
+  }
+}
+
+module.exports = MatchDataFetcher;
@@ -0,0 +1,301 @@
+// Compiled serializers for the hottest payloads: auction room state (sent on every
+// bid), tournament state, leaderboards and catalog player lists. Each produces
+// the same JSON as JSON.stringify over the matching getState()/route object, but
+// reads the models directly and splices in cached catalog fragments, so nothing
+// is rebuilt or walked by reflection per call.
+//
+//   node utils/Payloads.js --bench [--teams 8] [--parallel 1]   # compiled vs JSON.stringify per bid broadcast
+
+const { compile, RawJson, cachedJson, extendCached, number } = require('./JsonSerializer');
+const { STATE_LEADERBOARD_SIZE } = require('../models/Tournament');
+const { parseArgs } = require('./cliArgs');
+
+const scalar = { type: 'any' }; // ids may be numbers (catalog, custom players) or strings
+
+const bidSchema = {
+  type: 'object',
+  properties: {
+    lotId: scalar,
+    teamId: { type: 'string' },
+    amount: { type: 'number' },
+    timestamp: { type: 'any' }
+  }
+};
+
+const lotSchema = {
+  type: 'object',
+  properties: {
+    lotId: scalar,
+    player: { type: 'cached' },
+    currentBid: { type: 'number' },
+    highestBidder: { type: 'string' },
+    timeLeft: { type: 'number' },
+    biddingHistory: { type: 'array', items: bidSchema },
+    deadline: { type: 'number' }
+  }
+};
+
+// Compact squad entries expanded against the room's players, as AuctionRoom.resolveSquad does
+const serializeSquad = (players, room) => {
+  let out = '[';
+  for (let i = 0; i < players.length; i++) {
+    const { playerId, soldPrice } = players[i];
+    out += (i > 0 ? ',' : '') + extendCached(room.getPlayer(playerId), `"soldPrice":${number(soldPrice)}`);
+  }
+  return out + ']';
+};
+
+// Teams carry whatever the client sent as teamData, so undeclared keys are copied too
+const teamSchema = {
+  type: 'object',
+  additionalProperties: true,
+  properties: {
+    id: { type: 'string' },
+    name: { type: 'string' },
+    players: { type: 'custom', serialize: serializeSquad },
+    budget: { type: 'number' },
+    remainingBudget: { type: 'number' }
+  }
+};
+
+const historyRecordSchema = {
+  type: 'object',
+  properties: {
+    playerId: scalar,
+    teamId: { type: 'string' },
+    price: { type: 'number' },
+    timestamp: { type: 'number' },
+    status: { type: 'string' },
+    bids: { type: 'number' }
+  }
+};
+
+// Same document as AuctionRoom.getState(); ctx is the room throughout
+const roomStateSchema = {
+  type: 'object',
+  properties: {
+    roomId: { type: 'string' },
+    version: { type: 'number' },
+    settings: { type: 'any' },
+    teams: {
+      type: 'array',
+      items: teamSchema,
+      get: room => Array.from(room.teams, ([id, team]) => ({ id, ...team }))
+    },
+    currentAuction: lotSchema,
+    openLots: { type: 'array', items: lotSchema, get: room => Array.from(room.openLots.values()) },
+    parallelLots: { type: 'number' },
+    recentHistory: { type: 'array', items: historyRecordSchema, get: room => room.auctionHistory.slice(-10) },
+    historyCount: { type: 'number', get: room => room.auctionHistory.length },
+    historySummary: {
+      type: 'object',
+      properties: { sold: { type: 'number' }, unsold: { type: 'number' }, highestSale: { type: 'number' } }
+    },
+    status: { type: 'string' },
+    totalPlayers: { type: 'number', get: room => room.players.length },
+    currentPlayerIndex: { type: 'number' }
+  }
+};
+
+const writeRoomState = compile(roomStateSchema);
+
+function serializeRoomState(room) {
+  room.openLots.forEach(lot => room.refreshTimeLeft(lot));
+  return writeRoomState(room, room);
+}
+
+// Socket payloads around a room: { ...fields, room: <state> } with the state written by the compiled serializer
+const roomMessageSchema = {
+  type: 'object',
+  properties: {
+    roomId: { type: 'string' },
+    teamId: { type: 'string' },
+    teamData: { type: 'any' },
+    auction: lotSchema,
+    room: { type: 'custom', serialize: serializeRoomState }
+  }
+};
+
+const writeRoomMessage = compile(roomMessageSchema);
+
+function roomMessage(fields) {
+  return new RawJson(writeRoomMessage(fields));
+}
+
+const leaderboardRowSchema = {
+  type: 'object',
+  properties: {
+    rank: { type: 'number' },
+    userId: { type: 'string' },
+    username: { type: 'string' },
+    points: { type: 'number' },
+    squad: {
+      type: 'array',
+      items: { type: 'object', properties: { name: { type: 'string' }, points: { type: 'number' } } }
+    }
+  }
+};
+
+const writeLeaderboardRows = compile({ type: 'array', items: leaderboardRowSchema });
+
+// Full leaderboards are cached by the tournament until scores change; their JSON is kept alongside
+const leaderboardJson = new WeakMap();
+
+function serializeLeaderboard(rows) {
+  let json = leaderboardJson.get(rows);
+  if (json === undefined) {
+    json = writeLeaderboardRows(rows);
+    leaderboardJson.set(rows, json);
+  }
+  return json;
+}
+
+const participantSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    userId: { type: 'string' },
+    username: { type: 'string' },
+    squad: { type: 'array', items: { type: 'any' } },
+    budget: { type: 'number' },
+    remainingBudget: { type: 'number' },
+    points: { type: 'number' },
+    entryFeePaid: { type: 'boolean' },
+    joinedAt: { type: 'any' },
+    rank: { type: 'number' }
+  }
+};
+
+// Same document as Tournament.getParticipants()
+const serializeParticipantPage = compile({
+  type: 'object',
+  properties: {
+    participants: { type: 'array', items: participantSchema },
+    total: { type: 'number' },
+    nextCursor: { type: 'any' }
+  }
+});
+
+// Same document as Tournament.getState()
+const tournamentStateSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    version: { type: 'number' },
+    adminId: { type: 'string' },
+    settings: { type: 'any' },
+    prizePool: { type: 'number' },
+    status: { type: 'string' },
+    participantCount: { type: 'number', get: tournament => tournament.participants.size },
+    paidCount: { type: 'number' },
+    chatMessages: { type: 'array', items: { type: 'cached' }, get: tournament => tournament.chatMessages.slice(-20) },
+    leaderboard: { type: 'custom', get: tournament => tournament.getTopN(STATE_LEADERBOARD_SIZE), serialize: writeLeaderboardRows },
+    createdAt: { type: 'any' }
+  }
+};
+
+const serializeTournamentState = compile(tournamentStateSchema);
+
+// JSON array of catalog players, spliced from cached per-player fragments
+function serializePlayers(players) {
+  let out = '[';
+  for (let i = 0; i < players.length; i++) {
+    out += (i > 0 ? ',' : '') + cachedJson(players[i]);
+  }
+  return out + ']';
+}
+
+// Send a pre-serialized body the way res.json would
+function sendJson(res, json) {
+  return res.type('json').send(json);
+}
+
+// Play an auction partway on a virtual clock, checking the compiled bid-placed
+// broadcast against JSON.stringify after every bid, then time both on the live room
+function runBench(teams, parallelLots, iterations) {
+  const fs = require('fs');
+  const path = require('path');
+  const { isDeepStrictEqual } = require('util');
+  const AuctionRoom = require('../models/AuctionRoom');
+  const VirtualClock = require('./VirtualClock');
+  const players = JSON.parse(fs.readFileSync(path.join(__dirname, '../../data/players.json'), 'utf8'));
+
+  const clock = new VirtualClock();
+  const room = new AuctionRoom('BENCH', 'bench-host', { mode: 'standard', budget: 500000000, parallelLots }, {
+    catalog: { players, byId: new Map(players.map(player => [player.id, player])) },
+    clock
+  });
+  for (let i = 0; i < teams; i++) {
+    room.addTeam(`team-${i + 1}`, { name: `Team ${i + 1}`, owner: `Owner ${i + 1}` });
+  }
+  room.startAuction();
+
+  const broadcast = (lot) => ({ auction: lot, room });
+  let checked = 0;
+  let mismatches = 0;
+  let bid = 0;
+  while (room.status === 'active' && room.currentPlayerIndex < players.length * 0.8) {
+    Array.from(room.openLots.values()).forEach(lot => {
+      for (let round = 0; round < 3; round++) {
+        const teamId = `team-${(bid++ % teams) + 1}`;
+        if (lot.highestBidder === teamId) {
+          continue;
+        }
+        room.placeBid(teamId, lot.currentBid + 100000, lot.lotId);
+        const compiled = JSON.parse(roomMessage(broadcast(lot)).json);
+        const generic = JSON.parse(JSON.stringify({ auction: lot, room: room.getState() }));
+        checked++;
+        if (!isDeepStrictEqual(compiled, generic)) {
+          mismatches++;
+        }
+      }
+    });
+    clock.advance(room.bidTimeoutMs + AuctionRoom.LOT_GAP_MS);
+  }
+
+  const lot = room.currentAuction;
+  const time = (fn) => {
+    const started = process.hrtime.bigint();
+    let bytes = 0;
+    for (let i = 0; i < iterations; i++) {
+      bytes += fn().length;
+    }
+    return { usPerCall: Number(process.hrtime.bigint() - started) / 1000 / iterations, bytes: bytes / iterations };
+  };
+  const generic = time(() => JSON.stringify({ auction: lot, room: room.getState() }));
+  const compiled = time(() => roomMessage(broadcast(lot)).json);
+
+  return {
+    teams,
+    parallelLots,
+    squadPlayers: room.auctionHistory.filter(record => record.status === 'sold').length,
+    broadcastsChecked: checked,
+    mismatches,
+    payloadBytes: Math.round(generic.bytes),
+    jsonStringifyUs: Math.round(generic.usPerCall * 10) / 10,
+    compiledUs: Math.round(compiled.usPerCall * 10) / 10,
+    speedup: Math.round((generic.usPerCall / compiled.usPerCall) * 10) / 10
+  };
+}
+
+if (require.main === module) {
+  const args = parseArgs(process.argv.slice(2));
+  if (!args.bench) {
+    console.log('Usage: node utils/Payloads.js --bench [--teams 8] [--parallel 1] [--iterations 20000]');
+    process.exit(1);
+  }
+  const result = runBench(parseInt(args.teams, 10) || 8, parseInt(args.parallel, 10) || 1, parseInt(args.iterations, 10) || 20000);
+  console.log(JSON.stringify(result, null, 2));
+  process.exit(result.mismatches === 0 ? 0 : 1);
+}
+
+module.exports = {
+  serializeRoomState,
+  roomMessage,
+  serializeTournamentState,
+  serializeParticipantPage,
+  serializeLeaderboard,
+  serializePlayers,
+  sendJson,
+  RawJson
+};
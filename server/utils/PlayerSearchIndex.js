@@ -0,0 +1,273 @@
+// Typeahead search over player names and countries.
+// Word prefixes are answered from a sorted term array; trigram similarity
+// re-ranks near misses when no word matches exactly. Mid-word (contains) matches
+// come from 2- and 3-letter gram postings kept in rating order.
+const MAX_FUZZY_CANDIDATES = 200;
+// One- and two-letter prefixes match a large share of the catalog, so their ranking is
+// computed once and walked in order instead of re-scored on every keystroke
+const RANKED_PREFIX_LENGTH = 2;
+
+function normalize(text) {
+  return String(text || '')
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim();
+}
+
+function trigramsOf(text) {
+  const padded = `  ${text} `;
+  const grams = new Set();
+  for (let i = 0; i < padded.length - 2; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+class PlayerSearchIndex {
+  constructor(players = []) {
+    this.players = [];
+    this.names = [];        // normalized name per player slot
+    this.countries = [];    // normalized country per player slot
+    this.words = [];        // name and country words per player slot
+    this.terms = [];        // sorted [term, slot] pairs
+    this.byRating = [];     // player slots, highest rating first
+    this.grams = new Map(); // 2- and 3-letter gram -> slots containing it, highest rating first
+    this.rankedPrefixes = new Map(); // short prefix -> matching slots, best score first
+    players.forEach(player => this.addPlayer(player));
+    this.sortTerms();
+    this.indexGrams();
+  }
+
+  addPlayer(player) {
+    const slot = this.players.length;
+    const name = normalize(player.name);
+    const country = normalize(player.country);
+    this.players.push(player);
+    this.names.push(name);
+    this.countries.push(country);
+    this.words.push([...name.split(' '), ...country.split(' ')]);
+
+    // Every word of the name and country, plus the full name for "first last" prefixes
+    const terms = new Set([...this.words[slot], name, country]);
+    terms.forEach(term => {
+      if (term) {
+        this.terms.push([term, slot]);
+      }
+    });
+  }
+
+  sortTerms() {
+    this.terms.sort((a, b) => (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : a[1] - b[1]));
+  }
+
+  // Postings are filled in rating order so a contains scan can stop at the first few hits
+  indexGrams() {
+    this.byRating = this.players.map((player, slot) => slot)
+      .sort((a, b) => (this.players[b].rating || 0) - (this.players[a].rating || 0) || a - b);
+    this.grams.clear();
+    this.byRating.forEach(slot => {
+      const grams = new Set();
+      [this.names[slot], this.countries[slot]].forEach(text => {
+        for (let i = 0; i < text.length - 1; i++) {
+          grams.add(text.slice(i, i + 2));
+          if (i < text.length - 2) {
+            grams.add(text.slice(i, i + 3));
+          }
+        }
+      });
+      grams.forEach(gram => {
+        let postings = this.grams.get(gram);
+        if (!postings) {
+          postings = [];
+          this.grams.set(gram, postings);
+        }
+        postings.push(slot);
+      });
+    });
+  }
+
+  lowerBound(prefix) {
+    let low = 0;
+    let high = this.terms.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.terms[mid][0] < prefix) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
+  // Player slots with a term starting with prefix and passing filter, capped at maxSlots
+  prefixSlots(prefix, filter = null, maxSlots = Infinity) {
+    const slots = new Set();
+    for (let i = this.lowerBound(prefix); i < this.terms.length && slots.size < maxSlots; i++) {
+      const [term, slot] = this.terms[i];
+      if (!term.startsWith(prefix)) {
+        break;
+      }
+      if (!slots.has(slot) && (!filter || filter(this.players[slot]))) {
+        slots.add(slot);
+      }
+    }
+    return slots;
+  }
+
+  // Matching slots for a short single-word query, best score first, built on first use
+  rankedPrefixSlots(prefix) {
+    let ranked = this.rankedPrefixes.get(prefix);
+    if (!ranked) {
+      const scores = new Map();
+      this.prefixSlots(prefix).forEach(slot => scores.set(slot, this.score(slot, prefix, [prefix])));
+      ranked = Array.from(scores.keys()).sort((a, b) => scores.get(b) - scores.get(a) || a - b);
+      this.rankedPrefixes.set(prefix, ranked);
+    }
+    return ranked;
+  }
+
+  // Near misses: players sharing each word's first two letters, scored by trigram overlap
+  fuzzySlots(query, filter) {
+    const queryGrams = trigramsOf(query);
+    const similarities = new Map();
+
+    query.split(' ').forEach(word => {
+      this.prefixSlots(word.slice(0, 2), filter, MAX_FUZZY_CANDIDATES).forEach(slot => {
+        if (similarities.has(slot)) {
+          return;
+        }
+        // Share of the query's trigrams found in the name
+        const nameGrams = trigramsOf(this.names[slot]);
+        let shared = 0;
+        queryGrams.forEach(gram => {
+          if (nameGrams.has(gram)) {
+            shared++;
+          }
+        });
+        const similarity = shared / queryGrams.size;
+        if (similarity >= 0.5) {
+          similarities.set(slot, similarity);
+        }
+      });
+    });
+
+    return similarities;
+  }
+
+  score(slot, query, queryWords) {
+    const name = this.names[slot];
+    let score = 0;
+    if (name === query) {
+      score = 4;
+    } else if (name.startsWith(query)) {
+      score = 3;
+    } else if (queryWords.every(word => this.words[slot].some(part => part.startsWith(word)))) {
+      score = this.countries[slot].startsWith(query) ? 1 : 2;
+    }
+    // Higher-rated players first within the same match quality
+    return score + (this.players[slot].rating || 0) / 1000;
+  }
+
+  // The best-rated `wanted` players, outside `exclude` and passing filter, whose name
+  // or country contains the query anywhere. Walks the rarest of the query's grams'
+  // postings (every player for a one-letter query) in rating order.
+  substringSlots(query, exclude, filter, wanted) {
+    let postings = this.byRating;
+    const size = Math.min(query.length, 3);
+    for (let i = 0; size > 1 && i + size <= query.length; i++) {
+      const gramPostings = this.grams.get(query.slice(i, i + size)) || [];
+      if (gramPostings.length < postings.length) {
+        postings = gramPostings;
+      }
+    }
+
+    const slots = new Set();
+    for (let i = 0; i < postings.length && slots.size < wanted; i++) {
+      const slot = postings[i];
+      if (!exclude.has(slot) && (this.names[slot].includes(query) || this.countries[slot].includes(query)) &&
+        (!filter || filter(this.players[slot]))) {
+        slots.add(slot);
+      }
+    }
+    return slots;
+  }
+
+  // Ranked matches for a query; filter is an optional (player) => boolean.
+  // With contains, names and countries containing the query mid-word also match
+  // (ranked below word-prefix matches), as a plain substring filter would.
+  search(rawQuery, { limit = 10, filter = null, contains = false } = {}) {
+    const query = normalize(rawQuery);
+    if (!query) {
+      return [];
+    }
+
+    // A multi-word query is first tried as a full-name prefix, then word by word,
+    // starting from the rarest word and requiring every other word
+    const words = query.split(' ');
+    let candidates = words.length > 1 ? this.prefixSlots(query, filter) : new Set();
+    if (query.length <= RANKED_PREFIX_LENGTH) {
+      const ranked = this.rankedPrefixSlots(query);
+      for (let i = 0; i < ranked.length && candidates.size < limit; i++) {
+        if (!filter || filter(this.players[ranked[i]])) {
+          candidates.add(ranked[i]);
+        }
+      }
+    } else if (candidates.size === 0) {
+      const perWord = words.map(word => this.prefixSlots(word, filter));
+      perWord.sort((a, b) => a.size - b.size);
+      candidates = perWord[0];
+      if (perWord.length > 1) {
+        candidates = new Set(Array.from(candidates).filter(slot =>
+          words.every(word => this.words[slot].some(part => part.startsWith(word)))
+        ));
+      }
+    }
+
+    // Mid-word matches rank below every prefix match, so they are only looked up
+    // when the prefix matches leave room in the results
+    let substrings = null;
+    if (contains && candidates.size < limit) {
+      substrings = this.substringSlots(query, candidates, filter, limit - candidates.size);
+      candidates = new Set([...candidates, ...substrings]);
+    }
+
+    let similarities = null;
+    if (candidates.size === 0 && query.length >= 3) {
+      similarities = this.fuzzySlots(query, filter);
+      candidates = similarities.keys();
+    }
+
+    // Keep only the best `limit` matches instead of sorting every candidate
+    // (candidates have already passed filter)
+    const top = [];
+    for (const slot of candidates) {
+      const player = this.players[slot];
+      let score;
+      if (similarities) {
+        score = similarities.get(slot) + (player.rating || 0) / 1000;
+      } else if (substrings && substrings.has(slot)) {
+        score = 0.5 + (player.rating || 0) / 1000;
+      } else {
+        score = this.score(slot, query, words);
+      }
+      if (top.length === limit && score <= top[top.length - 1].score) {
+        continue;
+      }
+      let position = top.length;
+      while (position > 0 && top[position - 1].score < score) {
+        position--;
+      }
+      top.splice(position, 0, { slot, score });
+      if (top.length > limit) {
+        top.pop();
+      }
+    }
+
+    return top.map(({ slot }) => this.players[slot]);
+  }
+}
+
+module.exports = PlayerSearchIndex;
@@ -0,0 +1,32 @@
+// Small deterministic PRNG (mulberry32) so simulated runs can be replayed from a seed
+
+class SeededRandom {
+  constructor(seed = 1) {
+    this.state = seed >>> 0;
+  }
+
+  // Float in [0, 1)
+  next() {
+    this.state = (this.state + 0x6D2B79F5) >>> 0;
+    let t = this.state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  }
+
+  // Float in [min, max)
+  range(min, max) {
+    return min + (max - min) * this.next();
+  }
+
+  // Integer in [min, max]
+  int(min, max) {
+    return min + Math.floor(this.next() * (max - min + 1));
+  }
+
+  pick(items) {
+    return items[Math.floor(this.next() * items.length)];
+  }
+}
+
+module.exports = SeededRandom;
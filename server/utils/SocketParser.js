@@ -0,0 +1,30 @@
+// Socket.io parser that writes RawJson event arguments verbatim.
+//
+// The stock encoder runs JSON.stringify over every emitted packet, and its binary
+// check calls toJSON() on each argument first, which for RawJson would mean parsing
+// the pre-serialized payload just to write it out again. Events carrying RawJson
+// are framed here instead, producing the exact string the stock encoder would for
+// the parsed value; everything else (acks, binary payloads, plain events) goes
+// through the stock encoder unchanged. Clients keep the default parser.
+
+const { Encoder: BaseEncoder, Decoder, PacketType, protocol } = require('socket.io-parser');
+const { RawJson, any } = require('./JsonSerializer');
+
+class Encoder extends BaseEncoder {
+  encode(packet) {
+    if (packet.type !== PacketType.EVENT || !Array.isArray(packet.data) || !packet.data.some(arg => arg instanceof RawJson)) {
+      return super.encode(packet);
+    }
+
+    let out = String(packet.type);
+    if (packet.nsp && packet.nsp !== '/') {
+      out += packet.nsp + ',';
+    }
+    if (packet.id !== undefined && packet.id !== null) {
+      out += packet.id;
+    }
+    return [out + '[' + packet.data.map(any).join(',') + ']'];
+  }
+}
+
+module.exports = { protocol, PacketType, Encoder, Decoder };
@@ -0,0 +1,146 @@
+// Per-connection rate limiting and backpressure for Socket.io events
+
+// Default limits per event: capacity is the burst size, refillPerSecond the sustained rate
+const DEFAULT_EVENT_LIMITS = {
+  'place-bid': { capacity: 10, refillPerSecond: 5 },
+  'tournament-chat': { capacity: 5, refillPerSecond: 1 },
+  'get-room-state': { capacity: 3, refillPerSecond: 0.5 },
+  'get-tournament-state': { capacity: 3, refillPerSecond: 0.5 },
+  default: { capacity: 20, refillPerSecond: 10 }
+};
+
+// Overall budget shared by every event on a single connection
+const DEFAULT_CONNECTION_LIMIT = { capacity: 40, refillPerSecond: 20 };
+
+// Token bucket refilled lazily on each take()
+class TokenBucket {
+  constructor(capacity, refillPerSecond, now = Date.now()) {
+    this.capacity = capacity;
+    this.refillPerSecond = refillPerSecond;
+    this.tokens = capacity;
+    this.lastRefill = now;
+  }
+
+  take(count = 1, now = Date.now()) {
+    const elapsed = (now - this.lastRefill) / 1000;
+    if (elapsed > 0) {
+      this.tokens = Math.min(this.capacity, this.tokens + elapsed * this.refillPerSecond);
+      this.lastRefill = now;
+    }
+
+    if (this.tokens < count) {
+      return false;
+    }
+    this.tokens -= count;
+    return true;
+  }
+}
+
+class SocketRateLimiter {
+  constructor(options = {}) {
+    this.eventLimits = { ...DEFAULT_EVENT_LIMITS, ...(options.eventLimits || {}) };
+    this.connectionLimit = options.connectionLimit || DEFAULT_CONNECTION_LIMIT;
+    // Outbound packets queued on the transport before a socket counts as slow
+    this.downsampleThreshold = options.downsampleThreshold || 50;
+    // Outbound packets queued before a socket is disconnected outright
+    this.dropThreshold = options.dropThreshold || 500;
+
+    this.stats = {
+      rejected: {},        // event -> rejected count (per-event limit)
+      connectionRejected: 0,
+      downsampled: 0,      // broadcasts skipped for slow consumers
+      dropped: 0           // sockets disconnected for overflowing their buffer
+    };
+  }
+
+  // Install the limiter as per-socket middleware
+  attach(socket) {
+    socket.rateBuckets = new Map();
+    socket.connectionBucket = new TokenBucket(
+      this.connectionLimit.capacity,
+      this.connectionLimit.refillPerSecond
+    );
+
+    socket.use((packet, next) => {
+      const event = packet[0];
+      if (this.allow(socket, event)) {
+        next();
+        return;
+      }
+      socket.emit('error', { message: 'Rate limit exceeded', event });
+    });
+  }
+
+  // Check both the connection bucket and the per-event bucket
+  allow(socket, event, now = Date.now()) {
+    if (!socket.connectionBucket.take(1, now)) {
+      this.stats.connectionRejected++;
+      return false;
+    }
+
+    let bucket = socket.rateBuckets.get(event);
+    if (!bucket) {
+      const limit = this.eventLimits[event] || this.eventLimits.default;
+      bucket = new TokenBucket(limit.capacity, limit.refillPerSecond, now);
+      socket.rateBuckets.set(event, bucket);
+    }
+
+    if (!bucket.take(1, now)) {
+      this.stats.rejected[event] = (this.stats.rejected[event] || 0) + 1;
+      return false;
+    }
+    return true;
+  }
+
+  // Number of packets waiting to be flushed to the client
+  bufferedPackets(socket) {
+    return socket.conn?.writeBuffer?.length || 0;
+  }
+
+  // Emit to a room, skipping slow consumers and dropping sockets that cannot keep up.
+  // The payload is still encoded once for the whole room.
+  emitToRoom(io, room, event, payload) {
+    const socketIds = io.sockets.adapter.rooms.get(room);
+    if (!socketIds) {
+      return;
+    }
+
+    const skipped = [];
+    socketIds.forEach(socketId => {
+      const socket = io.sockets.sockets.get(socketId);
+      if (!socket) {
+        return;
+      }
+
+      const buffered = this.bufferedPackets(socket);
+      if (buffered >= this.dropThreshold) {
+        this.stats.dropped++;
+        skipped.push(socketId);
+        socket.disconnect(true);
+      } else if (buffered >= this.downsampleThreshold) {
+        // Slow consumer: skip this update, the next one carries the full state
+        this.stats.downsampled++;
+        skipped.push(socketId);
+      }
+    });
+
+    const target = skipped.length > 0 ? io.to(room).except(skipped) : io.to(room);
+    target.emit(event, payload);
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      rejected: { ...this.stats.rejected },
+      limits: {
+        events: this.eventLimits,
+        connection: this.connectionLimit,
+        downsampleThreshold: this.downsampleThreshold,
+        dropThreshold: this.dropThreshold
+      }
+    };
+  }
+}
+
+module.exports = SocketRateLimiter;
+module.exports.TokenBucket = TokenBucket;
@@ -0,0 +1,125 @@
+// Read-only audience for auction rooms. Spectators join spectate-<roomId>
+// instead of the room itself, so per-bid broadcasts only reach bidders, and
+// receive one compact 'spectator-summary' per room on a fixed tick: the open
+// lots, top bids and countdowns. A bid burst costs spectators nothing extra,
+// and the tick yields between rooms so it never holds up bid handling.
+
+const DEFAULT_INTERVAL_MS = parseInt(process.env.SPECTATOR_SUMMARY_MS, 10) || 1000;
+const ROOMS_PER_SLICE = 50; // rooms summarised before yielding back to the event loop
+
+class SpectatorBroadcaster {
+  constructor(io, options = {}) {
+    this.io = io;
+    this.intervalMs = options.intervalMs || DEFAULT_INTERVAL_MS;
+    this.rateLimiter = options.rateLimiter || null; // SocketRateLimiter, skips slow consumers
+    this.admission = options.admission || null; // AdmissionController, ticks are skipped while shedding low priority
+    this.rooms = new Map(); // roomId -> { room, version }
+    this.timer = null;
+    this.flushing = false;
+    this.stats = { ticks: 0, skippedTicks: 0, summaries: 0 };
+  }
+
+  channel(roomId) {
+    return `spectate-${roomId}`;
+  }
+
+  // Add a socket to a room's audience and send it the current summary
+  watch(socket, room) {
+    socket.join(this.channel(room.roomId));
+    if (!this.rooms.has(room.roomId)) {
+      this.rooms.set(room.roomId, { room, version: room.version });
+    }
+    socket.emit('spectator-joined', { intervalMs: this.intervalMs, summary: room.getSpectatorSummary() });
+    this.start();
+  }
+
+  unwatch(socket, roomId) {
+    socket.leave(this.channel(roomId));
+  }
+
+  audience(roomId) {
+    const sockets = this.io.sockets.adapter.rooms.get(this.channel(roomId));
+    return sockets ? sockets.size : 0;
+  }
+
+  start() {
+    if (!this.timer) {
+      this.timer = setInterval(() => this.tick(), this.intervalMs);
+    }
+  }
+
+  stop() {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  tick() {
+    this.stats.ticks++;
+    if (this.flushing || (this.admission && this.admission.shouldShed('low'))) {
+      // Still working through the last tick, or the server is under pressure; the next tick catches up
+      this.stats.skippedTicks++;
+      return;
+    }
+    this.flushing = true;
+    this.flush(Array.from(this.rooms.keys()), 0);
+  }
+
+  // Summarise rooms a slice at a time so bids queued meanwhile are handled in between
+  flush(roomIds, start) {
+    const end = Math.min(start + ROOMS_PER_SLICE, roomIds.length);
+    for (let i = start; i < end; i++) {
+      this.push(roomIds[i]);
+    }
+    if (end < roomIds.length) {
+      setImmediate(() => this.flush(roomIds, end));
+      return;
+    }
+    this.flushing = false;
+    if (this.rooms.size === 0) {
+      this.stop();
+    }
+  }
+
+  push(roomId) {
+    const entry = this.rooms.get(roomId);
+    if (!entry) {
+      return;
+    }
+    if (this.audience(roomId) === 0) {
+      this.rooms.delete(roomId);
+      return;
+    }
+
+    // Countdowns move every tick while lots are open; otherwise only send real changes
+    const { room } = entry;
+    if (room.openLots.size === 0 && room.version === entry.version) {
+      return;
+    }
+    entry.version = room.version;
+
+    const summary = room.getSpectatorSummary();
+    if (this.rateLimiter) {
+      this.rateLimiter.emitToRoom(this.io, this.channel(roomId), 'spectator-summary', summary);
+    } else {
+      this.io.to(this.channel(roomId)).emit('spectator-summary', summary);
+    }
+    this.stats.summaries++;
+  }
+
+  getStats() {
+    let spectators = 0;
+    this.rooms.forEach((entry, roomId) => {
+      spectators += this.audience(roomId);
+    });
+    return {
+      ...this.stats,
+      intervalMs: this.intervalMs,
+      rooms: this.rooms.size,
+      spectators
+    };
+  }
+}
+
+module.exports = SpectatorBroadcaster;
@@ -0,0 +1,164 @@
+// Local stand-in for the cricket data API, for tests and offline development.
+// Serves GET /matches/:realTournament in the format MatchDataFetcher expects,
+// honours If-None-Match / If-Modified-Since with 304s, and moves each real
+// tournament's match on by one over (from SyntheticMatchFeed) every advanceMs.
+// GET /stats reports how many requests it saw and how many were answered 304.
+//
+//   node utils/StubMatchApi.js --port 5055 --advance-ms 5000
+//   MATCH_DATA_URL=http://localhost:5055/matches/{realTournament} npm start
+//
+//   node utils/StubMatchApi.js --check --tournaments 200   # fetcher fan-out self-check
+
+const fs = require('fs');
+const http = require('http');
+const path = require('path');
+const SyntheticMatchFeed = require('./SyntheticMatchFeed');
+const { parseArgs } = require('./cliArgs');
+
+function createStubMatchApi(options = {}) {
+  const players = options.players || JSON.parse(fs.readFileSync(path.join(__dirname, '../../data/players.json'), 'utf8'));
+  const advanceMs = options.advanceMs || 5000;
+  const feeds = new Map(); // realTournament -> { feed, version, modifiedAt, matches: Map(matchId -> Map(playerId -> stats)) }
+  const stats = { requests: 0, notModified: 0, full: 0 };
+
+  const state = (realTournament) => {
+    let entry = feeds.get(realTournament);
+    if (!entry) {
+      entry = {
+        feed: new SyntheticMatchFeed(players, { seed: options.seed || 1, granularity: 'over', matchPrefix: realTournament }),
+        version: 0,
+        modifiedAt: new Date(),
+        matches: new Map()
+      };
+      feeds.set(realTournament, entry);
+      advance(realTournament);
+    }
+    return entry;
+  };
+
+  // Play one more over; responses change only when this runs
+  function advance(realTournament) {
+    const entry = feeds.get(realTournament) || state(realTournament);
+    const event = entry.feed.next();
+    if (!event) {
+      return false;
+    }
+    if (!entry.matches.has(event.matchId)) {
+      entry.matches.set(event.matchId, new Map());
+    }
+    event.updates.forEach(update => entry.matches.get(event.matchId).set(update.playerId, update.stats));
+    entry.version++;
+    // HTTP dates have one-second resolution; keep Last-Modified moving even on fast advances
+    entry.modifiedAt = new Date(Math.max(Date.now(), entry.modifiedAt.getTime() + 1000));
+    return true;
+  }
+
+  const timer = setInterval(() => feeds.forEach((entry, realTournament) => advance(realTournament)), advanceMs);
+  timer.unref();
+
+  const server = http.createServer((req, res) => {
+    const url = new URL(req.url, 'http://localhost');
+    if (url.pathname === '/stats') {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify(stats));
+      return;
+    }
+
+    const match = url.pathname.match(/^\/matches\/([^/]+)\/?$/);
+    if (req.method !== 'GET' || !match) {
+      res.writeHead(404, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ error: 'Not found' }));
+      return;
+    }
+
+    stats.requests++;
+    const realTournament = decodeURIComponent(match[1]);
+    const entry = state(realTournament);
+    const etag = `"${realTournament}-${entry.version}"`;
+    const lastModified = entry.modifiedAt.toUTCString();
+    const since = Date.parse(req.headers['if-modified-since'] || '');
+
+    const fresh = req.headers['if-none-match']
+      ? req.headers['if-none-match'] === etag
+      : !Number.isNaN(since) && Math.floor(entry.modifiedAt.getTime() / 1000) * 1000 <= since;
+    if (fresh) {
+      stats.notModified++;
+      res.writeHead(304, { ETag: etag, 'Last-Modified': lastModified });
+      res.end();
+      return;
+    }
+
+    stats.full++;
+    const body = {
+      realTournament,
+      updatedAt: entry.modifiedAt.toISOString(),
+      matches: Array.from(entry.matches.entries()).map(([id, lines]) => ({
+        id,
+        status: id === Array.from(entry.matches.keys()).pop() && !entry.feed.done ? 'live' : 'completed',
+        performances: Array.from(lines.entries()).map(([playerId, statLine]) => ({ playerId, stats: statLine }))
+      }))
+    };
+    res.writeHead(200, { 'Content-Type': 'application/json', ETag: etag, 'Last-Modified': lastModified });
+    res.end(JSON.stringify(body));
+  });
+
+  server.on('close', () => clearInterval(timer));
+
+  return { server, stats, advance };
+}
+
+// Register many active tournaments on one real tournament and poll through the shared fetcher
+async function runCheck(api, port, tournamentCount, polls) {
+  process.env.MATCH_DATA_URL = `http://localhost:${port}/matches/{realTournament}`;
+  process.env.MATCH_DATA_CACHE_MS = '0';
+  const PerformanceTracker = require('../models/PerformanceTracker');
+  const Tournament = require('../models/Tournament');
+  const tracker = new PerformanceTracker();
+  tracker.setBroadcaster({ schedule() {}, forget() {} }); // no sockets here; skip leaderboard pushes
+  const players = JSON.parse(fs.readFileSync(path.join(__dirname, '../../data/players.json'), 'utf8'));
+
+  for (let i = 0; i < tournamentCount; i++) {
+    const tournament = new Tournament(`check-admin-${i}`, { name: `Check ${i}`, realTournament: 'ipl-2024' });
+    tournament.addParticipant(`check-user-${i}`, { username: `Check ${i}` });
+    tournament.participants.get(`check-user-${i}`).squad.push(...players.slice(i % 39, i % 39 + 11).map(p => ({ ...p })));
+    tournament.status = 'tournament_active';
+    tracker.registerTournament(tournament);
+  }
+  tracker.stopPerformanceTracking();
+
+  for (let poll = 0; poll < polls; poll++) {
+    if (poll % 2 === 1) {
+      api.advance('ipl-2024');
+    }
+    await tracker.updateAllTournaments();
+  }
+
+  const fetcher = tracker.fetchers.get('ipl-2024');
+  const points = Array.from(tracker.tournaments.values()).reduce((sum, t) => sum + t.participants.values().next().value.points, 0);
+  return {
+    tournaments: tournamentCount,
+    polls,
+    upstream: { ...api.stats },
+    fetcher: fetcher.getStats(),
+    totalPoints: points
+  };
+}
+
+if (require.main === module) {
+  const args = parseArgs(process.argv.slice(2));
+  const port = parseInt(args.port, 10) || (args.check ? 0 : 5055);
+  const api = createStubMatchApi({ advanceMs: parseInt(args['advance-ms'], 10) || 5000, seed: parseInt(args.seed, 10) || 1 });
+
+  api.server.listen(port, async () => {
+    const actualPort = api.server.address().port;
+    if (!args.check) {
+      console.log(`🏏 Stub match API on http://localhost:${actualPort}/matches/{realTournament}`);
+      return;
+    }
+    const result = await runCheck(api, actualPort, parseInt(args.tournaments, 10) || 200, parseInt(args.polls, 10) || 10);
+    console.log(JSON.stringify(result, null, 2));
+    api.server.close();
+  });
+}
+
+module.exports = createStubMatchApi;
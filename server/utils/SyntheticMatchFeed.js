@@ -0,0 +1,368 @@
+// Seeded synthetic match feed for load tests and bug reproduction.
+// Plays T20-style matches ball by ball between sides drawn from a player pool
+// and emits each player's running stat line for the match, either per ball or
+// per over. The same seed and player pool always produce the same stream:
+//
+//   node utils/SyntheticMatchFeed.js --seed 42 --events 200000 --participants 100
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const SeededRandom = require('./SeededRandom');
+const { systemClock } = require('./VirtualClock');
+const { parseArgs } = require('./cliArgs');
+
+const OUTCOMES = [0, 1, 2, 3, 4, 6, 'W'];
+
+// Relative odds of each ball outcome by batter role, in OUTCOMES order
+const BATTING_PROFILES = {
+  'Batsman': [34, 36, 9, 1, 12, 5, 3],
+  'Wicket-Keeper': [36, 35, 8, 1, 11, 5, 4],
+  'All-rounder': [38, 33, 7, 1, 10, 6, 5],
+  'Bowler': [50, 28, 4, 0, 5, 2, 11]
+};
+
+// How a wicket falls, with cumulative odds; stumpings fall back to catches without a keeper
+const DISMISSALS = [
+  { kind: 'caught', upTo: 0.6 },
+  { kind: 'bowled', upTo: 0.78 },
+  { kind: 'lbw', upTo: 0.9 },
+  { kind: 'run-out', upTo: 0.96 },
+  { kind: 'stumped', upTo: 1 }
+];
+
+// Batting order within a side
+const ROLE_ORDER = { 'Batsman': 0, 'Wicket-Keeper': 1, 'All-rounder': 2, 'Bowler': 3 };
+
+const SIDE_SIZE = 11;
+
+// Running per-match stat line, using the fields the scoring rules read
+function emptyLine() {
+  return { runs: 0, wickets: 0, catches: 0, stumpings: 0, runOuts: 0, fifties: 0, centuries: 0, fiveWickets: 0 };
+}
+
+// Milestone bonuses follow the final tally, so a century replaces its fifty
+function applyMilestones(line) {
+  line.centuries = line.runs >= 100 ? 1 : 0;
+  line.fifties = line.runs >= 50 && line.runs < 100 ? 1 : 0;
+  line.fiveWickets = line.wickets >= 5 ? 1 : 0;
+}
+
+function cumulativeWeights(weights) {
+  const total = weights.reduce((sum, weight) => sum + weight, 0);
+  let running = 0;
+  return weights.map(weight => (running += weight) / total);
+}
+
+const OUTCOME_TABLES = Object.fromEntries(
+  Object.entries(BATTING_PROFILES).map(([role, weights]) => [role, cumulativeWeights(weights)])
+);
+
+class SyntheticMatchFeed {
+  constructor(players, options = {}) {
+    if (!players || players.length < 2) {
+      throw new Error('Synthetic feed needs at least two players');
+    }
+    // Sort so replay does not depend on the order squads were assembled in
+    this.players = [...players].sort((a, b) => String(a.id).localeCompare(String(b.id), undefined, { numeric: true }));
+    this.seed = options.seed || 1;
+    this.granularity = options.granularity === 'over' ? 'over' : 'ball';
+    this.overs = options.overs || 20;
+    this.matches = options.matches || Infinity;
+    this.eventsPerSecond = options.eventsPerSecond || 1000;
+    this.matchPrefix = options.matchPrefix || `synthetic-${this.seed}`;
+    this.clock = options.clock || systemClock;
+    this.tickMs = options.tickMs || 50;
+    this.maxBatch = options.maxBatch || 50000; // events per tick, so a stalled loop cannot snowball
+
+    this.random = new SeededRandom(this.seed);
+    this.stream = this.generate();
+    this.emitted = 0;
+    this.done = false;
+    this.timer = null;
+    this.startedAt = null;
+  }
+
+  // Next event, or null once every match has been played
+  next() {
+    if (this.done) {
+      return null;
+    }
+    const { value, done } = this.stream.next();
+    if (done) {
+      this.done = true;
+      return null;
+    }
+    this.emitted++;
+    return value;
+  }
+
+  // Emit up to count events synchronously; returns how many were emitted
+  emit(count, sink) {
+    let emitted = 0;
+    while (emitted < count) {
+      const event = this.next();
+      if (!event) {
+        break;
+      }
+      sink(event);
+      emitted++;
+    }
+    return emitted;
+  }
+
+  // Emit events to sink at eventsPerSecond on the feed's clock until stopped or exhausted
+  start(sink, onEnd) {
+    this.stop();
+    this.startedAt = this.clock.now();
+    const startCount = this.emitted;
+
+    const tick = () => {
+      const due = Math.floor((this.clock.now() - this.startedAt) * this.eventsPerSecond / 1000) - (this.emitted - startCount);
+      this.emit(Math.min(Math.max(due, 0), this.maxBatch), sink);
+      if (this.done) {
+        this.timer = null;
+        if (onEnd) {
+          onEnd();
+        }
+        return;
+      }
+      this.timer = this.clock.setTimeout(tick, this.tickMs);
+    };
+    this.timer = this.clock.setTimeout(tick, this.tickMs);
+  }
+
+  stop() {
+    if (this.timer) {
+      this.clock.clearTimeout(this.timer);
+      this.timer = null;
+    }
+  }
+
+  get running() {
+    return this.timer !== null;
+  }
+
+  getStats() {
+    return {
+      seed: this.seed,
+      granularity: this.granularity,
+      eventsPerSecond: this.eventsPerSecond,
+      emitted: this.emitted,
+      running: this.running,
+      done: this.done
+    };
+  }
+
+  // Shuffled copy using the feed's generator
+  shuffle(items) {
+    const result = [...items];
+    for (let i = result.length - 1; i > 0; i--) {
+      const j = Math.floor(this.random.next() * (i + 1));
+      [result[i], result[j]] = [result[j], result[i]];
+    }
+    return result;
+  }
+
+  // Pick two sides of up to eleven from the pool
+  drawSides() {
+    const drawn = this.shuffle(this.players).slice(0, SIDE_SIZE * 2);
+    const half = Math.ceil(drawn.length / 2);
+    return [drawn.slice(0, half), drawn.slice(half)].map(side => {
+      const battingOrder = [...side].sort((a, b) => (ROLE_ORDER[a.role] ?? 2) - (ROLE_ORDER[b.role] ?? 2));
+      const specialists = side.filter(p => p.role === 'Bowler' || p.role === 'All-rounder');
+      return {
+        battingOrder,
+        bowlers: specialists.length > 0 ? specialists : side,
+        keeper: side.find(p => p.role === 'Wicket-Keeper') || null,
+        players: side
+      };
+    });
+  }
+
+  outcome(batter) {
+    const table = OUTCOME_TABLES[batter.role] || OUTCOME_TABLES['All-rounder'];
+    const roll = this.random.next();
+    let i = 0;
+    while (roll >= table[i]) {
+      i++;
+    }
+    return OUTCOMES[i];
+  }
+
+  dismissal() {
+    const roll = this.random.next();
+    return DISMISSALS.find(d => roll < d.upTo).kind;
+  }
+
+  // Generator over every event of every match
+  *generate() {
+    for (let match = 0; match < this.matches; match++) {
+      yield* this.playMatch(`${this.matchPrefix}-${match + 1}`);
+    }
+  }
+
+  *playMatch(matchId) {
+    const lines = new Map(); // playerId -> running stat line for this match
+    const line = (player) => {
+      let statLine = lines.get(player.id);
+      if (!statLine) {
+        statLine = emptyLine();
+        lines.set(player.id, statLine);
+      }
+      return statLine;
+    };
+
+    const sides = this.drawSides();
+    let target = null;
+    for (let innings = 0; innings < 2; innings++) {
+      const batting = sides[innings];
+      const fielding = sides[1 - innings];
+      const order = batting.battingOrder;
+      const maxWickets = Math.max(order.length - 1, 1);
+      let striker = 0;
+      let nonStriker = Math.min(1, order.length - 1);
+      let nextIn = 2;
+      let wickets = 0;
+      let total = 0;
+
+      for (let over = 0; over < this.overs && wickets < maxWickets; over++) {
+        const bowler = fielding.bowlers[over % fielding.bowlers.length];
+        const touched = new Set();
+
+        for (let ball = 1; ball <= 6 && wickets < maxWickets; ball++) {
+          const batter = order[striker];
+          const result = this.outcome(batter);
+          const changed = [];
+          let delivery;
+
+          if (result === 'W') {
+            let kind = this.dismissal();
+            if (kind === 'stumped' && !fielding.keeper) {
+              kind = 'caught';
+            }
+            let fielder = null;
+            if (kind === 'caught') {
+              fielder = fielding.keeper && this.random.next() < 0.25 ? fielding.keeper : this.random.pick(fielding.players);
+              line(fielder).catches++;
+              changed.push(fielder);
+            } else if (kind === 'stumped') {
+              fielder = fielding.keeper;
+              line(fielder).stumpings++;
+              changed.push(fielder);
+            } else if (kind === 'run-out') {
+              fielder = this.random.pick(fielding.players);
+              line(fielder).runOuts++;
+              changed.push(fielder);
+            }
+            if (kind !== 'run-out') {
+              const bowlerLine = line(bowler);
+              bowlerLine.wickets++;
+              applyMilestones(bowlerLine);
+              changed.push(bowler);
+            }
+            line(batter); // a duck still counts as an appearance
+            changed.push(batter);
+            wickets++;
+            delivery = { batterId: batter.id, bowlerId: bowler.id, runs: 0, wicket: kind, fielderId: fielder ? fielder.id : null };
+            if (nextIn < order.length) {
+              striker = nextIn++;
+            }
+          } else {
+            const batterLine = line(batter);
+            batterLine.runs += result;
+            applyMilestones(batterLine);
+            line(bowler);
+            total += result;
+            changed.push(batter, bowler);
+            delivery = { batterId: batter.id, bowlerId: bowler.id, runs: result, wicket: null, fielderId: null };
+            if (result % 2 === 1) {
+              [striker, nonStriker] = [nonStriker, striker];
+            }
+          }
+
+          const chased = target !== null && total > target;
+          if (this.granularity === 'ball') {
+            yield this.event(matchId, innings, over, ball, delivery, changed, lines);
+          } else {
+            changed.forEach(player => touched.add(player));
+          }
+          if (chased) {
+            break;
+          }
+        }
+
+        if (this.granularity === 'over' && touched.size > 0) {
+          yield this.event(matchId, innings, over, 6, null, touched, lines);
+        }
+        if (target !== null && total > target) {
+          break;
+        }
+        [striker, nonStriker] = [nonStriker, striker];
+      }
+      target = total;
+    }
+  }
+
+  // Snapshot the changed players' lines; sinks may keep or mutate what they receive
+  event(matchId, innings, over, ball, delivery, changed, lines) {
+    const updates = [];
+    const seen = new Set();
+    changed.forEach(player => {
+      if (!seen.has(player.id)) {
+        seen.add(player.id);
+        updates.push({ playerId: player.id, stats: { ...lines.get(player.id) } });
+      }
+    });
+    return { seq: this.emitted + 1, matchId, innings: innings + 1, over: over + 1, ball, delivery, updates };
+  }
+}
+
+// Benchmark: drive a tournament with random squads through the performance update path
+if (require.main === module) {
+  const Tournament = require('../models/Tournament');
+  const args = parseArgs(process.argv.slice(2));
+  const players = JSON.parse(fs.readFileSync(path.join(__dirname, '../../data/players.json'), 'utf8'));
+  const seed = parseInt(args.seed, 10) || 1;
+  const events = parseInt(args.events, 10) || 100000;
+  const participants = parseInt(args.participants, 10) || 8;
+
+  const tournament = new Tournament('synthetic-admin', { name: 'Synthetic Feed', realTournament: 'ipl-2024', maxParticipants: participants });
+  const squadRandom = new SeededRandom(seed);
+  for (let i = 0; i < participants; i++) {
+    const userId = `synthetic-${i + 1}`;
+    tournament.addParticipant(userId, { username: `Synthetic ${i + 1}` });
+    const participant = tournament.participants.get(userId);
+    const pool = [...players];
+    for (let j = 0; j < SIDE_SIZE; j++) {
+      participant.squad.push({ ...pool.splice(Math.floor(squadRandom.next() * pool.length), 1)[0] });
+    }
+  }
+
+  const feed = new SyntheticMatchFeed(players, { seed, granularity: args.granularity });
+  const hash = crypto.createHash('sha256');
+  const matchIds = new Set();
+  let updates = 0;
+  const startedAt = process.hrtime.bigint();
+  const emitted = feed.emit(events, event => {
+    hash.update(JSON.stringify(event));
+    matchIds.add(event.matchId);
+    event.updates.forEach(update => {
+      tournament.updatePlayerPerformance(update.playerId, update.stats, event.matchId);
+      updates++;
+    });
+  });
+  const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+
+  console.log(`🏏 Synthetic feed, seed ${seed}, ${feed.granularity} granularity, ${participants} participants`);
+  console.log(JSON.stringify({
+    events: emitted,
+    statUpdates: updates,
+    matches: matchIds.size,
+    eventsPerSecond: Math.round(emitted / seconds),
+    digest: hash.digest('hex').substring(0, 16),
+    leader: tournament.getLeaderboardRows(0, 1)[0]
+  }, null, 2));
+}
+
+module.exports = SyntheticMatchFeed;
@@ -0,0 +1,119 @@
+// Clock abstraction for time-driven models.
+// systemClock wraps the real timers; VirtualClock runs timers on demand so a
+// 30-second bid window can elapse in microseconds.
+
+const systemClock = {
+  now: () => Date.now(),
+  setTimeout: (fn, ms) => setTimeout(fn, ms),
+  clearTimeout: (handle) => clearTimeout(handle)
+};
+
+class VirtualClock {
+  constructor(startTime = 0) {
+    this.time = startTime;
+    this.timers = []; // binary min-heap of { at, seq, fn, cancelled }
+    this.nextSeq = 0;
+    this.pending = 0;
+  }
+
+  now() {
+    return this.time;
+  }
+
+  setTimeout(fn, ms = 0) {
+    const timer = { at: this.time + Math.max(ms, 0), seq: this.nextSeq++, fn, cancelled: false };
+    this.push(timer);
+    this.pending++;
+    return timer;
+  }
+
+  clearTimeout(timer) {
+    if (timer && !timer.cancelled) {
+      timer.cancelled = true;
+      this.pending--;
+    }
+  }
+
+  // Run the next due timer, jumping the clock forward to it; false when idle
+  step() {
+    while (this.timers.length > 0) {
+      const timer = this.pop();
+      if (timer.cancelled) {
+        continue;
+      }
+      timer.cancelled = true;
+      this.pending--;
+      this.time = Math.max(this.time, timer.at);
+      timer.fn();
+      return true;
+    }
+    return false;
+  }
+
+  // Run timers due within the next ms milliseconds
+  advance(ms) {
+    const until = this.time + ms;
+    while (this.timers.length > 0 && this.peekDue() <= until) {
+      this.step();
+    }
+    this.time = until;
+  }
+
+  // Run until no timers remain (or maxSteps is hit, as a runaway guard)
+  runAll(maxSteps = Infinity) {
+    let steps = 0;
+    while (steps < maxSteps && this.step()) {
+      steps++;
+    }
+    return steps;
+  }
+
+  peekDue() {
+    while (this.timers.length > 0 && this.timers[0].cancelled) {
+      this.pop();
+    }
+    return this.timers.length > 0 ? this.timers[0].at : Infinity;
+  }
+
+  before(a, b) {
+    return a.at < b.at || (a.at === b.at && a.seq < b.seq);
+  }
+
+  push(timer) {
+    const heap = this.timers;
+    heap.push(timer);
+    let i = heap.length - 1;
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!this.before(heap[i], heap[parent])) {
+        break;
+      }
+      [heap[i], heap[parent]] = [heap[parent], heap[i]];
+      i = parent;
+    }
+  }
+
+  pop() {
+    const heap = this.timers;
+    const top = heap[0];
+    const last = heap.pop();
+    if (heap.length > 0) {
+      heap[0] = last;
+      let i = 0;
+      for (;;) {
+        const left = 2 * i + 1;
+        const right = left + 1;
+        let smallest = i;
+        if (left < heap.length && this.before(heap[left], heap[smallest])) smallest = left;
+        if (right < heap.length && this.before(heap[right], heap[smallest])) smallest = right;
+        if (smallest === i) break;
+        [heap[i], heap[smallest]] = [heap[smallest], heap[i]];
+        i = smallest;
+      }
+    }
+    return top;
+  }
+}
+
+module.exports = VirtualClock;
+module.exports.systemClock = systemClock;
@@ -0,0 +1,232 @@
+// Fixed-size worker_threads pool for CPU-heavy jobs that would otherwise stall
+// bids and timers on the main event loop. Jobs are named tasks from
+// workerTasks.js taking and returning plain objects; typed arrays at the top
+// level of a payload or result are transferred rather than copied, so the
+// sender's copies are detached once a job is posted.
+//
+//   const pool = new WorkerPool();
+//   const result = await pool.run('rescore', tournament.packLedger(...).payload);
+//
+//   node utils/WorkerPool.js --check --participants 5000   # re-score on vs off the main loop
+
+const { Worker } = require('worker_threads');
+const os = require('os');
+const path = require('path');
+const { parseArgs } = require('./cliArgs');
+
+const cpuCount = typeof os.availableParallelism === 'function' ? os.availableParallelism() : os.cpus().length;
+const DEFAULT_SIZE = parseInt(process.env.WORKER_POOL_SIZE, 10) || Math.max(1, Math.min(4, cpuCount - 1));
+
+// ArrayBuffers behind the top-level typed arrays of a message, each listed once
+function transferList(message) {
+  const buffers = new Set();
+  if (message && typeof message === 'object') {
+    Object.values(message).forEach(value => {
+      if (ArrayBuffer.isView(value)) {
+        buffers.add(value.buffer);
+      } else if (value instanceof ArrayBuffer) {
+        buffers.add(value);
+      }
+    });
+  }
+  return Array.from(buffers);
+}
+
+class WorkerPool {
+  constructor(options = {}) {
+    this.size = options.size || DEFAULT_SIZE;
+    this.script = options.script || path.join(__dirname, 'workerTasks.js');
+    this.workers = new Set();
+    this.idle = [];
+    this.queue = []; // jobs waiting for a free worker
+    this.closed = false;
+    this.stats = { completed: 0, failed: 0, restarts: 0, maxQueued: 0 };
+  }
+
+  // Run a task on the next free worker; resolves with the task's result
+  run(task, payload = {}) {
+    if (this.closed) {
+      return Promise.reject(new Error('Worker pool is closed'));
+    }
+    return new Promise((resolve, reject) => {
+      this.queue.push({ task, payload, resolve, reject });
+      this.stats.maxQueued = Math.max(this.stats.maxQueued, this.queue.length);
+      this.dispatch();
+    });
+  }
+
+  // Start every worker now rather than on first use, so thread startup isn't charged to a job
+  warm() {
+    while (!this.closed && this.workers.size < this.size) {
+      this.idle.push(this.spawn());
+    }
+    return this;
+  }
+
+  dispatch() {
+    while (this.queue.length > 0) {
+      if (this.idle.length === 0 && this.workers.size < this.size) {
+        this.idle.push(this.spawn());
+      }
+      const worker = this.idle.pop();
+      if (!worker) {
+        return;
+      }
+      const job = this.queue.shift();
+      worker.job = job;
+      worker.postMessage({ task: job.task, payload: job.payload }, transferList(job.payload));
+    }
+  }
+
+  spawn() {
+    const worker = new Worker(this.script);
+    worker.job = null;
+    worker.unref(); // an idle pool never keeps the process alive
+
+    worker.on('message', ({ result, error }) => {
+      const job = worker.job;
+      worker.job = null;
+      this.idle.push(worker);
+      if (error) {
+        this.stats.failed++;
+        job.reject(new Error(error));
+      } else {
+        this.stats.completed++;
+        job.resolve(result);
+      }
+      this.dispatch();
+    });
+
+    // A crashed worker fails its job and is replaced on the next dispatch
+    worker.on('error', (error) => {
+      this.retire(worker);
+      if (worker.job) {
+        this.stats.failed++;
+        worker.job.reject(error);
+        worker.job = null;
+      }
+    });
+    worker.on('exit', () => {
+      this.retire(worker);
+      if (worker.job) {
+        this.stats.failed++;
+        worker.job.reject(new Error('Worker exited during task'));
+        worker.job = null;
+      }
+    });
+
+    this.workers.add(worker);
+    return worker;
+  }
+
+  retire(worker) {
+    if (!this.workers.delete(worker)) {
+      return;
+    }
+    this.idle = this.idle.filter(w => w !== worker);
+    if (!this.closed) {
+      this.stats.restarts++;
+      this.dispatch();
+    }
+  }
+
+  async close() {
+    this.closed = true;
+    this.queue.splice(0).forEach(job => job.reject(new Error('Worker pool is closed')));
+    await Promise.all(Array.from(this.workers).map(worker => worker.terminate()));
+  }
+
+  getStats() {
+    return {
+      size: this.size,
+      workers: this.workers.size,
+      busy: this.workers.size - this.idle.length,
+      queued: this.queue.length,
+      ...this.stats
+    };
+  }
+}
+
+// Longest gap between 1ms ticks while fn runs: how long bids and timers would have waited
+async function worstStall(fn) {
+  let worst = 0;
+  let last = performance.now();
+  const ticker = setInterval(() => {
+    const now = performance.now();
+    worst = Math.max(worst, now - last);
+    last = now;
+  }, 1);
+  const started = performance.now();
+  await new Promise(resolve => setImmediate(resolve));
+  last = performance.now();
+  const result = await fn();
+  const elapsed = performance.now() - started;
+  await new Promise(resolve => setTimeout(resolve, 2));
+  clearInterval(ticker);
+  return { result, elapsedMs: Math.round(elapsed), worstStallMs: Math.round(worst * 10) / 10 };
+}
+
+// Re-score the same synthetic tournament inline and through the pool, and compare
+async function runCheck(participantCount, matches) {
+  const fs = require('fs');
+  const Tournament = require('../models/Tournament');
+  const SyntheticMatchFeed = require('./SyntheticMatchFeed');
+  const players = JSON.parse(fs.readFileSync(path.join(__dirname, '../../data/players.json'), 'utf8'));
+
+  const build = () => {
+    const tournament = new Tournament('check-admin', { name: 'Worker check', maxParticipants: participantCount });
+    for (let i = 0; i < participantCount; i++) {
+      const participant = tournament.addParticipant(`check-user-${i}`, { username: `Check ${i}` });
+      for (let k = 0; k < 11; k++) {
+        participant.squad.push({ ...players[(i * 7 + k * 13) % players.length] });
+      }
+    }
+    // Match-level lines through the live path, so squads hold performances as they would in play
+    const feed = new SyntheticMatchFeed(players, { seed: 1, granularity: 'over', matches });
+    const lines = new Map();
+    let event = feed.next();
+    while (event) {
+      event.updates.forEach(update => lines.set(`${event.matchId}:${update.playerId}`, [update.playerId, update.stats, event.matchId]));
+      event = feed.next();
+    }
+    lines.forEach(([playerId, stats, matchId]) => tournament.updatePlayerPerformance(playerId, stats, matchId));
+    return tournament;
+  };
+
+  const inline = build();
+  const offloaded = build();
+  const pool = new WorkerPool().warm();
+
+  const mainLoop = await worstStall(() => {
+    inline.rescore();
+    return JSON.stringify(inline.leaderboard);
+  });
+  const worker = await worstStall(() => offloaded.rescoreInWorker(pool, undefined, { leaderboardJson: true }));
+  await pool.close();
+  const { leaderboardJson } = worker.result;
+  const workerJson = Buffer.from(leaderboardJson.buffer, leaderboardJson.byteOffset, leaderboardJson.byteLength).toString();
+
+  return {
+    participants: participantCount,
+    ledgerPlayers: inline.ledger.size,
+    leaderboardBytes: mainLoop.result.length,
+    mainLoop: { elapsedMs: mainLoop.elapsedMs, worstStallMs: mainLoop.worstStallMs },
+    worker: { elapsedMs: worker.elapsedMs, worstStallMs: worker.worstStallMs },
+    identical: workerJson === mainLoop.result && JSON.stringify(offloaded.leaderboard) === mainLoop.result
+  };
+}
+
+if (require.main === module) {
+  const args = parseArgs(process.argv.slice(2));
+  if (!args.check) {
+    console.log('Usage: node utils/WorkerPool.js --check [--participants 5000] [--matches 20]');
+    process.exit(1);
+  }
+  runCheck(parseInt(args.participants, 10) || 5000, parseInt(args.matches, 10) || 20).then(result => {
+    console.log(JSON.stringify(result, null, 2));
+    process.exit(result.identical ? 0 : 1);
+  });
+}
+
+module.exports = WorkerPool;
+module.exports.transferList = transferList;
@@ -0,0 +1,21 @@
+// Argument parsing shared by the utils/ command-line tools.
+// `--name value` sets args.name to the string value; a `--name` followed by
+// another flag or nothing is a boolean flag and sets args.name to true.
+function parseArgs(argv) {
+  const args = {};
+  for (let i = 0; i < argv.length; i++) {
+    if (!argv[i].startsWith('--')) {
+      continue;
+    }
+    const next = argv[i + 1];
+    if (next === undefined || next.startsWith('--')) {
+      args[argv[i].substring(2)] = true;
+    } else {
+      args[argv[i].substring(2)] = next;
+      i++;
+    }
+  }
+  return args;
+}
+
+module.exports = { parseArgs };
@@ -0,0 +1,107 @@
+// Tasks run inside WorkerPool threads. Each takes a payload of plain values and
+// typed arrays and returns the same; nothing here touches live server state.
+
+const { parentPort } = require('worker_threads');
+
+// Full re-score of a packed tournament ledger (see Tournament.rescoreInWorker).
+//
+// Payload:
+//   weights       Float64Array(statCount)            points per unit of each stat column
+//   lineStats     Float64Array(statCount * lineCount) column-major stat values, NaN where a line lacks the stat
+//   linePlayer    Int32Array(lineCount)              player index of each stat line
+//   playerCount   players indexed; the first ledgerPlayers have stat lines
+//   squadOffsets  Int32Array(userCount + 1)          each user's range in squadPlayers
+//   squadPlayers  Int32Array                         player indexes, in squad order
+//   seq           Float64Array(userCount)            join order, the leaderboard tie-break
+//   rowHeads, squadHeads (optional)                  '\0'-joined JSON fragments for each user
+//                                                    ({userId, username}) and player ({name});
+//                                                    when present the full leaderboard is rendered
+//
+// Result: per-player totals, presence flags, points and match counts, per-user
+// points, users in rank order, and leaderboardJson (UTF-8) when requested.
+function rescore(payload) {
+  const { weights, lineStats, linePlayer, playerCount, squadOffsets, squadPlayers, seq } = payload;
+  const statCount = weights.length;
+  const lineCount = linePlayer.length;
+  const userCount = seq.length;
+
+  const playerTotals = new Float64Array(playerCount * statCount);
+  const playerPresent = new Uint8Array(playerCount * statCount);
+  const playerPoints = new Float64Array(playerCount);
+  const playerMatches = new Int32Array(playerCount);
+
+  for (let line = 0; line < lineCount; line++) {
+    const player = linePlayer[line];
+    let points = 0;
+    for (let stat = 0; stat < statCount; stat++) {
+      const value = lineStats[stat * lineCount + line];
+      if (value === value) { // not NaN
+        points += value * weights[stat];
+        playerTotals[player * statCount + stat] += value;
+        playerPresent[player * statCount + stat] = 1;
+      }
+    }
+    playerPoints[player] += points;
+    playerMatches[player]++;
+  }
+
+  const userPoints = new Float64Array(userCount);
+  for (let user = 0; user < userCount; user++) {
+    let points = 0;
+    for (let k = squadOffsets[user]; k < squadOffsets[user + 1]; k++) {
+      points += playerPoints[squadPlayers[k]];
+    }
+    userPoints[user] = points;
+  }
+
+  const order = new Int32Array(userCount);
+  for (let user = 0; user < userCount; user++) {
+    order[user] = user;
+  }
+  order.sort((a, b) => (userPoints[b] - userPoints[a]) || (seq[a] - seq[b]));
+
+  const result = { playerTotals, playerPresent, playerPoints, playerMatches, userPoints, order };
+  if (payload.rowHeads !== undefined) {
+    result.leaderboardJson = renderLeaderboard(payload, userPoints, playerPoints, order);
+  }
+  return result;
+}
+
+// Same rows as Tournament.getLeaderboardRows(0, size, true), as one JSON array
+function renderLeaderboard({ rowHeads, squadHeads, squadOffsets, squadPlayers }, userPoints, playerPoints, order) {
+  const heads = rowHeads.split('\0');
+  const names = squadHeads.split('\0');
+  const squadEntries = names.map(name => (name ? `{${name},"points":` : '{"points":'));
+
+  const rows = new Array(order.length);
+  for (let rank = 0; rank < order.length; rank++) {
+    const user = order[rank];
+    const squad = [];
+    for (let k = squadOffsets[user]; k < squadOffsets[user + 1]; k++) {
+      const player = squadPlayers[k];
+      squad.push(squadEntries[player] + JSON.stringify(playerPoints[player]) + '}');
+    }
+    rows[rank] = `{"rank":${rank + 1},${heads[user]},"points":${JSON.stringify(userPoints[user])},"squad":[${squad.join(',')}]}`;
+  }
+  return new TextEncoder().encode(`[${rows.join(',')}]`);
+}
+
+const tasks = { rescore };
+
+// Worker entry point: one message per job, typed arrays in the result transferred back
+if (parentPort) {
+  const { transferList } = require('./WorkerPool');
+  parentPort.on('message', ({ task, payload }) => {
+    try {
+      if (!tasks[task]) {
+        throw new Error(`Unknown worker task ${task}`);
+      }
+      const result = tasks[task](payload);
+      parentPort.postMessage({ result }, transferList(result));
+    } catch (error) {
+      parentPort.postMessage({ error: error.message });
+    }
+  });
+}
+
+module.exports = tasks;
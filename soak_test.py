@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Sport X Soak Testing - Leak Detection
+Cycles room auctions (create, bid, complete) and tournament flows against a
+local server for a long period, samples server memory, timers and object
+counts from /api/stats/runtime, and fails when per-cycle growth stays above
+the configured thresholds.
+
+Start the server with `node --expose-gc server.js` so every sample is taken
+after a full collection; without it heap readings are much noisier.
+"""
+
+import argparse
+import queue
+import sys
+import time
+import uuid
+from datetime import datetime
+
+import requests
+
+try:
+    import socketio  # python-socketio[client], needed for room cycles
+except ImportError:
+    socketio = None
+
+
+def fit_slope(points):
+    """Least-squares slope of (x, y) points; 0.0 when there are fewer than two"""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+class RoomClient:
+    """Minimal Socket.io client that queues the events a room cycle waits on"""
+
+    EVENTS = ['room-created', 'team-added', 'auction-started', 'room-event', 'error']
+
+    def __init__(self, base_url):
+        self.events = queue.Queue()
+        self.sio = socketio.Client(reconnection=False)
+        for event in self.EVENTS:
+            self.sio.on(event, lambda data, event=event: self.events.put((event, data)))
+        self.sio.connect(base_url, socketio_path='/api/socket.io/', transports=['websocket'])
+
+    def wait_for(self, event, timeout, match=None):
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"no '{event}' within {timeout}s")
+            name, data = self.events.get(timeout=remaining)
+            if name == 'error':
+                raise RuntimeError(f"server error: {data.get('message')}")
+            if name == event and (match is None or match(data)):
+                return data
+
+    def close(self):
+        self.sio.disconnect()
+
+
+class SoakTester:
+    def __init__(self, base_url="http://localhost:5000", bid_timeout=1, players_per_room=2):
+        self.base_url = base_url
+        self.bid_timeout = bid_timeout
+        self.players_per_room = players_per_room
+        self.session = requests.Session()
+        self.samples = []  # (cycle, stats)
+        self.cycles = 0
+        self.failures = 0
+        self.player_ids = []
+
+    def get_runtime_stats(self):
+        response = self.session.get(f"{self.base_url}/api/stats/runtime", params={'gc': '1'}, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def run_room_cycle(self):
+        """Create a small room, add two teams, bid once and wait for the auction to complete"""
+        client = RoomClient(self.base_url)
+        try:
+            user_id = f"soak-{uuid.uuid4().hex[:8]}"
+            client.sio.emit('register', user_id)
+            client.sio.emit('create-room', {'settings': {
+                'name': 'Soak Room',
+                'mode': 'standard',
+                'budget': 100000000,
+                'bidTimeout': self.bid_timeout,
+                'playerIds': self.player_ids[:self.players_per_room]
+            }})
+            room_id = client.wait_for('room-created', 10)['roomId']
+
+            for name in ('Soak A', 'Soak B'):
+                client.sio.emit('add-team', {'roomId': room_id, 'teamData': {'name': name}})
+                room = client.wait_for('team-added', 10)['room']
+
+            client.sio.emit('start-auction', {'roomId': room_id})
+            room = client.wait_for('auction-started', 10)['room']
+            auction = room['currentAuction']
+            client.sio.emit('place-bid', {
+                'roomId': room_id,
+                'teamId': room['teams'][0]['id'],
+                'amount': auction['currentBid'] + 100000
+            })
+
+            # Each lot takes the bid window plus the 2s gap before the next one
+            timeout = self.players_per_room * (self.bid_timeout + 2) + 10
+            client.wait_for('room-event', timeout, match=lambda e: e['roomId'] == room_id and e['type'] == 'auction-completed')
+        finally:
+            client.close()
+
+    def run_tournament_cycle(self):
+        """Create a tournament, join two users, record a performance and read the leaderboard"""
+        admin_id = f"soak-admin-{uuid.uuid4().hex[:8]}"
+        response = self.session.post(f"{self.base_url}/api/tournaments", json={
+            'adminId': admin_id,
+            'settings': {'name': 'Soak Tournament', 'realTournament': 'ipl-2024', 'maxParticipants': 4}
+        }, timeout=10)
+        response.raise_for_status()
+        tournament_id = response.json()['tournament']['id']
+
+        for index in range(2):
+            self.session.post(f"{self.base_url}/api/tournaments/{tournament_id}/join", json={
+                'userId': f"soak-user-{index}-{uuid.uuid4().hex[:6]}",
+                'userData': {'username': f"Soak {index}"}
+            }, timeout=10).raise_for_status()
+
+        if self.player_ids:
+            self.session.post(f"{self.base_url}/api/tournaments/{tournament_id}/performance", json={
+                'adminId': admin_id,
+                'playerId': self.player_ids[0],
+                'performance': {'runs': 42, 'wickets': 1},
+                'matchId': f"soak-{self.cycles}"
+            }, timeout=10).raise_for_status()
+        self.session.get(f"{self.base_url}/api/tournaments/{tournament_id}/leaderboard", timeout=10).raise_for_status()
+
+    def sample(self):
+        stats = self.get_runtime_stats()
+        self.samples.append((self.cycles, stats))
+        memory = stats['memory']
+        print(f"📈 cycle {self.cycles}: heap {memory['heapUsed'] / 1048576:.1f}MB, rss {memory['rss'] / 1048576:.1f}MB, "
+              f"timers {stats['timers']}, rooms {stats['auctionRooms']} ({stats['activeRooms']} active), "
+              f"tournaments {stats['tournaments']}")
+
+    def trend(self, key, warmup=0.2):
+        """Per-cycle slope of a metric over the post-warmup window and over its second half"""
+        window = self.samples[int(len(self.samples) * warmup):]
+        points = [(cycle, key(stats)) for cycle, stats in window]
+        return fit_slope(points), fit_slope(points[len(points) // 2:])
+
+    def run(self, duration_minutes, sample_every, rooms=True, tournaments=True, max_cycles=None):
+        print(f"🧪 Soaking {self.base_url} for {duration_minutes} minutes (rooms: {rooms}, tournaments: {tournaments})")
+        players = self.session.get(f"{self.base_url}/api/players", timeout=30).json()
+        self.player_ids = [player['id'] for player in players]
+
+        self.sample()
+        deadline = time.time() + duration_minutes * 60
+        while time.time() < deadline and (max_cycles is None or self.cycles < max_cycles):
+            try:
+                if rooms:
+                    self.run_room_cycle()
+                if tournaments:
+                    self.run_tournament_cycle()
+            except Exception as e:
+                self.failures += 1
+                print(f"❌ Cycle {self.cycles + 1} failed: {e}")
+            self.cycles += 1
+            if self.cycles % sample_every == 0:
+                self.sample()
+        if self.samples[-1][0] != self.cycles:
+            self.sample()
+
+    def report(self, max_heap_growth, max_timer_growth, max_object_growth, gc_required):
+        """Print growth trends and return True when none stays above its threshold"""
+        print("\n" + "=" * 60)
+        print(f"📊 Soak Summary: {self.cycles} cycles, {self.failures} failed, {len(self.samples)} samples")
+        if len(self.samples) < 4:
+            print("⚠️  Too few samples to fit a trend; run longer or sample more often")
+            return False
+
+        gc_forced = all(stats['gcForced'] for _, stats in self.samples)
+        if not gc_forced:
+            print("⚠️  Server was not started with --expose-gc; heap readings include uncollected garbage")
+
+        checks = [
+            ("Heap used (bytes/cycle)", lambda s: s['memory']['heapUsed'], max_heap_growth, gc_forced or not gc_required),
+            ("RSS (bytes/cycle)", lambda s: s['memory']['rss'], max_heap_growth * 4, True),
+            ("Active timers (per cycle)", lambda s: s['timers'], max_timer_growth, True),
+            ("Auction rooms (per cycle)", lambda s: s['auctionRooms'], max_object_growth, True),
+            ("Tournaments (per cycle)", lambda s: s['tournaments'], max_object_growth, True),
+        ]
+
+        passed = self.failures == 0
+        for name, key, threshold, enforced in checks:
+            overall, recent = self.trend(key)
+            # Growth has to persist through the second half of the run, not just a warm-up ramp
+            growing = overall > threshold and recent > threshold
+            status = "❌" if growing and enforced else ("⚠️ " if growing else "✅")
+            print(f"{status} {name}: {overall:,.2f} overall, {recent:,.2f} recent (limit {threshold:,.2f})")
+            if growing and enforced:
+                passed = False
+
+        print("🎉 No sustained growth detected" if passed else "⚠️  Sustained growth detected")
+        return passed
+
+
+def main():
+    """Main soak execution"""
+    parser = argparse.ArgumentParser(description="Long-running leak detection against a local Sport X server")
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--duration", type=float, default=60, help="minutes to run (default 60)")
+    parser.add_argument("--cycles", type=int, default=None, help="stop after this many cycles")
+    parser.add_argument("--sample-every", type=int, default=10, help="cycles between samples")
+    parser.add_argument("--bid-timeout", type=int, default=1, help="room bid window in seconds")
+    parser.add_argument("--max-heap-growth", type=float, default=16384, help="bytes of heap per cycle")
+    parser.add_argument("--max-timer-growth", type=float, default=0.05, help="active timers per cycle")
+    parser.add_argument("--max-object-growth", type=float, default=0.5,
+                        help="retained rooms/tournaments per cycle (each cycle creates one of each)")
+    parser.add_argument("--no-rooms", action="store_true", help="skip Socket.io room cycles")
+    parser.add_argument("--no-tournaments", action="store_true", help="skip tournament cycles")
+    parser.add_argument("--require-gc", action="store_true", help="fail heap checks without --expose-gc")
+    args = parser.parse_args()
+
+    print(f"🚀 Sport X Soak Testing - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    rooms = not args.no_rooms
+    if rooms and socketio is None:
+        print("⚠️  python-socketio is not installed (pip install 'python-socketio[client]'); skipping room cycles")
+        rooms = False
+
+    tester = SoakTester(args.base_url, bid_timeout=args.bid_timeout)
+    tester.run(args.duration, args.sample_every, rooms=rooms, tournaments=not args.no_tournaments,
+               max_cycles=args.cycles)
+    success = tester.report(args.max_heap_growth, args.max_timer_growth, args.max_object_growth, args.require_gc)
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
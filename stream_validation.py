@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Sport X Streaming Response Validation
+Parses large JSON API responses incrementally and checks every record with
+precompiled validators, so the test harnesses can validate whole catalogs and
+leaderboards with bounded memory
+"""
+
+import codecs
+import json
+import time
+
+READ_CHUNK = 64 * 1024
+# A single record larger than this is treated as a malformed response
+MAX_RECORD_BYTES = 4 * 1024 * 1024
+WHITESPACE = " \t\r\n"
+
+
+class StreamFormatError(ValueError):
+    """Raised when a streamed response is not the JSON shape we expect"""
+
+
+def iter_json_items(chunks, array_key=None, envelope=None):
+    """Yield the items of a streamed JSON array.
+
+    With array_key, the response is an object and the items come from that
+    field; the object's other fields are collected into envelope (a dict).
+    A bare array is still accepted in that case, leaving envelope empty.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    state = "start"
+    buffer = ""
+    chunks = iter(chunks)
+    eof = False
+
+    while state != "done":
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer += text_decoder.decode(b"", final=True)
+        else:
+            buffer += text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+        position = 0
+        while state != "done":
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+
+            if state == "start":
+                if array_key and char == "[":
+                    # Endpoints that fall back to a bare array: stream it as is
+                    array_key = None
+                elif char != ("{" if array_key else "["):
+                    raise StreamFormatError(f"unexpected '{char}' at the start of the response")
+                position += 1
+                state = "key" if array_key else "items"
+                continue
+
+            if state in ("key", "items") and char == ",":
+                position += 1
+                continue
+
+            if state == "key":
+                if char == "}":
+                    state = "done"
+                    break
+                key, end = _decode(decoder, buffer, position, eof)
+                if end is None:
+                    break
+                # Need the ':' and the first character of the value to decide how to read it
+                value_start = end
+                while value_start < len(buffer) and buffer[value_start] in WHITESPACE + ":":
+                    value_start += 1
+                if value_start >= len(buffer):
+                    if eof:
+                        raise StreamFormatError(f"response ended after key '{key}'")
+                    break
+                if key == array_key and buffer[value_start] == "[":
+                    position = value_start + 1
+                    state = "items"
+                    continue
+                value, end = _decode(decoder, buffer, value_start, eof)
+                if end is None:
+                    break
+                if envelope is not None:
+                    envelope[key] = value
+                position = end
+                continue
+
+            # state == "items"
+            if char == "]":
+                position += 1
+                state = "key" if array_key else "done"
+                continue
+            item, end = _decode(decoder, buffer, position, eof)
+            if end is None:
+                break
+            position = end
+            yield item
+
+        # Keep only the unparsed tail so memory stays bounded by the largest record
+        buffer = buffer[position:]
+        if len(buffer) > MAX_RECORD_BYTES:
+            raise StreamFormatError(f"record exceeds {MAX_RECORD_BYTES} bytes or response is malformed")
+        if eof:
+            if state != "done":
+                raise StreamFormatError("response ended before the JSON document was complete")
+            break
+
+
+def _decode(decoder, buffer, position, eof):
+    """Decode one value at position; (None, None) when more input is needed"""
+    try:
+        value, end = decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError as error:
+        if eof:
+            raise StreamFormatError(f"invalid JSON at offset {error.pos}: {error.msg}") from error
+        return None, None
+    # A number at the very end of the buffer may continue in the next chunk
+    if end >= len(buffer) and not eof:
+        return None, None
+    return value, end
+
+
+def compile_validator(required=(), types=None, choices=None, ranges=None):
+    """Build a record validator once; it returns an error string or None.
+
+    types maps field -> type or tuple of types (bool never counts as int),
+    choices maps field -> allowed values, ranges maps field -> (low, high).
+    Optional fields are only checked when present and not null.
+    """
+    required = frozenset(required)
+    type_checks = tuple((field, expected if isinstance(expected, tuple) else (expected,))
+                        for field, expected in (types or {}).items())
+    choice_checks = tuple((field, frozenset(allowed)) for field, allowed in (choices or {}).items())
+    range_checks = tuple((field, low, high) for field, (low, high) in (ranges or {}).items())
+
+    def validate(record):
+        if not isinstance(record, dict):
+            return f"expected an object, got {type(record).__name__}"
+        missing = required - record.keys()
+        if missing:
+            return f"missing fields: {', '.join(sorted(missing))}"
+        for field, expected in type_checks:
+            value = record.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+                return f"'{field}' should be {'/'.join(t.__name__ for t in expected)}, got {type(value).__name__}"
+        for field, allowed in choice_checks:
+            value = record.get(field)
+            if value is not None and value not in allowed:
+                return f"'{field}' has unexpected value {value!r}"
+        for field, low, high in range_checks:
+            value = record.get(field)
+            if value is not None and not low <= value <= high:
+                return f"'{field}' out of range [{low}, {high}]: {value!r}"
+        return None
+
+    return validate
+
+
+CRICKET_ROLES = ['Batsman', 'Bowler', 'All-rounder', 'Wicket-Keeper']
+
+# Same rules as validate_player_data_structure, applied to every record
+PLAYER_VALIDATOR = compile_validator(
+    required=['id', 'name', 'age', 'country', 'role', 'basePrice', 'rating'],
+    types={'id': int, 'name': str, 'age': int, 'country': str, 'rating': int, 'basePrice': int},
+    choices={'role': CRICKET_ROLES},
+    ranges={'rating': (0, 100), 'basePrice': (0, 10 ** 10)}
+)
+
+TOURNAMENT_PLAYER_VALIDATOR = compile_validator(
+    required=['id', 'name', 'role', 'country', 'basePrice', 'rating'],
+    types={'id': int, 'name': str, 'country': str, 'rating': int, 'basePrice': int},
+    choices={'role': CRICKET_ROLES}
+)
+
+LEADERBOARD_VALIDATOR = compile_validator(
+    required=['rank', 'userId', 'points'],
+    types={'rank': int, 'userId': str, 'username': str, 'points': (int, float)},
+    ranges={'rank': (1, 10 ** 9)}
+)
+
+
+class ValidationReport:
+    """Counts, first failure and throughput for one streamed validation"""
+
+    def __init__(self, sample_size=5):
+        self.records = 0
+        self.failures = 0
+        self.first_failure = None  # (index, error, record)
+        self.sample = []           # first few records, for structure checks downstream
+        self.sample_size = sample_size
+        self.envelope = {}         # non-array fields of an object response
+        self.bytes = 0
+        self.elapsed = 0.0
+        self.error = None          # stream-level parse error, if any
+
+    @property
+    def ok(self):
+        return self.error is None and self.failures == 0
+
+    @property
+    def records_per_second(self):
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes / (1024 * 1024) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        text = (f"{self.records} records, {self.failures} invalid, "
+                f"{self.records_per_second:,.0f} records/s ({self.megabytes_per_second:.1f} MB/s)")
+        if self.first_failure:
+            index, error, record = self.first_failure
+            preview = json.dumps(record)[:200]
+            text += f", first failure at #{index}: {error} -> {preview}"
+        if self.error:
+            text += f", stream error: {self.error}"
+        return text
+
+
+def validate_stream(chunks, validator, array_key=None, sample_size=5):
+    """Validate every item of a streamed JSON array against validator"""
+    report = ValidationReport(sample_size)
+    started = time.perf_counter()
+
+    def counted(source):
+        for chunk in source:
+            report.bytes += len(chunk)
+            yield chunk
+
+    try:
+        for index, record in enumerate(iter_json_items(counted(chunks), array_key, report.envelope)):
+            report.records += 1
+            if len(report.sample) < sample_size:
+                report.sample.append(record)
+            error = validator(record)
+            if error:
+                report.failures += 1
+                if report.first_failure is None:
+                    report.first_failure = (index, error, record)
+    except StreamFormatError as error:
+        report.error = str(error)
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def validate_response(response, validator, array_key=None, sample_size=5):
+    """Validate a requests response fetched with stream=True"""
+    return validate_stream(response.iter_content(chunk_size=READ_CHUNK), validator, array_key, sample_size)